@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark the reportlab and fpdf2 contract renderers and check for regressions
+"""
+
+import argparse
+import os
+import sys
+
+from contract_fixtures.bench import (BACKENDS, BASELINE_PASSES, MIN_TIMED_S, NOISE_FLOORS, SIZES, SPECS, TOLERANCES,
+                                     best_of, confirm_regressions, installed_backends, load_results, run_suite,
+                                     save_results)
+from contract_fixtures.profiles import PROFILES
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the contract PDF renderers")
+    parser.add_argument("--spec", action="append", dest="specs", metavar="NAME",
+                        help=f"bundled spec to render (repeatable; default: {', '.join(SPECS)})")
+    parser.add_argument("--size", action="append", dest="sizes", choices=list(SIZES),
+                        help="document size (repeatable; default: all)")
+    parser.add_argument("--backend", action="append", dest="backends", choices=BACKENDS,
+                        help="renderer backend (repeatable; default: all installed)")
+    parser.add_argument("--profile", action="append", dest="profiles", choices=list(PROFILES),
+                        help="output profile to benchmark (repeatable; default: library defaults only)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help=f"timed runs per case, at least (default: 5; fast cases run until they add up to "
+                             f"{MIN_TIMED_S:g}s)")
+    parser.add_argument("--output", default="bench-results.json",
+                        help="results file to write (default: bench-results.json)")
+    parser.add_argument("--baseline", default="bench-baseline.json",
+                        help="baseline to compare against, if it exists (default: bench-baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help=f"store the best of {BASELINE_PASSES} runs as the new baseline instead of comparing")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    backends = installed_backends(args.backends or BACKENDS)
+    for backend in sorted(set(args.backends or BACKENDS) - set(backends)):
+        print(f"⚠️ Skipping {backend}: library not installed")
+    if not backends:
+        print("❌ No renderer backends installed. Please install them with: pip install reportlab fpdf2")
+        sys.exit(1)
+
+    print("Benchmarking contract renderers...")
+    passes = []
+    for number in range(BASELINE_PASSES if args.save_baseline else 1):
+        if args.save_baseline:
+            print(f"\nPass {number + 1} of {BASELINE_PASSES}:")
+        passes.append(run_suite(args.specs or SPECS, args.sizes or list(SIZES), backends, args.repeat,
+                                profiles=args.profiles or [None]))
+    results = best_of(passes)
+    if args.save_baseline or not os.path.exists(args.baseline):
+        save_results(results, args.output)
+        print(f"\n✓ Wrote {args.output}")
+    if args.save_baseline:
+        save_results(results, args.baseline)
+        print(f"✓ Saved baseline {args.baseline}")
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one.")
+        sys.exit(0)
+
+    # Re-runs cases that look slower, so the results written are the confirmed ones
+    regressions = confirm_regressions(results, load_results(args.baseline), args.repeat)
+    save_results(results, args.output)
+    print(f"\n✓ Wrote {args.output}")
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) against {args.baseline} "
+              "(wall times scaled to the baseline machine's speed):")
+        for case, metric, before, after in regressions:
+            print(f"- {case} {metric}: {before} -> {after} (+{(after / before - 1) * 100:.0f}%, allowed "
+                  f"+{TOLERANCES[metric] * 100:.0f}% or +{NOISE_FLOORS[metric]:g})")
+        sys.exit(1)
+    print(f"\n✓ No regressions against {args.baseline}")
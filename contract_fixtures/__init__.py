@@ -0,0 +1,15 @@
+"""
+Shared contract fixture generation for the test PDF scripts.
+
+Contracts are described by declarative specs (see `contract_fixtures/specs`),
+compiled once into a `Document` and rendered by any backend, either to a
+file or straight to memory:
+
+    from contract_fixtures import load_builtin, render_bytes
+    pdf = render_bytes(load_builtin("service-agreement"), backend="fpdf")
+"""
+
+from .spec import Block, Document, builtin_spec_path, builtin_specs, compile_spec, load_builtin, load_document, load_spec
+from .backends import BACKENDS, available_backends, get_backend, select_backend
+from .render import (render, render_buffer, render_bytes, render_docx, render_fpdf, render_html, render_reportlab,
+                     render_scan, render_txt)
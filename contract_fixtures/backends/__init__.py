@@ -0,0 +1,109 @@
+"""
+Renderer backend registry.
+
+Every backend is registered here by name along with the library it needs,
+but its module is only imported the first time it renders. Availability is
+checked with `importlib.util.find_spec`, which locates a library without
+importing it, so picking a backend never pays for the ones not used.
+"""
+
+import importlib
+import importlib.util
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import metadata
+
+from ..profiles import get_profile
+from ..timing import stage
+
+
+def is_path(output):
+    return isinstance(output, (str, os.PathLike))
+
+
+@lru_cache(maxsize=None)
+def _is_installed(import_name):
+    return importlib.util.find_spec(import_name) is not None
+
+
+@dataclass(frozen=True)
+class Backend:
+    name: str
+    module: str                 # module in this package providing render(document, output, profile)
+    requires: str = None        # import name of the third-party library it needs
+    package: str = None         # pip distribution of that library
+    format: str = "pdf"
+    extension: str = ".pdf"
+    content_type: str = "application/pdf"
+    cost: int = 1               # relative render cost, from benchmark-renderers.py
+
+    def is_available(self):
+        return self.requires is None or _is_installed(self.requires)
+
+    def version(self):
+        if self.package is None:
+            return "builtin"
+        try:
+            return metadata.version(self.package)
+        except metadata.PackageNotFoundError:
+            return "missing"
+
+    def load(self):
+        return importlib.import_module(f"{__name__}.{self.module}")
+
+    def render(self, document, output, profile=None, **options):
+        """Render with this backend; `profile` is a Profile or the name of one"""
+        # Backends are imported on first use, so the first document pays for the library's import
+        with stage("import"):
+            module = self.load()
+        with stage("render"):
+            return module.render(document, output, profile=get_profile(profile), **options)
+
+
+BACKENDS = {}
+
+
+def register(backend):
+    BACKENDS[backend.name] = backend
+    return backend
+
+
+register(Backend("reportlab", "reportlab_backend", requires="reportlab", package="reportlab", cost=1))
+register(Backend("fpdf", "fpdf_backend", requires="fpdf", package="fpdf2", cost=3))
+register(Backend("html", "html_backend", format="html", extension=".html", content_type="text/html", cost=0))
+register(Backend("docx", "docx_backend", format="docx", extension=".docx",
+                 content_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document", cost=0))
+register(Backend("txt", "txt_backend", format="txt", extension=".txt", content_type="text/plain", cost=0))
+# Image-only PDFs; far too slow (and textless) to ever be picked by "auto"
+register(Backend("scan", "scan_backend", requires="PIL", package="pillow", cost=20))
+
+
+def get_backend(name):
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown renderer backend '{name}'. Known backends: {', '.join(BACKENDS)}") from None
+
+
+def available_backends(format=None):
+    """Installed backends (optionally of one output format), cheapest first"""
+    backends = [backend for backend in BACKENDS.values()
+                if backend.is_available() and (format is None or backend.format == format)]
+    return sorted(backends, key=lambda backend: backend.cost)
+
+
+def select_backend(name="auto", format="pdf"):
+    """The named backend, or for "auto" the cheapest installed backend for `format`"""
+    if name != "auto":
+        backend = get_backend(name)
+        if not backend.is_available():
+            raise ImportError(f"The {name} backend requires {backend.package}. "
+                              f"Please install it with: pip install {backend.package}")
+        return backend
+    candidates = available_backends(format)
+    if not candidates:
+        packages = " or ".join(backend.package for backend in BACKENDS.values()
+                               if backend.format == format and backend.package)
+        raise ImportError(f"No {format} renderer backend is installed. Please install one with: pip install {packages}")
+    return candidates[0]
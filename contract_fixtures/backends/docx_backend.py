@@ -0,0 +1,185 @@
+"""
+DOCX backend: a minimal WordprocessingML package written with `zipfile`.
+
+The body is streamed into the archive one block at a time, so no third-party
+library is needed and large documents are never held as one XML string.
+Headings, the title and bullets use built-in style names and a bullet
+numbering definition, which is what mammoth maps to h1/h2/ul. Scanned images
+are stored uncompressed under word/media/.
+"""
+
+import zipfile
+from xml.sax.saxutils import escape
+
+from ..images import fit_size, scan_jpeg
+from ..profiles import CREATION_DATE, document_info
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+OFFICE_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+WP_NS = "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+PIC_NS = "http://schemas.openxmlformats.org/drawingml/2006/picture"
+
+# Text area of a letter page with 1" margins, in EMUs
+EMU_PER_INCH = 914400
+TEXT_AREA = (6.5 * EMU_PER_INCH, 9 * EMU_PER_INCH)
+
+CONTENT_TYPES_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Default Extension="jpeg" ContentType="image/jpeg"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>
+<Override PartName="/word/numbering.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml"/>
+<Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>
+</Types>
+"""
+
+PACKAGE_RELS_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="{PKG_REL_NS}">
+<Relationship Id="rId1" Type="{OFFICE_REL}/officeDocument" Target="word/document.xml"/>
+<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" Target="docProps/core.xml"/>
+</Relationships>
+"""
+
+DOCUMENT_RELS_HEAD = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="{PKG_REL_NS}">
+<Relationship Id="rId1" Type="{OFFICE_REL}/styles" Target="styles.xml"/>
+<Relationship Id="rId2" Type="{OFFICE_REL}/numbering" Target="numbering.xml"/>
+"""
+IMAGE_REL = f'<Relationship Id="rIdImage{{number}}" Type="{OFFICE_REL}/image" Target="media/image{{number}}.jpeg"/>\n'
+
+
+STYLES_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:styles xmlns:w="{W_NS}">
+<w:docDefaults><w:rPrDefault><w:rPr><w:rFonts w:ascii="Helvetica" w:hAnsi="Helvetica"/><w:sz w:val="22"/></w:rPr></w:rPrDefault></w:docDefaults>
+<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/><w:pPr><w:spacing w:after="120"/></w:pPr></w:style>
+<w:style w:type="paragraph" w:styleId="Title"><w:name w:val="Title"/><w:basedOn w:val="Normal"/><w:pPr><w:jc w:val="center"/><w:spacing w:after="360"/></w:pPr><w:rPr><w:b/><w:sz w:val="32"/></w:rPr></w:style>
+<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/><w:basedOn w:val="Normal"/><w:pPr><w:keepNext/><w:spacing w:before="240"/></w:pPr><w:rPr><w:b/><w:sz w:val="24"/></w:rPr></w:style>
+<w:style w:type="paragraph" w:styleId="ListBullet"><w:name w:val="List Bullet"/><w:basedOn w:val="Normal"/><w:pPr><w:numPr><w:numId w:val="1"/></w:numPr></w:pPr></w:style>
+</w:styles>
+"""
+
+# Word lists have nine levels, each indented another half inch
+LIST_LEVELS = 9
+BULLET_LEVELS = "".join(f'<w:lvl w:ilvl="{level}"><w:start w:val="1"/><w:numFmt w:val="bullet"/><w:lvlText w:val="•"/>'
+                        f'<w:lvlJc w:val="left"/><w:pPr><w:ind w:left="{720 * (level + 1)}" w:hanging="360"/></w:pPr>'
+                        f'</w:lvl>' for level in range(LIST_LEVELS))
+NUMBERING_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:numbering xmlns:w="{W_NS}">
+<w:abstractNum w:abstractNumId="0">{BULLET_LEVELS}</w:abstractNum>
+<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>
+</w:numbering>
+"""
+
+CORE_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" xmlns:dc="http://purl.org/dc/elements/1.1/">
+{properties}</cp:coreProperties>
+"""
+CORE_PROPERTIES = {"title": "dc:title", "author": "dc:creator", "subject": "dc:subject", "keywords": "cp:keywords"}
+
+DOCUMENT_HEAD = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NS}" xmlns:r="{R_NS}" xmlns:wp="{WP_NS}" xmlns:a="{A_NS}" xmlns:pic="{PIC_NS}"><w:body>
+"""
+DOCUMENT_TAIL = """<w:sectPr><w:pgSz w:w="12240" w:h="15840"/><w:pgMar w:top="1440" w:right="1440" w:bottom="1440" w:left="1440"/></w:sectPr>
+</w:body></w:document>
+"""
+
+
+def paragraph(text, style=None, level=0):
+    # ListBullet paragraphs are at the list's first level unless they say otherwise
+    numbering = ""
+    if level:
+        numbering = f'<w:numPr><w:ilvl w:val="{min(level, LIST_LEVELS - 1)}"/><w:numId w:val="1"/></w:numPr>'
+    style_xml = f'<w:pPr><w:pStyle w:val="{style}"/>{numbering}</w:pPr>' if style else ""
+    run = f'<w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r>' if text else ""
+    return f"<w:p>{style_xml}{run}</w:p>\n"
+
+
+def table(rows, shares=None, header=False):
+    """A table of `rows`, its columns `shares` of the text width (even by default), the first row a header"""
+    widths = [int(9360 * share) for share in shares or [1 / len(rows[0])] * len(rows[0])]
+    cells = "".join(f'<w:gridCol w:w="{width}"/>' for width in widths)
+    parts = [f'<w:tbl><w:tblPr><w:tblW w:w="0" w:type="auto"/></w:tblPr><w:tblGrid>{cells}</w:tblGrid>']
+    for number, row in enumerate(rows):
+        # A header row repeats at the top of every page
+        parts.append("<w:tr><w:trPr><w:tblHeader/></w:trPr>" if header and number == 0 else "<w:tr>")
+        for cell, width in zip(row, widths):
+            parts.append(f'<w:tc><w:tcPr><w:tcW w:w="{width}" w:type="dxa"/></w:tcPr>{paragraph(cell)}</w:tc>')
+        parts.append("</w:tr>")
+    parts.append("</w:tbl>\n")
+    return "".join(parts)
+
+
+def image(number, width, height):
+    cx, cy = (int(size) for size in fit_size(width, height, *TEXT_AREA))
+    return (f'<w:p><w:r><w:drawing><wp:inline><wp:extent cx="{cx}" cy="{cy}"/>'
+            f'<wp:docPr id="{number}" name="Scan {number}"/><a:graphic>'
+            f'<a:graphicData uri="{PIC_NS}"><pic:pic><pic:nvPicPr><pic:cNvPr id="{number}" name="image{number}.jpeg"/>'
+            f'<pic:cNvPicPr/></pic:nvPicPr><pic:blipFill><a:blip r:embed="rIdImage{number}"/>'
+            f'<a:stretch><a:fillRect/></a:stretch></pic:blipFill><pic:spPr><a:xfrm><a:off x="0" y="0"/>'
+            f'<a:ext cx="{cx}" cy="{cy}"/></a:xfrm><a:prstGeom prst="rect"><a:avLst/></a:prstGeom></pic:spPr>'
+            f'</pic:pic></a:graphicData></a:graphic></wp:inline></w:drawing></w:r></w:p>\n')
+
+
+def block_xml(block):
+    if block.kind == "title":
+        return paragraph(block.text, "Title")
+    if block.kind == "heading":
+        return paragraph(block.text, "Heading1")
+    if block.kind == "bullet":
+        return paragraph(block.text, "ListBullet", block.level)
+    if block.kind == "space":
+        return ""
+    if block.kind == "signature":
+        return table(block.text)
+    if block.kind == "table":
+        return table(block.text, block.column_shares(), header=True)
+    return paragraph(block.text)
+
+
+def core_xml(document, profile):
+    info = {"title": document.title} if profile is None else document_info(document, profile.metadata)
+    properties = "".join(f"<{CORE_PROPERTIES[key]}>{escape(value)}</{CORE_PROPERTIES[key]}>\n"
+                         for key, value in info.items() if key in CORE_PROPERTIES)
+    return CORE_XML.format(properties=properties)
+
+
+def member(name, compression):
+    """An archive member stamped with CREATION_DATE rather than the time of the render"""
+    info = zipfile.ZipInfo(name, date_time=CREATION_DATE.timetuple()[:6])
+    info.compress_type = compression
+    return info
+
+
+def render(document, output, profile=None):
+    """Render a document to DOCX, streaming the body into the zip package"""
+    compression = zipfile.ZIP_STORED if profile is not None and not profile.compress else zipfile.ZIP_DEFLATED
+    # ZipFile accepts a filename or a binary file object, and works on unseekable streams too
+    with zipfile.ZipFile(output, "w", compression) as package:
+        package.writestr(member("[Content_Types].xml", compression), CONTENT_TYPES_XML)
+        package.writestr(member("_rels/.rels", compression), PACKAGE_RELS_XML)
+        package.writestr(member("docProps/core.xml", compression), core_xml(document, profile))
+        package.writestr(member("word/styles.xml", compression), STYLES_XML)
+        package.writestr(member("word/numbering.xml", compression), NUMBERING_XML)
+        images = []
+        with package.open(member("word/document.xml", compression), "w") as body:
+            body.write(DOCUMENT_HEAD.encode("utf-8"))
+            for block in document.blocks:
+                if block.kind == "image":
+                    images.append(block.text)
+                    body.write(image(len(images), *block.text[:2]).encode("utf-8"))
+                else:
+                    body.write(block_xml(block).encode("utf-8"))
+            body.write(DOCUMENT_TAIL.encode("utf-8"))
+        # Only one archive member can be open for writing, so media follows the body
+        for number, (width, height, seed) in enumerate(images, 1):
+            package.writestr(member(f"word/media/image{number}.jpeg", zipfile.ZIP_STORED),
+                             scan_jpeg(width, height, seed))
+        rels = "".join(IMAGE_REL.format(number=number) for number in range(1, len(images) + 1))
+        package.writestr(member("word/_rels/document.xml.rels", compression),
+                         f"{DOCUMENT_RELS_HEAD}{rels}</Relationships>\n")
+    return output
@@ -0,0 +1,101 @@
+"""
+fpdf2 backend: lines written directly with cell/multi_cell.
+"""
+
+import io
+
+from fpdf import FPDF
+from fpdf.enums import XPos, YPos
+
+from . import is_path
+from ..images import fit_size, scan_jpeg
+from ..profiles import CREATION_DATE, document_info, truetype_fonts, xmp_metadata
+from ..timing import stage
+
+# fpdf2's core fonts are latin-1 only, so "•" cannot be encoded there
+FPDF_BULLET = "-"
+BULLET_INDENT = 6   # mm per bullet level
+
+INFO_SETTERS = {"title": "set_title", "author": "set_author", "creator": "set_creator",
+                "subject": "set_subject", "keywords": "set_keywords"}
+
+
+def apply_profile(pdf, document, profile):
+    """Set compression, fonts and metadata; returns (font family, bullet)"""
+    pdf.set_compression(profile.compress)
+    info = document_info(document, profile.metadata)
+    for key, value in info.items():
+        getattr(pdf, INFO_SETTERS[key])(value)
+    if profile.metadata == "full":
+        pdf.set_xmp_metadata(xmp_metadata(info))  # fpdf2 adds the <?xpacket?> wrapper
+    if not profile.embed_fonts:
+        return 'helvetica', FPDF_BULLET
+    regular, bold = truetype_fonts()
+    pdf.add_font("embedded", "", regular)
+    pdf.add_font("embedded", "B", bold)
+    return "embedded", "•"
+
+
+def render(document, output, profile=None):
+    """Render a document to PDF with fpdf2"""
+    with stage("layout"):
+        pdf = layout(document, profile)
+    with stage("output"):
+        if is_path(output):
+            pdf.output(output)
+        else:
+            output.write(pdf.output())
+    return output
+
+
+def layout(document, profile=None):
+    """An FPDF with the document's pages laid out, ready for output()"""
+    pdf = FPDF()
+    pdf.set_creation_date(CREATION_DATE)
+    if profile is None:
+        pdf.set_title(document.title)
+        font, bullet = 'helvetica', FPDF_BULLET
+    else:
+        font, bullet = apply_profile(pdf, document, profile)
+    pdf.add_page()
+    next_line = {"new_x": XPos.LMARGIN, "new_y": YPos.NEXT}
+
+    for block in document.blocks:
+        if block.kind == "title":
+            pdf.set_font(font, 'B', 16)
+            pdf.cell(0, 10, block.text, align='C', **next_line)
+            pdf.ln(10)
+            pdf.set_font(font, '', 11)
+        elif block.kind == "heading":
+            pdf.set_font(font, 'B', 12)
+            pdf.multi_cell(0, 8, block.text, **next_line)
+            pdf.ln(2)
+            pdf.set_font(font, '', 11)
+        elif block.kind == "bullet":
+            pdf.cell(10 + BULLET_INDENT * block.level, 6, '')  # Indent
+            pdf.multi_cell(0, 6, f"{bullet} {block.text}", **next_line)
+        elif block.kind == "space":
+            pdf.ln(4)
+        elif block.kind == "signature":
+            width = pdf.epw / len(block.text[0])
+            for row in block.text:
+                for cell in row:
+                    pdf.cell(width, 6, cell)
+                pdf.ln(6)
+        elif block.kind == "table":
+            widths = [pdf.epw * share for share in block.column_shares()]
+            for number, row in enumerate(block.text):
+                pdf.set_font(font, 'B' if number == 0 else '', 8)
+                for cell, width in zip(row, widths):
+                    pdf.cell(width, 5, cell)
+                pdf.ln(5)
+            pdf.set_font(font, '', 11)
+            pdf.ln(2)
+        elif block.kind == "image":
+            width, height, seed = block.text
+            w, h = fit_size(width, height, pdf.epw, pdf.eph - 1)
+            pdf.image(io.BytesIO(scan_jpeg(width, height, seed)), w=w, h=h)
+        else:
+            pdf.multi_cell(0, 6, block.text, **next_line)
+            pdf.ln(1)
+    return pdf
@@ -0,0 +1,92 @@
+"""
+HTML backend: a standalone page, needing no third-party library.
+"""
+
+import base64
+import html
+
+from . import is_path
+from ..images import scan_jpeg
+
+
+HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <title>{title}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }}
+        h1 {{ text-align: center; color: #333; }}
+        h2 {{ color: #666; margin-top: 30px; }}
+        .signature {{ margin-top: 50px; }}
+        .signature td {{ padding-right: 80px; }}
+        .grid {{ border-collapse: collapse; font-size: 0.85em; }}
+        .grid th, .grid td {{ padding: 2px 12px 2px 0; text-align: left; }}
+        .grid th {{ border-bottom: 1px solid #333; }}
+    </style>
+</head>
+<body>
+"""
+
+
+def render(document, output, profile=None):
+    """Render a document to a standalone HTML page (output profiles don't apply)"""
+    parts = [HTML_HEAD.format(title=html.escape(document.title))]
+    # One entry per open <ul>: whether its last <li> is still open, holding a nested list
+    lists = []
+
+    def close_lists(depth):
+        while len(lists) > depth:
+            if lists.pop():
+                parts.append(f"{'    ' * (2 * len(lists) + 2)}</li>\n")
+            parts.append(f"{'    ' * (2 * len(lists) + 1)}</ul>\n")
+
+    blocks = document.blocks
+    for position, block in enumerate(blocks):
+        depth = block.level + 1 if block.kind == "bullet" else 0
+        close_lists(depth)
+        if block.kind == "title":
+            parts.append(f"    <h1>{html.escape(block.text)}</h1>\n")
+        elif block.kind == "heading":
+            parts.append(f"    <h2>{html.escape(block.text)}</h2>\n")
+        elif block.kind == "bullet":
+            if len(lists) == depth and lists[-1]:
+                parts.append(f"{'    ' * (2 * depth)}</li>\n")
+                lists[-1] = False
+            while len(lists) < depth:
+                parts.append(f"{'    ' * (2 * len(lists) + 1)}<ul>\n")
+                lists.append(False)
+            following = blocks[position + 1] if position + 1 < len(blocks) else None
+            if following is not None and following.kind == "bullet" and following.level > block.level:
+                parts.append(f"{'    ' * (2 * depth)}<li>{html.escape(block.text)}\n")
+                lists[-1] = True
+            else:
+                parts.append(f"{'    ' * (2 * depth)}<li>{html.escape(block.text)}</li>\n")
+        elif block.kind == "signature":
+            parts.append('    <table class="signature">\n')
+            for row in block.text:
+                cells = "".join(f"<td>{html.escape(cell)}</td>" for cell in row)
+                parts.append(f"        <tr>{cells}</tr>\n")
+            parts.append("    </table>\n")
+        elif block.kind == "table":
+            parts.append('    <table class="grid">\n')
+            for number, row in enumerate(block.text):
+                tag = "th" if number == 0 else "td"
+                cells = "".join(f"<{tag}>{html.escape(cell)}</{tag}>" for cell in row)
+                parts.append(f"        <tr>{cells}</tr>\n")
+            parts.append("    </table>\n")
+        elif block.kind == "image":
+            width, height, seed = block.text
+            data = base64.b64encode(scan_jpeg(width, height, seed)).decode("ascii")
+            parts.append(f'    <p><img src="data:image/jpeg;base64,{data}" style="max-width: 100%"></p>\n')
+        elif block.kind == "paragraph":
+            parts.append(f"    <p>{html.escape(block.text)}</p>\n")
+    close_lists(0)
+    parts.append("</body>\n</html>\n")
+
+    data = "".join(parts).encode("utf-8")
+    if is_path(output):
+        with open(output, "wb") as f:
+            f.write(data)
+    else:
+        output.write(data)
+    return output
@@ -0,0 +1,173 @@
+"""
+reportlab backend: platypus flowables laid out by SimpleDocTemplate.
+"""
+
+import copy
+import io
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.pdfdoc import PDFDictionary, PDFName, PDFStream
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Image, Paragraph, SimpleDocTemplate, Spacer, Table
+
+from ..flowcache import flowable_cache
+from ..images import fit_size, scan_jpeg
+from ..profiles import document_info, truetype_fonts, xmp_packet
+from ..timing import stage
+
+# SimpleDocTemplate's frame on a letter page, less its padding
+FRAME_SIZE = (letter[0] - 2 * 72 - 12, letter[1] - 2 * 72 - 24)
+BULLET_INDENT = 18  # points per bullet level
+
+
+@lru_cache(maxsize=None)
+def reportlab_styles(font=None, bold_font=None):
+    """Paragraph styles shared by every reportlab render in this process (per font)"""
+    styles = getSampleStyleSheet()
+    result = {
+        "title": ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=16,
+            spaceAfter=30,
+            alignment=1  # Center alignment
+        ),
+        "heading": ParagraphStyle('ClauseHeading', parent=styles['Normal'], fontName='Helvetica-Bold'),
+        "normal": styles['Normal'],
+    }
+    if font is not None:
+        result = {
+            "title": ParagraphStyle('CustomTitleEmbedded', parent=result["title"], fontName=bold_font),
+            "heading": ParagraphStyle('ClauseHeadingEmbedded', parent=result["heading"], fontName=bold_font),
+            "normal": ParagraphStyle('NormalEmbedded', parent=result["normal"], fontName=font),
+        }
+    return result
+
+
+@lru_cache(maxsize=None)
+def indented(style, level):
+    """`style` indented for a bullet `level` deep"""
+    return ParagraphStyle(f"{style.name}Level{level}", parent=style, leftIndent=BULLET_INDENT * level)
+
+
+def grid_table(block, font=None, bold_font=None):
+    """A Table for a table block: a bold header repeated on every page, column widths from the cells"""
+    widths = [FRAME_SIZE[0] * share for share in block.column_shares()]
+    table = Table([list(row) for row in block.text], colWidths=widths, repeatRows=1, hAlign="LEFT")
+    table.setStyle([("FONTNAME", (0, 0), (-1, 0), bold_font or "Helvetica-Bold"),
+                    *([("FONTNAME", (0, 1), (-1, -1), font)] if font is not None else []),
+                    ("FONTSIZE", (0, 0), (-1, -1), 8),
+                    ("LINEBELOW", (0, 0), (-1, 0), 0.5, colors.black)])
+    return table
+
+
+@lru_cache(maxsize=None)
+def embedded_fonts():
+    """Register the TrueType family used by embedding profiles; returns (regular, bold) font names"""
+    regular, bold = truetype_fonts()
+    pdfmetrics.registerFont(TTFont("Embedded", regular))
+    pdfmetrics.registerFont(TTFont("Embedded-Bold", bold))
+    pdfmetrics.registerFontFamily("Embedded", normal="Embedded", bold="Embedded-Bold")
+    return "Embedded", "Embedded-Bold"
+
+
+class WrappedParagraph(Paragraph):
+    """A Paragraph that keeps its line breaks while it is wrapped at the same width"""
+
+    def wrap(self, availWidth, availHeight):
+        # Line breaking doesn't depend on the height; split() drops blPara when it has to redo it
+        if getattr(self, "_wrapped_width", None) == availWidth and hasattr(self, "blPara"):
+            return self.width, self.height
+        size = super().wrap(availWidth, availHeight)
+        self._wrapped_width = availWidth
+        return size
+
+
+def paragraph(text, style, width=FRAME_SIZE[0]):
+    """A parsed Paragraph, already wrapped at `width`, from the flowable cache"""
+    def build():
+        flowable = WrappedParagraph(text, style)
+        flowable.wrap(width, FRAME_SIZE[1])
+        return flowable
+    # A shallow copy shares the parsed fragments and line breaks, but not the
+    # attributes layout sets on a flowable while placing it (_frame, _postponed)
+    return copy.copy(flowable_cache.get((text, style.name, width), build))
+
+
+def reportlab_flowables(blocks, fonts=(None, None)):
+    """Yield reportlab flowables for a sequence of blocks, one block at a time"""
+    styles = reportlab_styles(*fonts)
+    for block in blocks:
+        if block.kind == "title":
+            yield paragraph(escape(block.text), styles["title"])
+            yield Spacer(1, 20)
+        elif block.kind == "space":
+            yield Spacer(1, 12)
+        elif block.kind == "signature":
+            # One paragraph per row, the parties side by side, as the original fixtures were laid out
+            for line in block.lines():
+                yield paragraph(escape(line), styles["normal"])
+                yield Spacer(1, 6)
+        elif block.kind == "table":
+            yield grid_table(block, *fonts)
+            yield Spacer(1, 6)
+        elif block.kind == "image":
+            width, height, seed = block.text
+            yield Image(io.BytesIO(scan_jpeg(width, height, seed)), *fit_size(width, height, *FRAME_SIZE))
+        else:
+            if block.kind == "heading":
+                yield paragraph(escape(block.text), styles["heading"])
+            elif block.kind == "bullet":
+                style = indented(styles["normal"], block.level) if block.level else styles["normal"]
+                yield paragraph(f"• {escape(block.text)}", style)
+            else:
+                yield paragraph(escape(block.text), styles["normal"])
+            yield Spacer(1, 6)
+
+
+def reportlab_story(document, fonts=(None, None)):
+    """Build the full list of reportlab flowables for a document"""
+    with stage("paragraphs"):
+        return list(reportlab_flowables(document.blocks, fonts))
+
+
+class TimedCanvas(Canvas):
+    """A Canvas whose save(), the PDF serialization at the end of doc.build, is its own stage"""
+
+    def save(self):
+        with stage("output"):
+            super().save()
+
+
+def add_xmp(canvas, info):
+    stream = PDFStream(PDFDictionary({"Type": PDFName("Metadata"), "Subtype": PDFName("XML")}),
+                       xmp_packet(info).encode("utf-8"), filters=[])
+    canvas.setCatalogEntry("Metadata", canvas._doc.Reference(stream))
+
+
+def render(document, output, profile=None):
+    """Render a document to PDF with reportlab"""
+    if profile is None:
+        doc = SimpleDocTemplate(output, pagesize=letter, title=document.title, invariant=1)
+        story = reportlab_story(document)
+        with stage("layout"):
+            doc.build(story, canvasmaker=TimedCanvas)
+        return output
+
+    info = document_info(document, profile.metadata)
+    doc = SimpleDocTemplate(output, pagesize=letter, pageCompression=int(profile.compress),
+                            invariant=1, **info)
+    fonts = embedded_fonts() if profile.embed_fonts else (None, None)
+    story = reportlab_story(document, fonts)
+    with stage("layout"):
+        if profile.metadata == "full":
+            doc.build(story, onFirstPage=lambda canvas, doc: add_xmp(canvas, info), canvasmaker=TimedCanvas)
+        else:
+            doc.build(story, canvasmaker=TimedCanvas)
+    return output
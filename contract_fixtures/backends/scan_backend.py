@@ -0,0 +1,205 @@
+"""
+scan backend: contracts rasterized into image-only PDFs, like scanned uploads.
+
+Each page is drawn with Pillow at the scan's DPI, optionally speckled and
+skewed like a sheet that went through a document feeder, and stored as one
+full-page grayscale JPEG. The PDF has no fonts and no text layer, so text
+extraction comes back empty. Pages are written as soon as they are drawn,
+so memory stays flat however long the contract is.
+"""
+
+import io
+import random
+from functools import lru_cache
+
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+
+from . import is_path
+from ..images import SCAN_QUALITY, ScanSettings, fit_size, scan_jpeg
+from ..profiles import document_info, truetype_fonts
+
+PAGE = (612, 792)           # US letter, in points
+MARGIN = 72
+LEADING = 12
+FONT_POINTS = {"title": 16, "heading": 10, "normal": 10}
+SIGNATURE_COLUMN = 234
+SIGNATURE_ROW = 18
+BULLET_INDENT = 18  # points per bullet level
+INFO_KEYS = {"title": "Title", "author": "Author", "creator": "Creator", "subject": "Subject",
+             "keywords": "Keywords"}
+
+
+@lru_cache(maxsize=8)
+def scan_fonts(dpi):
+    """Pillow fonts for each text style, sized for `dpi`"""
+    sizes = {style: round(points * dpi / 72) for style, points in FONT_POINTS.items()}
+    try:
+        regular, bold = truetype_fonts()
+    except ImportError:
+        return {style: ImageFont.load_default(size) for style, size in sizes.items()}
+    return {style: ImageFont.truetype(bold if style != "normal" else regular, size) for style, size in sizes.items()}
+
+
+def _wrap(text, font, width):
+    lines, line = [], ""
+    for word in text.split():
+        candidate = f"{line} {word}" if line else word
+        if line and font.getlength(candidate) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    return lines + [line] if line else lines
+
+
+def _items(document, dpi):
+    """Yield (kind, height, payload) layout items for a document, in pixels"""
+    def px(points):
+        return round(points * dpi / 72)
+
+    fonts = scan_fonts(dpi)
+    content_width = px(PAGE[0] - 2 * MARGIN)
+    content_height = px(PAGE[1] - 2 * MARGIN)
+    for block in document.blocks:
+        if block.kind == "title":
+            font = fonts["title"]
+            for line in _wrap(block.text, font, content_width):
+                yield "text", px(FONT_POINTS["title"] * 1.2), ((content_width - font.getlength(line)) / 2, line, font)
+            yield "gap", px(50), None
+        elif block.kind == "space":
+            yield "gap", px(12), None
+        elif block.kind == "signature":
+            for row in block.text:
+                yield "row", px(SIGNATURE_ROW), [(px(6 + column * SIGNATURE_COLUMN), cell, fonts["normal"])
+                                                 for column, cell in enumerate(row)]
+        elif block.kind == "table":
+            starts = [0]
+            for share in block.column_shares()[:-1]:
+                starts.append(starts[-1] + share * content_width)
+            for number, row in enumerate(block.text):
+                font = fonts["heading" if number == 0 else "normal"]
+                yield "row", px(LEADING), [(start, cell, font) for start, cell in zip(starts, row)]
+            yield "gap", px(6), None
+        elif block.kind == "image":
+            width, height, seed = block.text
+            size = tuple(round(side) for side in fit_size(width, height, content_width, content_height))
+            yield "image", size[1], (block.text, size)
+        else:
+            font = fonts["heading" if block.kind == "heading" else "normal"]
+            text = f"• {block.text}" if block.kind == "bullet" else block.text
+            indent = px(BULLET_INDENT * block.level)
+            for line in _wrap(text, font, content_width - indent):
+                yield "text", px(LEADING), (indent, line, font)
+            yield "gap", px(6), None
+
+
+def _finish(page, scan, rng):
+    """Speckle and skew a drawn page the way a document feeder would"""
+    if scan.noise > 0:
+        specks = Image.frombytes("L", page.size, rng.randbytes(page.width * page.height))
+        cutoff = scan.noise * 256
+        page = ImageChops.darker(page, specks.point(lambda value: 0 if value < cutoff else 255))
+    if scan.skew:
+        page = page.rotate(rng.uniform(-scan.skew, scan.skew), resample=Image.BICUBIC, fillcolor=255)
+    return page
+
+
+def rasterize(document, scan=None):
+    """Yield the pages of a document as grayscale page images"""
+    scan = scan or ScanSettings()
+    rng = random.Random(f"scan:{document.id}")
+    size = tuple(round(side * scan.dpi / 72) for side in PAGE)
+    margin = round(MARGIN * scan.dpi / 72)
+    page = draw = None
+    y = bottom = size[1] - margin
+    for kind, height, payload in _items(document, scan.dpi):
+        if kind == "gap":
+            y += height if page is not None and y > margin else 0
+            continue
+        if page is None or y + height > bottom:
+            if page is not None:
+                yield _finish(page, scan, rng)
+            page = Image.new("L", size, 255)
+            draw = ImageDraw.Draw(page)
+            y = margin
+        if kind == "text":
+            x, line, font = payload
+            draw.text((margin + x, y), line, font=font, fill=0)
+        elif kind == "row":
+            for x, cell, font in payload:
+                draw.text((margin + x, y), cell, font=font, fill=0)
+        else:
+            (width, full_height, image_seed), fitted = payload
+            with Image.open(io.BytesIO(scan_jpeg(width, full_height, image_seed))) as image:
+                page.paste(image.resize(fitted), (margin, y))
+        y += height
+    if page is not None:
+        yield _finish(page, scan, rng)
+
+
+def _pdf_string(text):
+    if text.isascii():
+        return "(" + text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+    return "<FEFF" + text.encode("utf-16-be").hex().upper() + ">"
+
+
+def write_pdf(f, pages, info=None):
+    """Write page images to `f` as a PDF with one full-page JPEG per page, a page at a time"""
+    offsets = {}
+    position = 0
+
+    def write(data):
+        nonlocal position
+        f.write(data)
+        position += len(data)
+
+    def write_object(number, dictionary, stream=None):
+        offsets[number] = position
+        write(f"{number} 0 obj\n{dictionary}".encode("ascii"))
+        if stream is not None:
+            write(b"\nstream\n")
+            write(stream)
+            write(b"\nendstream")
+        write(b"\nendobj\n")
+
+    write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    write_object(1, "<< /Type /Catalog /Pages 2 0 R >>")
+    kids = []
+    number = 3
+    for page in pages:
+        buffer = io.BytesIO()
+        page.save(buffer, "JPEG", quality=SCAN_QUALITY)
+        jpeg = buffer.getvalue()
+        write_object(number, f"<< /Type /XObject /Subtype /Image /Width {page.width} /Height {page.height} "
+                             f"/ColorSpace /DeviceGray /BitsPerComponent 8 /Filter /DCTDecode "
+                             f"/Length {len(jpeg)} >>", jpeg)
+        content = f"q {PAGE[0]} 0 0 {PAGE[1]} 0 0 cm /Scan Do Q".encode("ascii")
+        write_object(number + 1, f"<< /Length {len(content)} >>", content)
+        write_object(number + 2, f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE[0]} {PAGE[1]}] "
+                                 f"/Resources << /XObject << /Scan {number} 0 R >> >> /Contents {number + 1} 0 R >>")
+        kids.append(number + 2)
+        number += 3
+    write_object(2, f"<< /Type /Pages /Kids [{' '.join(f'{kid} 0 R' for kid in kids)}] /Count {len(kids)} >>")
+    trailer = f"/Size {number} /Root 1 0 R"
+    if info:
+        fields = " ".join(f"/{INFO_KEYS[key]} {_pdf_string(value)}" for key, value in info.items())
+        write_object(number, f"<< {fields} >>")
+        trailer = f"/Size {number + 1} /Root 1 0 R /Info {number} 0 R"
+
+    xref = position
+    write(f"xref\n0 {len(offsets) + 1}\n0000000000 65535 f \n".encode("ascii"))
+    for object_number in sorted(offsets):
+        write(f"{offsets[object_number]:010d} 00000 n \n".encode("ascii"))
+    write(f"trailer\n<< {trailer} >>\nstartxref\n{xref}\n%%EOF\n".encode("ascii"))
+
+
+def render(document, output, profile=None, scan=None):
+    """Render a document to an image-only PDF, rasterized with the scan settings"""
+    info = document_info(document, profile.metadata) if profile is not None else {"title": document.title}
+    pages = rasterize(document, scan)
+    if is_path(output):
+        with open(output, "wb") as f:
+            write_pdf(f, pages, info)
+    else:
+        write_pdf(output, pages, info)
+    return output
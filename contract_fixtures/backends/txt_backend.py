@@ -0,0 +1,17 @@
+"""
+Plain-text backend: the document's expected extracted text, as UTF-8.
+"""
+
+from . import is_path
+from ..truth import expected_text
+
+
+def render(document, output, profile=None):
+    """Render a document to a plain-text file (output profiles don't apply)"""
+    data = expected_text(document).encode("utf-8")
+    if is_path(output):
+        with open(output, "wb") as f:
+            f.write(data)
+    else:
+        output.write(data)
+    return output
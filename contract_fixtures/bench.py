@@ -0,0 +1,215 @@
+"""
+Rendering benchmarks for the reportlab and fpdf2 backends.
+
+Every case renders the same compiled spec, padded to a given size, through
+one backend in memory. Wall time is recorded as the median and the minimum of
+several timed runs; the minimum, being the least noisy, is what baselines
+compare. Fast cases are timed more often than `repeat`, until the runs add up
+to `MIN_TIMED_S`, so millisecond renders get enough samples for a stable
+minimum. Those runs start with an empty flowable cache; `wall_warm_s` is the
+median with every paragraph already cached. Peak memory comes from a
+separate tracemalloc run so tracing doesn't skew the timings.
+
+Each cold run is paired with a fixed pure-Python workload timed just before
+it (`calibrate`), and a case records the median ratio of the two as
+`wall_calibrated`. Comparisons scale the baseline's wall time by how that
+ratio changed, so a machine that is busier or slower than the baseline's
+doesn't look like a regression. A metric then only counts as one when it is worse than the
+baseline by more than its relative tolerance and by more than its noise
+floor, so a millisecond case that varies by a millisecond or two isn't
+flagged. Cases that still look slower are re-run (`confirm_regressions`),
+and only a slowdown that persists is reported. Baselines are the best of
+`BASELINE_PASSES` runs of the suite, since a checked case gets that many
+chances too.
+"""
+
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+
+from .backends import get_backend
+from .cache import backend_version
+from .flowcache import flowable_cache
+from .pdfutil import count_pages
+from .render import render_bytes
+from .spec import load_builtin
+from .streaming import pad_document
+
+# Size name -> how many copies of the spec's clauses the document holds
+SIZES = {"small": 1, "medium": 10, "large": 50}
+BACKENDS = ["reportlab", "fpdf"]
+SPECS = ["service-agreement", "problematic-contract"]
+
+# Metrics compared against the baseline, how much worse each may get, and the smallest
+# absolute change that counts at all
+TOLERANCES = {"wall_min_s": 0.25, "peak_mb": 0.25, "bytes": 0.05}
+NOISE_FLOORS = {"wall_min_s": 0.005, "peak_mb": 0.25, "bytes": 0}
+# Cold runs continue past `repeat` until they take this long in total, up to MAX_REPEAT runs
+MIN_TIMED_S = 1.0
+MAX_REPEAT = 50
+# Times a case that looks slower than the baseline is re-run before it counts as a regression
+CONFIRM_ATTEMPTS = 2
+BASELINE_PASSES = 1 + CONFIRM_ATTEMPTS
+
+
+def calibrate():
+    """Seconds a fixed workload of string formatting and dict lookups takes on this machine right now"""
+    # Collect the last render's garbage first, so the workload doesn't pay for it
+    gc.collect()
+    timings = []
+    # The fastest of a few back-to-back runs, so one preempted run doesn't count
+    for _ in range(3):
+        start = time.perf_counter()
+        widths = {}
+        for number in range(20000):
+            word = f"clause-{number % 97}"
+            widths[word] = widths.get(word, 0) + len(word.upper())
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def sized_document(spec_name, size):
+    document = load_builtin(spec_name)
+    clauses = sum(1 for block in document.blocks if block.kind == "heading")
+    return pad_document(document, clauses * (SIZES[size] - 1))
+
+
+def run_case(spec_name, size, backend, repeat=5, profile=None):
+    document = sized_document(spec_name, size)
+    render_bytes(document, backend, profile)  # Warm up imports, fonts and style caches
+
+    # Cold runs start from an empty flowable cache, like a fresh process; warm runs
+    # find every paragraph cached, like a batch worker rendering repeated clause text
+    timings, warm_timings, calibrations = [], [], []
+    while len(timings) < repeat or (sum(timings) < MIN_TIMED_S and len(timings) < MAX_REPEAT):
+        calibrations.append(calibrate())
+        flowable_cache.clear()
+        start = time.perf_counter()
+        data = render_bytes(document, backend, profile)
+        timings.append(time.perf_counter() - start)
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render_bytes(document, backend, profile)
+        warm_timings.append(time.perf_counter() - start)
+
+    flowable_cache.clear()
+    tracemalloc.start()
+    render_bytes(document, backend, profile)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    wall = statistics.median(timings)
+    pages = count_pages(data)
+    return {
+        # Cases without a profile keep their original names, so older baselines still compare
+        "case": f"{spec_name}/{size}/{backend}" + (f"/{profile}" if profile else ""),
+        "spec": spec_name,
+        "size": size,
+        "backend": backend,
+        "profile": profile,
+        "wall_s": round(wall, 5),
+        "wall_min_s": round(min(timings), 5),
+        "wall_warm_s": round(statistics.median(warm_timings), 5),
+        "runs": len(timings),
+        "wall_calibrated": round(statistics.median(wall / calibration
+                                                   for wall, calibration in zip(timings, calibrations)), 4),
+        "peak_mb": round(peak / (1024 * 1024), 3),
+        "bytes": len(data),
+        "pages": pages,
+        "bytes_per_page": round(len(data) / pages) if pages else None,
+        "pages_per_s": round(pages / wall, 1) if wall else 0.0,
+    }
+
+
+def installed_backends(backends):
+    """Filter out backends whose library isn't installed"""
+    return [backend for backend in backends if get_backend(backend).is_available()]
+
+
+def run_suite(specs=SPECS, sizes=SIZES, backends=BACKENDS, repeat=5, progress=print, profiles=(None,)):
+    results = []
+    for spec_name in specs:
+        for size in sizes:
+            for backend in backends:
+                for profile in profiles:
+                    result = run_case(spec_name, size, backend, repeat, profile)
+                    progress(f"✓ {result['case']:<52} {result['wall_s'] * 1000:9.1f} ms "
+                             f"({result['wall_warm_s'] * 1000:.1f} warm) "
+                             f"{result['peak_mb']:8.1f} MB {result['bytes']:>10,} B "
+                             f"{result['bytes_per_page'] or 0:>8,} B/page {result['pages_per_s']:8.1f} pages/s")
+                    results.append(result)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "versions": {backend: backend_version(backend) for backend in backends},
+            "repeat": repeat,
+            "min_timed_s": MIN_TIMED_S,
+        },
+        "results": results,
+    }
+
+
+def best_of(passes):
+    """The first of several results of the same suite, with each case's fastest calibrated run"""
+    best = {}
+    for results in passes:
+        for result in results["results"]:
+            if result["case"] not in best or result["wall_calibrated"] < best[result["case"]]["wall_calibrated"]:
+                best[result["case"]] = result
+    return dict(passes[0], results=[best[result["case"]] for result in passes[0]["results"]])
+
+
+def compare(results, baseline, tolerances=TOLERANCES, floors=NOISE_FLOORS):
+    """
+    List (case, metric, baseline, current) for every metric worse than
+    baseline beyond its tolerance and floor. Wall times are the baseline's
+    scaled by the change in `wall_calibrated`, when both results have it.
+    """
+    previous = {result["case"]: result for result in baseline["results"]}
+    regressions = []
+    for result in results["results"]:
+        before = previous.get(result["case"])
+        if before is None:
+            continue
+        calibrated = before.get("wall_calibrated") and result.get("wall_calibrated")
+        for metric, tolerance in tolerances.items():
+            current = result[metric]
+            if metric == "wall_min_s" and calibrated:
+                current = before[metric] * result["wall_calibrated"] / before["wall_calibrated"]
+            if (before[metric] and current > before[metric] * (1 + tolerance)
+                    and current - before[metric] > floors.get(metric, 0)):
+                regressions.append((result["case"], metric, before[metric], round(current, 5)))
+    return regressions
+
+
+def confirm_regressions(results, baseline, repeat=5, attempts=CONFIRM_ATTEMPTS, progress=print):
+    """
+    compare(), after re-running each case that is slower than the baseline
+    up to `attempts` more times and keeping its best run in `results`
+    """
+    for _ in range(attempts):
+        slower = {case for case, metric, _, _ in compare(results, baseline) if metric == "wall_min_s"}
+        if not slower:
+            break
+        for index, result in enumerate(results["results"]):
+            if result["case"] in slower:
+                progress(f"↻ Re-running {result['case']}, slower than the baseline")
+                again = run_case(result["spec"], result["size"], result["backend"], repeat, result["profile"])
+                if again["wall_calibrated"] < result["wall_calibrated"]:
+                    results["results"][index] = again
+    return compare(results, baseline)
+
+
+def load_results(filename):
+    with open(filename, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_results(results, filename):
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
@@ -0,0 +1,112 @@
+"""
+Content-addressed build cache for generated fixtures.
+
+Each output file is recorded in a `.fixture-cache.json` manifest next to it,
+keyed on a hash of the compiled document, the renderer backend, the backend
+library's version and any render options, along with the mode that wrote it
+(batch, stream, targets, ...). A file is only rebuilt when that key changes,
+and batch runs evict files their mode wrote but the current run no longer
+produces; other modes' files in the same directory are left alone.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+
+from .backends import get_backend
+from .render import RENDERER_VERSION
+
+CACHE_FILE = ".fixture-cache.json"
+
+
+def document_digest(document):
+    """Stable hash of a compiled document's content"""
+    payload = [document.id, document.title, [[block.kind, block.text, block.level] for block in document.blocks]]
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def backend_version(backend):
+    return get_backend(backend).version()
+
+
+def _option_value(value):
+    # Settings objects such as ScanSettings are keyed on their fields
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Cannot key render option {value!r}")
+
+
+def cache_key(document, backend, **options):
+    """Key for one output: document content, backend, library version and options"""
+    payload = {
+        "document": document_digest(document),
+        "backend": backend,
+        "version": backend_version(backend),
+        "renderer": RENDERER_VERSION,
+        "options": options,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=_option_value).encode("utf-8")).hexdigest()
+
+
+class BuildCache:
+    """The cache manifest of one output directory"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.path = os.path.join(directory, CACHE_FILE)
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+        # Entries from before modes were recorded are bare keys, and never evicted
+        self.entries = {name: entry if isinstance(entry, dict) else {"key": entry, "mode": None}
+                        for name, entry in self.entries.items()}
+
+    def _name(self, filename):
+        return os.path.relpath(filename, self.directory)
+
+    def is_fresh(self, filename, key):
+        entry = self.entries.get(self._name(filename))
+        return entry is not None and entry["key"] == key and os.path.exists(filename)
+
+    def record(self, filename, key, mode=None):
+        self.entries[self._name(filename)] = {"key": key, "mode": mode}
+
+    def forget(self, filename):
+        self.entries.pop(self._name(filename), None)
+
+    def evict_stale(self, keep, mode):
+        """Delete tracked files written by `mode` that are not in `keep`; returns their paths"""
+        keep = {self._name(filename) for filename in keep}
+        stale = [name for name, entry in self.entries.items() if entry["mode"] == mode and name not in keep]
+        for name in stale:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            del self.entries[name]
+        return [os.path.join(self.directory, name) for name in stale]
+
+    def save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=0, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def cached_render(render, document, filename, backend, **options):
+    """
+    Render `document` to `filename` unless the cached output is still fresh;
+    returns True if built. `options` are part of the key and passed to `render`.
+    """
+    cache = BuildCache(os.path.dirname(filename) or ".")
+    key = cache_key(document, backend, **options)
+    if cache.is_fresh(filename, key):
+        return False
+    render(document, filename, **options)
+    cache.record(filename, key)
+    cache.save()
+    return True
@@ -0,0 +1,251 @@
+"""
+Clause library for synthetic contracts.
+
+Built from the clause texts of the bundled specs. Each clause slot has a
+benign variant and, where the fixtures have one, a predatory variant taken
+from the problematic vendor agreement. Texts are `str.format` templates over
+the values drawn by `contract_fixtures.synth`.
+"""
+
+COMPANIES = [
+    "TechCorp Solutions", "Digital Innovations LLC", "Innovative Tech Corp", "MegaCorp Industries",
+    "Small Business Solutions", "Property Management LLC", "ABC Company", "XYZ Services",
+]
+COMPANY_PREFIXES = [
+    "Apex", "Blue Harbor", "Cedar", "Summit", "Northwind", "Granite", "Silverline", "Redwood",
+    "Evergreen", "Lakeside", "Ironbridge", "Brightpath", "Keystone", "Pioneer", "Horizon", "Crescent",
+]
+COMPANY_SUFFIXES = [
+    "Solutions", "Industries", "LLC", "Group", "Partners", "Holdings", "Technologies", "Consulting",
+]
+FIRST_NAMES = [
+    "Sarah", "Michael", "Jennifer", "Alex", "Emma", "Robert", "Richard", "Maria", "David", "Priya",
+    "James", "Olivia", "Daniel", "Sofia", "Wei", "Fatima", "Carlos", "Hannah", "Samuel", "Grace",
+]
+LAST_NAMES = [
+    "Johnson", "Chen", "Liu", "Rodriguez", "Thompson", "Davis", "Powers", "Garcia", "Patel", "Kim",
+    "Nguyen", "Okafor", "Schmidt", "Rossi", "Cohen", "Silva", "Murphy", "Walker", "Singh", "Lopez",
+]
+TITLES = ["CEO", "President", "Owner", "Managing Director", "HR Director", "Manager", "COO"]
+STATES = [
+    "New York", "California", "Illinois", "Texas", "Delaware", "Washington", "Florida", "Massachusetts",
+]
+STREETS = ["Oak Street", "Maple Avenue", "Pine Road", "Elm Drive", "Lake Boulevard", "Main Street"]
+CITIES = [
+    ("Springfield", "IL", "62701"), ("Austin", "TX", "73301"), ("Portland", "OR", "97201"),
+    ("Albany", "NY", "12207"), ("Madison", "WI", "53703"), ("Denver", "CO", "80202"),
+]
+
+SERVICE_CLOSING = "IN WITNESS WHEREOF, the parties have executed this Agreement as of the date first written above."
+SIGNING_CLOSING = "By signing below, both parties agree to the terms of this {title_case}."
+
+CONTRACT_TYPES = {
+    "service": {
+        "title": "SERVICE AGREEMENT",
+        "roles": ("Client", "Provider"),
+        "preamble": 'This Service Agreement ("Agreement") is entered into on {date}, between {party_a} ("Client") and {party_b} ("Provider").',
+        "closing": SERVICE_CLOSING,
+        "leading": 2,
+        "clauses": [
+            {"type": "services", "heading": "SERVICES", "benign": {
+                "body": ["Provider agrees to provide software development and consulting services including:"],
+                "bullets": ["Custom web application development", "Database design and implementation",
+                            "User interface design", "Testing and quality assurance"]}},
+            {"type": "payment", "heading": "PAYMENT TERMS", "benign": {
+                "body": ["Client agrees to pay a total of {total} as follows:"],
+                "bullets": ["{installment} upon signing this agreement",
+                            "{installment} upon completion of Phase 1 (design and planning)",
+                            "{installment} upon final delivery and acceptance"]},
+             "predatory": {
+                "body": ["Client agrees to pay Provider based on performance metrics determined solely by Provider. "
+                         "Payment amounts and timing are at Provider's complete discretion. Client shall prepay "
+                         "{total} upon signing, which is non-refundable under any circumstances."]}},
+            {"type": "termination", "heading": "TERM AND TERMINATION", "benign": {
+                "body": ["This agreement shall commence on {date}, and continue for {months} months unless terminated "
+                         "earlier. Either party may terminate this agreement with {notice_days} days written notice. "
+                         "Upon termination, Client shall pay for all work completed to date."]},
+             "predatory": {
+                "body": ["This agreement is for an initial term of {term_years} years and automatically renews for "
+                         "additional {term_years}-year periods unless Client provides {renewal_notice_months} months "
+                         "written notice. Provider may terminate at any time with 24 hours notice."]}},
+            {"type": "intellectual_property", "heading": "INTELLECTUAL PROPERTY", "benign": {
+                "body": ["All work product, including source code, designs, and documentation, shall be owned "
+                         "exclusively by Provider until final payment is received, at which point ownership "
+                         "transfers to Client."]},
+             "predatory": {
+                "body": ["All work product, including source code, designs, and documentation, and any materials "
+                         "supplied by Client, shall be owned exclusively and perpetually by Provider."]}},
+            {"type": "confidentiality", "heading": "CONFIDENTIALITY", "benign": {
+                "body": ["Both parties agree to maintain confidentiality of proprietary information shared during "
+                         "the course of this agreement for a period of {confidentiality_years} years."]}},
+            {"type": "liability", "heading": "LIABILITY AND WARRANTIES", "benign": {
+                "body": ["Provider's total liability under this agreement shall not exceed {liability_cap}. Provider "
+                         "makes no warranties regarding the software's performance in Client's specific environment."]},
+             "predatory": {
+                "body": ["Client assumes all liability for any damages, losses, or claims arising from this "
+                         "agreement. Provider's liability is limited to {nominal_cap}."]}},
+            {"type": "governing_law", "heading": "GOVERNING LAW", "benign": {
+                "body": ["This agreement shall be governed by the laws of the State of {state}. Any disputes shall be "
+                         "resolved through binding arbitration."]}},
+            {"type": "force_majeure", "heading": "FORCE MAJEURE", "benign": {
+                "body": ["Neither party shall be liable for delays caused by circumstances beyond their reasonable "
+                         "control, including natural disasters, government actions, or pandemics."]}},
+            {"type": "non_compete", "heading": "NON-COMPETE AND NON-SOLICITATION", "predatory": {
+                "body": ["Client agrees not to engage any other provider for similar services for {non_compete_years} "
+                         "years after termination. Client shall not solicit any Provider employees for "
+                         "{non_solicit_years} years."]}},
+            {"type": "termination_penalty", "heading": "TERMINATION PENALTIES", "predatory": {
+                "body": ["If Client terminates this agreement for any reason, Client must pay Provider {penalty} as "
+                         "liquidated damages plus all fees for the remainder of the term."]}},
+        ],
+    },
+    "employment": {
+        "title": "EMPLOYMENT AGREEMENT",
+        "roles": ("Company", "Employee"),
+        "preamble": 'This Employment Agreement is entered into on {date}, between {party_a} ("Company") and {person_b} ("Employee").',
+        "closing": SIGNING_CLOSING,
+        "leading": 2,
+        "clauses": [
+            {"type": "position", "heading": "POSITION AND DUTIES", "benign": {
+                "body": ["Employee is hired as {job_title} and agrees to perform duties including software "
+                         "development, code review, mentoring junior developers, and participating in "
+                         "architectural decisions."]}},
+            {"type": "compensation", "heading": "COMPENSATION", "benign": {
+                "body": ["Company agrees to pay Employee an annual salary of {salary}, payable bi-weekly. Employee is "
+                         "eligible for annual performance bonuses up to {bonus_percent}% of base salary."]},
+             "predatory": {
+                "body": ["Company agrees to pay Employee an annual salary of {salary}, payable at Company's "
+                         "discretion. Company may reduce compensation at any time without notice."]}},
+            {"type": "benefits", "heading": "BENEFITS", "benign": {
+                "body": ["Employee is entitled to:"],
+                "bullets": ["Health, dental, and vision insurance (Company pays 80%)", "401(k) with 4% company match",
+                            "{vacation_days} days paid vacation annually", "10 days sick leave",
+                            "$2,000 annual professional development allowance"]}},
+            {"type": "work_schedule", "heading": "WORK SCHEDULE", "benign": {
+                "body": ["Employee's standard work schedule is Monday through Friday, 9:00 AM to 5:00 PM, with "
+                         "flexibility for remote work up to 3 days per week."]},
+             "predatory": {
+                "body": ["Employee shall be available at all times as required by Company, including evenings, "
+                         "weekends, and holidays, without additional compensation."]}},
+            {"type": "confidentiality", "heading": "CONFIDENTIALITY AND NON-DISCLOSURE", "benign": {
+                "body": ["Employee agrees to maintain strict confidentiality of all proprietary information, trade "
+                         "secrets, and client data. This obligation continues for {confidentiality_years} years "
+                         "after termination."]}},
+            {"type": "non_compete", "heading": "NON-COMPETE CLAUSE", "benign": {
+                "body": ["For 12 months after termination, Employee agrees not to work for direct competitors within "
+                         "a 50-mile radius or solicit Company clients or employees."]},
+             "predatory": {
+                "body": ["Employee agrees not to compete with Company or provide services to any business in any "
+                         "industry for {non_compete_years} years after termination. Employee shall not solicit any "
+                         "Company employees, customers, or partners for {non_solicit_years} years."]}},
+            {"type": "termination", "heading": "TERMINATION", "benign": {
+                "body": ["Either party may terminate this agreement with 2 weeks notice. Company may terminate "
+                         "immediately for cause. Upon termination, Employee must return all company property."]},
+             "predatory": {
+                "body": ["Company may terminate this agreement at any time without notice. If Employee resigns, "
+                         "Employee must pay Company {penalty} as liquidated damages."]}},
+            {"type": "dispute_resolution", "heading": "DISPUTE RESOLUTION", "benign": {
+                "body": ["Any disputes shall be resolved through mediation, and if unsuccessful, binding arbitration "
+                         "under {state} state law."]}},
+        ],
+    },
+    "lease": {
+        "title": "RESIDENTIAL LEASE AGREEMENT",
+        "roles": ("Landlord", "Tenant"),
+        "preamble": 'This Lease Agreement is entered into on {date}, between {party_a} ("Landlord") and {person_b} ("Tenant").',
+        "closing": SIGNING_CLOSING,
+        "leading": 3,
+        "clauses": [
+            {"type": "property", "heading": "PROPERTY", "benign": {
+                "body": ["Landlord leases to Tenant the residential property located at {address} (\"Premises\")."]}},
+            {"type": "term", "heading": "TERM", "benign": {
+                "body": ["The lease term is {months} months, beginning {date}. Tenant has no right to renew without "
+                         "Landlord's written consent."]},
+             "predatory": {
+                "body": ["The lease term is {months} months, beginning {date}, and automatically renews for "
+                         "successive {months}-month periods unless Tenant provides {renewal_notice_months} months "
+                         "written notice."]}},
+            {"type": "rent", "heading": "RENT", "benign": {
+                "body": ["Monthly rent is {rent}, due on the 1st of each month. Late fees of {late_fee} apply after "
+                         "the 5th. Security deposit of {deposit} is required before move-in."]},
+             "predatory": {
+                "body": ["Monthly rent is {rent}, due on the 1st of each month, and may be increased by Landlord at "
+                         "any time. Late fees of {late_fee} per day apply after the 1st. The security deposit of "
+                         "{deposit} is non-refundable."]}},
+            {"type": "use", "heading": "USE OF PREMISES", "benign": {
+                "body": ["Premises shall be used solely as a private residence for Tenant and immediate family. No "
+                         "pets allowed without written permission. No smoking permitted."]}},
+            {"type": "maintenance", "heading": "MAINTENANCE AND REPAIRS", "benign": {
+                "body": ["Landlord is responsible for major repairs and maintenance. Tenant is responsible for minor "
+                         "repairs under $100 and must maintain premises in good condition."]},
+             "predatory": {
+                "body": ["Tenant is responsible for all repairs and maintenance, including structural repairs, "
+                         "regardless of cause."]}},
+            {"type": "utilities", "heading": "UTILITIES", "benign": {
+                "body": ["Tenant is responsible for electricity, gas, internet, and cable. Landlord pays for water, "
+                         "sewer, and trash collection."]}},
+            {"type": "alterations", "heading": "ALTERATIONS", "benign": {
+                "body": ["No alterations or improvements may be made without Landlord's written consent. Any "
+                         "unauthorized changes may result in charges and lease termination."]}},
+            {"type": "entry", "heading": "ENTRY BY LANDLORD", "benign": {
+                "body": ["Landlord may enter premises with 24-hour notice for inspections, repairs, or showing to "
+                         "prospective tenants during the last 30 days of lease."]},
+             "predatory": {
+                "body": ["Landlord may enter premises at any time without notice for any reason."]}},
+            {"type": "termination", "heading": "TERMINATION", "benign": {
+                "body": ["Lease may be terminated by Landlord for non-payment of rent, violation of lease terms, or "
+                         "illegal activities. 30-day notice required for non-renewal."]},
+             "predatory": {
+                "body": ["Landlord may terminate this lease at any time with 24 hours notice. If Tenant terminates "
+                         "early, Tenant must pay {penalty} as liquidated damages."]}},
+            {"type": "governing_law", "heading": "GOVERNING LAW", "benign": {
+                "body": ["This agreement is governed by {state} state law and local ordinances."]}},
+        ],
+    },
+    "vendor": {
+        "title": "EXCLUSIVE VENDOR AGREEMENT",
+        "roles": ("Company", "Vendor"),
+        "preamble": 'This Exclusive Vendor Agreement ("Agreement") is entered into on {date}, between {party_a} ("Company") and {party_b} ("Vendor").',
+        "closing": None,
+        "leading": 1,
+        "clauses": [
+            {"type": "exclusivity", "heading": "EXCLUSIVE SERVICES", "benign": {
+                "body": ["Vendor agrees to provide marketing and advertising services to Company. Vendor may provide "
+                         "services to other businesses that do not directly compete with Company."]},
+             "predatory": {
+                "body": ["Vendor agrees to provide ALL marketing and advertising services exclusively to Company. "
+                         "Vendor shall not provide any services to competitors or any other businesses in any "
+                         "industry without Company's written consent."]}},
+            {"type": "payment", "heading": "PAYMENT TERMS", "benign": {
+                "body": ["Company agrees to pay Vendor {total} per year, in equal monthly installments due on the 1st "
+                         "of each month."]},
+             "predatory": {
+                "body": ["Company agrees to pay Vendor based on performance metrics determined solely by Company. "
+                         "Payment amounts and timing are at Company's complete discretion. No minimum payment is "
+                         "guaranteed."]}},
+            {"type": "renewal", "heading": "TERM AND RENEWAL", "benign": {
+                "body": ["This agreement is for an initial term of {months} months. Either party may terminate with "
+                         "{notice_days} days written notice."]},
+             "predatory": {
+                "body": ["This agreement is for an initial term of {term_years} years and automatically renews for "
+                         "additional {term_years}-year periods unless Vendor provides {renewal_notice_months} months "
+                         "written notice. Company may terminate at any time with 24 hours notice."]}},
+            {"type": "non_compete", "heading": "NON-COMPETE AND NON-SOLICITATION", "benign": {
+                "body": ["During the term, Vendor shall not solicit Company employees."]},
+             "predatory": {
+                "body": ["Vendor agrees not to compete with Company or provide services to any business in any "
+                         "industry for {non_compete_years} years after termination. Vendor shall not solicit any "
+                         "Company employees, customers, or partners for {non_solicit_years} years."]}},
+            {"type": "termination_penalty", "heading": "TERMINATION PENALTIES", "predatory": {
+                "body": ["If Vendor terminates this agreement for any reason, Vendor must pay Company {penalty} as "
+                         "liquidated damages plus return all payments received during the agreement term."]}},
+            {"type": "liability", "heading": "LIABILITY", "benign": {
+                "body": ["Each party's liability under this agreement shall not exceed {liability_cap}."]},
+             "predatory": {
+                "body": ["Vendor assumes all liability for any damages, losses, or claims arising from this "
+                         "agreement. Company's liability is limited to {nominal_cap}."]}},
+            {"type": "governing_law", "heading": "GOVERNING LAW", "benign": {
+                "body": ["This agreement shall be governed by the laws of the State of {state}."]}},
+        ],
+    },
+}
@@ -0,0 +1,249 @@
+"""
+Near-duplicate contract families.
+
+Customers re-upload the same contract with small edits. A family is a base
+document plus variants sharing a controlled fraction of its text: at 0.99
+an amount or a date changes, at 0.9 several terms are revised and part of a
+clause is reworded, at 0.5 whole clauses are rewritten with text from the
+clause library. Edits are seeded, so families are reproducible.
+
+Similarity is difflib's ratio over the two documents' word sequences (as
+`truth.expected_text` splits them): 1.0 for identical text, 0.0 for nothing
+in common. Edits come in whole words and clauses, so each variant's actual
+similarity is measured and recorded next to its target, in a manifest
+grouping each family's files (`FAMILY_MANIFEST`).
+"""
+
+import datetime
+import json
+import os
+import random
+import re
+from dataclasses import replace
+from difflib import SequenceMatcher
+
+from .clauses import CONTRACT_TYPES
+from .spec import Block
+from .synth import DATE_RANGE_DAYS, FIRST_DATE, draw_values, money
+from .truth import VALUE_PATTERNS, _heading_name, expected_text
+
+FAMILY_MANIFEST = "families.json"
+DEFAULT_SIMILARITIES = (0.99, 0.9, 0.5)
+EDITABLE = ("paragraph", "bullet")
+MAX_ATTEMPTS = 6
+TOLERANCE = 0.005
+
+
+def words(document):
+    return expected_text(document).split()
+
+
+def similarity(document, other):
+    """Fraction of text two documents share, in order"""
+    return SequenceMatcher(None, words(document), words(other), autojunk=False).ratio()
+
+
+def similarity_label(value):
+    """Short label for a similarity, e.g. s99 or s99.5"""
+    return f"s{value * 100:g}"
+
+
+def _new_value(kind, text, rng):
+    """A different value of the same kind, as a revised draft would have it"""
+    while True:
+        if kind == "money":
+            new = money(rng.randrange(1, 2000) * 50)
+        elif kind == "date":
+            date = FIRST_DATE + datetime.timedelta(days=rng.randrange(DATE_RANGE_DAYS))
+            new = f"{date:%B} {date.day}, {date.year}"
+        elif kind == "percent":
+            new = f"{rng.choice([2, 3, 5, 8, 10, 12, 15, 20, 25])}%"
+        else:
+            new = re.sub(r"\d+", str(rng.choice([1, 2, 3, 5, 6, 7, 10, 14, 30, 60, 90])), text, count=1)
+        if new != text:
+            return new
+
+
+def _library_clauses(rng, exclude):
+    """Clause library clauses, filled with fresh values, whose headings aren't in `exclude`"""
+    clauses = []
+    for contract_type, template in sorted(CONTRACT_TYPES.items()):
+        values = draw_values(rng, contract_type)
+        for slot in template["clauses"]:
+            for risk in ("benign", "predatory"):
+                if risk in slot and slot["heading"] not in exclude:
+                    clauses.append({
+                        "heading": slot["heading"],
+                        "type": slot["type"],
+                        "risk": risk,
+                        "body": [text.format(**values) for text in slot[risk].get("body", [])],
+                        "bullets": [text.format(**values) for text in slot[risk].get("bullets", [])],
+                    })
+    return clauses
+
+
+def _clause_words(clause):
+    return len(clause["heading"].split()) + 1 + sum(len(text.split()) + 1 for text in clause["bullets"]) \
+        + sum(len(text.split()) for text in clause["body"])
+
+
+def _sections(blocks):
+    """(start, end) block ranges of each clause: its heading up to the next space"""
+    sections = []
+    for start, block in enumerate(blocks):
+        if block.kind == "heading":
+            end = start + 1
+            while end < len(blocks) and blocks[end].kind != "space":
+                end += 1
+            sections.append((start, end))
+    return sections
+
+
+def _edit(document, budget, seed):
+    """(blocks, clause annotations) of `document` with about `budget` words revised or rewritten"""
+    rng = random.Random(seed)
+    blocks = list(document.blocks)
+    spent = 0
+
+    # Rewrite whole clauses with other clauses from the library while the budget allows
+    headings = {_heading_name(block.text) for block in blocks if block.kind == "heading"}
+    library = _library_clauses(rng, headings)
+    rewritten = {}
+    sections = _sections(blocks)
+    rng.shuffle(sections)
+    for start, end in sections:
+        size = sum(len(line.split()) for block in blocks[start:end] for line in block.lines())
+        if size > budget - spent or not library:
+            continue
+        candidates = rng.sample(library, min(8, len(library)))
+        clause = min(candidates, key=lambda clause: abs(_clause_words(clause) - size))
+        library = [other for other in library if other["heading"] != clause["heading"]]
+        number = blocks[start].text.split(". ", 1)[0]
+        rewritten[start] = end, clause, [Block("heading", f"{number}. {clause['heading']}"),
+                                         *(Block("paragraph", text) for text in clause["body"]),
+                                         *(Block("bullet", text) for text in clause["bullets"])]
+        spent += size
+    kept = [index for index, block in enumerate(blocks) if block.kind in EDITABLE
+            and not any(start <= index < end for start, (end, _, _) in rewritten.items())]
+
+    # Then revise amounts, dates, terms and percentages, the edits customers make most
+    matches = [(index, kind, match) for index in kept for kind, pattern in VALUE_PATTERNS.items()
+               for match in pattern.finditer(blocks[index].text)]
+    rng.shuffle(matches)
+    revisions = {}
+    for index, kind, match in matches:
+        if spent >= budget:
+            break
+        if any(start < match.end() and match.start() < end for start, end, _ in revisions.get(index, [])):
+            continue  # Overlaps a value already revised (a duration inside a date, ...)
+        revisions.setdefault(index, []).append((match.start(), match.end(), _new_value(kind, match.group(), rng)))
+        spent += len(match.group().split())
+    for index, edits in revisions.items():
+        text = blocks[index].text
+        for start, end, new in sorted(edits, reverse=True):
+            text = text[:start] + new + text[end:]
+        blocks[index] = replace(blocks[index], text=text)
+
+    # And reword the ends of sentences with what is left
+    untouched = [index for index in kept if index not in revisions]
+    rng.shuffle(untouched)
+    rewording = [word for clause in _library_clauses(rng, ()) for text in clause["body"] for word in text.split()]
+    for index in untouched:
+        remaining = budget - spent
+        if remaining <= 0:
+            break
+        old = blocks[index].text.split()
+        count = min(remaining, len(old))
+        offset = rng.randrange(len(rewording) - count)
+        blocks[index] = replace(blocks[index], text=" ".join(old[:len(old) - count] + rewording[offset:offset + count]))
+        spent += count
+
+    annotations = {clause["heading"]: clause for clause in (document.meta or {}).get("clauses", [])}
+    result, clauses = [], []
+    index = 0
+    while index < len(blocks):
+        block = blocks[index]
+        if index in rewritten:
+            end, clause, new_blocks = rewritten[index]
+            result += new_blocks
+            clauses.append({key: clause[key] for key in ("heading", "type", "risk")})
+            index = end
+            continue
+        if block.kind == "heading":
+            name = _heading_name(block.text)
+            clauses.append(annotations.get(name, {"heading": name, "type": None, "risk": None}))
+        result.append(block)
+        index += 1
+    return tuple(result), clauses
+
+
+def near_duplicate(document, target, seed=0):
+    """A variant of `document` sharing about `target` of its text; returns (variant, actual similarity)"""
+    label = similarity_label(target)
+    total = len(words(document))
+    budget = round((1 - target) * total)
+    best = None
+    tried = set()
+    for _ in range(MAX_ATTEMPTS):
+        tried.add(budget)
+        blocks, clauses = _edit(document, budget, f"{seed}:{document.id}:{label}")
+        variant = replace(document, id=f"{document.id}-{label}", blocks=blocks)
+        actual = similarity(document, variant)
+        if best is None or abs(actual - target) < abs(best[2] - target):
+            best = variant, clauses, actual
+        if abs(actual - target) <= TOLERANCE or target >= 1:
+            break
+        # Rewritten text still shares common words with the base, and edits come in
+        # whole values and clauses, so correct the budget from the result
+        step = round((actual - target) * total) or (1 if actual > target else -1)
+        direction = 1 if step > 0 else -1
+        budget = max(0, budget + step)
+        while budget in tried and 0 <= budget + direction <= total:
+            budget += direction
+        if budget in tried:
+            break
+    variant, clauses, actual = best
+    meta = dict(document.meta or {}, clauses=clauses, base=document.id, similarity=round(actual, 4))
+    return replace(variant, meta=meta), actual
+
+
+def member_record(filename, family, document, target=None):
+    """Manifest entry for one member of a family; `target` is None for the base"""
+    return {
+        "file": os.path.basename(filename),
+        "family": family,
+        "target": target,
+        "similarity": (document.meta or {}).get("similarity", 1.0) if target is not None else 1.0,
+        "words": len(words(document)),
+    }
+
+
+def load_families(directory):
+    """Family member records of an output directory, by file name"""
+    try:
+        with open(os.path.join(directory, FAMILY_MANIFEST), encoding="utf-8") as f:
+            families = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    members = {}
+    for family in families:
+        members[family["base"]] = {"file": family["base"], "family": family["family"], "target": None,
+                                   "similarity": 1.0, "words": family["words"]}
+        for variant in family["variants"]:
+            members[variant["file"]] = dict(variant, family=family["family"])
+    return members
+
+
+def save_families(directory, members):
+    """Write member records, grouped into families, to the directory's manifest"""
+    families = {}
+    for member in members:
+        family = families.setdefault(member["family"], {"family": member["family"], "base": None, "words": None,
+                                                        "variants": []})
+        if member["target"] is None:
+            family.update(base=member["file"], words=member["words"])
+        else:
+            family["variants"].append({key: member[key] for key in ("file", "target", "similarity", "words")})
+    with open(os.path.join(directory, FAMILY_MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(list(families.values()), f, indent=2)
+        f.write("\n")
@@ -0,0 +1,67 @@
+"""
+Memoized reportlab flowables.
+
+Synthetic corpora repeat the same clause text (headings, confidentiality,
+force majeure, governing law) across thousands of documents, and parsing
+and line-breaking Paragraphs is most of reportlab's render time. The
+reportlab backend keeps the paragraphs it builds in a bounded LRU cache
+keyed on text, style and frame width, already wrapped at that width, so a
+batch worker only parses and breaks text it hasn't seen before.
+
+This module doesn't import reportlab, so callers can read the hit rate of
+whichever backend ran.
+"""
+
+from collections import OrderedDict, namedtuple
+
+FLOWABLE_CACHE_SIZE = 4096
+
+
+class CacheStats(namedtuple("CacheStats", ["hits", "misses"])):
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def since(self, earlier):
+        """Lookups made after `earlier` was taken"""
+        return CacheStats(self.hits - earlier.hits, self.misses - earlier.misses)
+
+
+class FlowableCache:
+    """Bounded LRU cache of flowables, with hit and miss counts"""
+
+    def __init__(self, maxsize=FLOWABLE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, build):
+        """The cached flowable for `key`, calling `build()` to create it on a miss"""
+        try:
+            flowable = self._items[key]
+        except KeyError:
+            self.misses += 1
+            flowable = self._items[key] = build()
+            if len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+            return flowable
+        self.hits += 1
+        self._items.move_to_end(key)
+        return flowable
+
+    def stats(self):
+        return CacheStats(self.hits, self.misses)
+
+    def clear(self):
+        self._items.clear()
+        self.hits = self.misses = 0
+
+
+# The cache the reportlab backend uses, one per process
+flowable_cache = FlowableCache()
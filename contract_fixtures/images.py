@@ -0,0 +1,47 @@
+"""
+Synthetic scanned-page images.
+
+A "scan" is seeded grayscale noise saved as JPEG. Like a real scanned page
+it barely compresses further, so it gives fixtures realistic binary weight
+that grows predictably with its pixel count. `ScanSettings` describes how
+the scan backend rasterizes whole contracts into image-only PDFs.
+
+Requires Pillow: pip install pillow
+"""
+
+import io
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+
+SCAN_DPI = 150
+SCAN_PAGE = (int(8.5 * SCAN_DPI), int(11 * SCAN_DPI))  # US letter
+SCAN_QUALITY = 85
+
+
+@dataclass(frozen=True)
+class ScanSettings:
+    dpi: int = SCAN_DPI
+    skew: float = 0.0       # maximum rotation of a page, in degrees either way
+    noise: float = 0.0      # fraction of pixels flipped to dark specks
+
+
+@lru_cache(maxsize=16)
+def scan_jpeg(width, height, seed=0, quality=SCAN_QUALITY):
+    """JPEG bytes of a `width` x `height` grayscale noise image"""
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ImportError("Pillow is required for scanned images. "
+                          "Please install it with: pip install pillow") from None
+    rng = random.Random(f"scan:{seed}")
+    image = Image.frombytes("L", (width, height), rng.randbytes(width * height))
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+def fit_size(width, height, box_width, box_height):
+    """Largest (width, height) with the image's aspect ratio that fits in the box"""
+    scale = min(box_width / width, box_height / height)
+    return width * scale, height * scale
@@ -0,0 +1,249 @@
+"""
+Async load-test harness for `/api/analyze-contract`.
+
+Fixtures are posted as multipart (`file`, `userId`, `organizationId`) from a
+fixed number of concurrent workers sharing one pooled aiohttp session.
+Latencies are reported overall and broken down by file type and size.
+
+Requires aiohttp: pip install aiohttp
+"""
+
+import asyncio
+import itertools
+import json
+import math
+import os
+import time
+from dataclasses import dataclass
+from functools import cached_property
+
+from .pack import PACK_EXTENSION, CorpusPack
+from .pdfutil import has_text_layer
+from .stats import percentile
+
+# Organization created by POST /api/setup-test-data
+TEST_ORGANIZATION_ID = "550e8400-e29b-41d4-a716-446655440001"
+
+CONTENT_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".doc": "application/msword",
+    ".txt": "text/plain",
+    ".html": "text/html",
+}
+
+KB = 1024
+MB = 1024 * 1024
+SIZE_BUCKETS = [
+    (100 * KB, "<100KB"),
+    (MB, "100KB-1MB"),
+    (5 * MB, "1-5MB"),
+    (10 * MB, "5-10MB"),
+    (math.inf, ">10MB"),
+]
+
+
+def size_bucket(size):
+    for limit, label in SIZE_BUCKETS:
+        if size <= limit:
+            return label
+
+
+@dataclass(frozen=True)
+class Fixture:
+    name: str
+    data: bytes     # or a memoryview into a corpus pack
+
+    @property
+    def extension(self):
+        return os.path.splitext(self.name)[1].lower()
+
+    @property
+    def content_type(self):
+        return CONTENT_TYPES.get(self.extension, "application/octet-stream")
+
+    @cached_property
+    def kind(self):
+        """File type for the report; image-only PDFs are reported apart, as pdf-scan"""
+        kind = self.extension.lstrip(".") or "unknown"
+        return "pdf-scan" if kind == "pdf" and not has_text_layer(self.data) else kind
+
+
+@dataclass(frozen=True)
+class Sample:
+    kind: str
+    size_bucket: str
+    status: int
+    latency: float
+    error: str = None
+
+
+@dataclass
+class LoadTestResult:
+    samples: list
+    elapsed: float
+    concurrency: int        # requests in flight: the limit, or the peak for scheduled arrivals
+    schedule: dict = None   # arrival profile and how closely it was kept, for scheduled arrivals
+
+
+def read_fixture_list(path):
+    """Paths listed one per line in a file, such as query-fixtures.py output"""
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def load_fixtures(paths):
+    """Read fixture files (or every supported file in the given directories, or the paths listed in an @FILE) into
+    memory; corpus packs are mapped instead, their documents sent straight from the mapping"""
+    fixtures = []
+    for path in paths:
+        if path.startswith("@"):
+            fixtures += load_fixtures(read_fixture_list(path[1:]))
+            continue
+        if path.endswith(PACK_EXTENSION):
+            # The views keep the mapping open for as long as the fixtures live
+            pack = CorpusPack(path)
+            fixtures += [Fixture(name, pack[name]) for name in pack]
+            continue
+        if os.path.isdir(path):
+            names = sorted(name for name in os.listdir(path) if os.path.splitext(name)[1].lower() in CONTENT_TYPES)
+            files = [os.path.join(path, name) for name in names]
+        else:
+            files = [path]
+        for filename in files:
+            with open(filename, "rb") as f:
+                fixtures.append(Fixture(os.path.basename(filename), f.read()))
+    return fixtures
+
+
+def synthetic_fixtures(count, seed=0, backend="auto"):
+    """Render synthetic contracts straight into memory"""
+    from .backends import select_backend
+    from .render import render_bytes
+    from .synth import synthesize
+
+    backend = select_backend(backend)
+    return [Fixture(f"synthetic-{index:06d}{backend.extension}",
+                    render_bytes(synthesize(seed, index), backend.name))
+            for index in range(count)]
+
+
+def synthetic_stream(count, seed=0, backends=("auto",)):
+    """Render synthetic contracts one at a time, as they are needed, cycling through `count` of them per backend"""
+    from .backends import select_backend
+    from .render import render_bytes
+    from .synth import synthesize
+
+    backends = [select_backend(backend) for backend in backends]
+    for index in itertools.cycle(range(count)):
+        document = synthesize(seed, index)
+        for backend in backends:
+            yield Fixture(f"synthetic-{index:06d}{backend.extension}", render_bytes(document, backend.name))
+
+
+async def post_fixture(session, url, fixture, organization_id=TEST_ORGANIZATION_ID, user_id=None):
+    """POST one fixture the way the upload form does; returns its Sample"""
+    import aiohttp
+
+    form = aiohttp.FormData()
+    form.add_field("file", fixture.data, filename=fixture.name, content_type=fixture.content_type)
+    form.add_field("organizationId", organization_id)
+    if user_id:
+        form.add_field("userId", user_id)
+
+    start = time.perf_counter()
+    error = None
+    try:
+        async with session.post(url, data=form) as response:
+            body = await response.read()
+            status = response.status
+        if status >= 400:
+            error = body[:200].decode("utf-8", "replace")
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        status = 0
+        error = f"{type(e).__name__}: {e}"
+    return Sample(fixture.kind, size_bucket(len(fixture.data)), status, time.perf_counter() - start, error)
+
+
+async def run_load_test(url, fixtures, requests, concurrency, organization_id=TEST_ORGANIZATION_ID,
+                        user_id=None, timeout=300):
+    """POST `requests` fixtures (cycling through them) with `concurrency` requests in flight"""
+    import aiohttp
+
+    samples = []
+    next_request = itertools.count()
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+        async def worker():
+            while True:
+                index = next(next_request)
+                if index >= requests:
+                    return
+                fixture = fixtures[index % len(fixtures)]
+                samples.append(await post_fixture(session, url, fixture, organization_id, user_id))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return LoadTestResult(samples, elapsed, concurrency)
+
+
+def _stats(samples):
+    latencies = sorted(sample.latency for sample in samples)
+    return {
+        "requests": len(samples),
+        "errors": sum(1 for sample in samples if sample.error),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+    }
+
+
+def summarize(result):
+    """Throughput plus latency percentiles overall, by file type and by size bucket"""
+    by_kind, by_size, statuses = {}, {}, {}
+    for sample in result.samples:
+        by_kind.setdefault(sample.kind, []).append(sample)
+        by_size.setdefault(sample.size_bucket, []).append(sample)
+        statuses[str(sample.status)] = statuses.get(str(sample.status), 0) + 1
+    bucket_order = [label for _, label in SIZE_BUCKETS]
+    summary = {
+        "elapsed_s": round(result.elapsed, 3),
+        "concurrency": result.concurrency,
+        "throughput_rps": round(len(result.samples) / result.elapsed, 2) if result.elapsed else 0.0,
+        "statuses": statuses,
+        "overall": _stats(result.samples),
+        "by_type": {kind: _stats(samples) for kind, samples in sorted(by_kind.items())},
+        "by_size": {label: _stats(by_size[label]) for label in bucket_order if label in by_size},
+    }
+    if result.schedule is not None:
+        summary["schedule"] = result.schedule
+    return summary
+
+
+def print_report(summary):
+    schedule = summary.get("schedule")
+    concurrency = f"peak concurrency {summary['concurrency']}" if schedule else f"concurrency {summary['concurrency']}"
+    print(f"\n{summary['overall']['requests']} requests in {summary['elapsed_s']:.1f}s "
+          f"({summary['throughput_rps']:.1f} req/s, {concurrency})")
+    if schedule:
+        print(f"Arrivals: {schedule['profile']}; sent p50 {schedule['lag_p50_ms']:.1f} ms, "
+              f"p95 {schedule['lag_p95_ms']:.1f} ms, max {schedule['lag_max_ms']:.1f} ms behind schedule "
+              f"({schedule['generator_waits']} waits for the generator)")
+    print("Status codes: " + ", ".join(f"{status}: {count}" for status, count in sorted(summary["statuses"].items())))
+    print(f"\n{'':<14}{'requests':>10}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    rows = [("overall", summary["overall"])]
+    rows += [(f"type {kind}", stats) for kind, stats in summary["by_type"].items()]
+    rows += [(f"size {label}", stats) for label, stats in summary["by_size"].items()]
+    for label, stats in rows:
+        print(f"{label:<14}{stats['requests']:>10}{stats['errors']:>8}"
+              f"{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}")
+
+
+def write_report(summary, filename):
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+        f.write("\n")
@@ -0,0 +1,268 @@
+"""
+SQLite corpus manifest.
+
+The generators record every document they write in a SQLite database next
+to it (`CORPUS_DB`): backend, format, profile, bytes, pages, seed, render
+time, and from its ground truth the clause types, risk flags and every
+amount, duration and percentage with the type of clause it appears in.
+Picking fixtures for a test is then an indexed query instead of a glob:
+
+    from contract_fixtures.manifest import CorpusManifest, ValueFilter
+    with CorpusManifest("test-corpus") as manifest:
+        files = manifest.query(formats=["docx"], max_bytes=50 * 1024,
+                               values=[ValueFilter.parse("non_compete.duration>5years")])
+
+Amounts are stored normalized so they compare numerically: money in
+dollars, durations in days, percentages as numbers. Dates are stored as
+text only.
+"""
+
+import os
+import random
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+
+from .pdfutil import count_pages
+from .truth import ground_truth
+
+CORPUS_DB = "corpus.sqlite"
+SCHEMA_VERSION = 1
+DAYS = {"hour": 1 / 24, "day": 1, "week": 7, "month": 30, "year": 365}
+DURATION = re.compile(r"(\d+(?:\.\d+)?)(?:-| )?(hour|day|week|month|year)s?$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL UNIQUE,
+    document TEXT,
+    backend TEXT NOT NULL,
+    format TEXT NOT NULL,
+    profile TEXT,
+    bytes INTEGER NOT NULL,
+    pages INTEGER,
+    contract_type TEXT,
+    risk TEXT,
+    seed INTEGER,
+    base TEXT,
+    similarity REAL,
+    render_ms REAL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_format ON documents (format, bytes);
+CREATE INDEX IF NOT EXISTS documents_backend ON documents (backend, bytes);
+CREATE INDEX IF NOT EXISTS documents_contract ON documents (contract_type, risk);
+CREATE TABLE IF NOT EXISTS clauses (
+    document_id INTEGER NOT NULL REFERENCES documents (id) ON DELETE CASCADE,
+    number INTEGER NOT NULL,
+    type TEXT,
+    risk TEXT,
+    heading TEXT
+);
+CREATE INDEX IF NOT EXISTS clauses_type ON clauses (type, risk, document_id);
+CREATE INDEX IF NOT EXISTS clauses_document ON clauses (document_id);
+CREATE TABLE IF NOT EXISTS risk_flags (
+    document_id INTEGER NOT NULL REFERENCES documents (id) ON DELETE CASCADE,
+    flag TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS risk_flags_flag ON risk_flags (flag, document_id);
+CREATE INDEX IF NOT EXISTS risk_flags_document ON risk_flags (document_id);
+CREATE TABLE IF NOT EXISTS clause_values (
+    document_id INTEGER NOT NULL REFERENCES documents (id) ON DELETE CASCADE,
+    clause_type TEXT,
+    kind TEXT NOT NULL,
+    text TEXT NOT NULL,
+    amount REAL
+);
+CREATE INDEX IF NOT EXISTS clause_values_amount ON clause_values (kind, clause_type, amount, document_id);
+CREATE INDEX IF NOT EXISTS clause_values_document ON clause_values (document_id);
+"""
+# Columns of the per-document tables after document_id
+TABLE_COLUMNS = {
+    "clauses": ("number", "type", "risk", "heading"),
+    "risk_flags": ("flag",),
+    "clause_values": ("clause_type", "kind", "text", "amount"),
+}
+
+
+def value_amount(kind, text):
+    """A value's amount in comparable units: dollars, days or percent; None for dates"""
+    if kind == "money":
+        return float(text.lstrip("$").replace(",", ""))
+    if kind == "percent":
+        return float(text.rstrip("%"))
+    if kind == "duration":
+        match = DURATION.match(text.strip().lower())
+        return float(match.group(1)) * DAYS[match.group(2)] if match else None
+    return None
+
+
+@dataclass(frozen=True)
+class ValueFilter:
+    """A condition on the values of a clause type, e.g. non_compete.duration>5years or liability.money<10"""
+    clause_type: str
+    kind: str
+    op: str
+    amount: float
+
+    PATTERN = re.compile(r"^(?:(?P<clause>[a-z_]+)\.)?(?P<kind>money|duration|percent)\s*"
+                         r"(?P<op><=|>=|<|>|=)\s*(?P<amount>.+)$")
+
+    @classmethod
+    def parse(cls, text):
+        match = cls.PATTERN.match(text.strip())
+        try:
+            amount = value_amount(match.group("kind"), match.group("amount").replace(" ", "")) if match else None
+        except ValueError:
+            amount = None
+        if amount is None:
+            raise ValueError(f"Invalid value filter '{text}': use [CLAUSE_TYPE.]KIND OP AMOUNT, e.g. "
+                             "non_compete.duration>5years, liability.money<10 or percent>=15")
+        return cls(match.group("clause"), match.group("kind"), match.group("op"), amount)
+
+
+class CorpusManifest:
+    """The SQLite manifest of an output directory"""
+
+    def __init__(self, directory="."):
+        self.directory = directory
+        self.path = os.path.join(directory, CORPUS_DB)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.executescript(SCHEMA)
+        self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def __contains__(self, filename):
+        file = os.path.relpath(filename, self.directory)
+        return self.connection.execute("SELECT 1 FROM documents WHERE file = ?", (file,)).fetchone() is not None
+
+    def files(self):
+        """File names recorded, relative to the manifest's directory"""
+        return {file for file, in self.connection.execute("SELECT file FROM documents")}
+
+    def record(self, filename, truth, backend, format, size, pages=None, profile=None, render_seconds=None):
+        """Record (or re-record) one document from its ground-truth record"""
+        file = os.path.relpath(filename, self.directory)
+        cursor = self.connection.cursor()
+        cursor.execute("DELETE FROM documents WHERE file = ?", (file,))
+        cursor.execute(
+            "INSERT INTO documents (file, document, backend, format, profile, bytes, pages, contract_type, risk, "
+            "seed, base, similarity, render_ms, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (file, truth.get("id"), backend, format, profile, size, pages, truth.get("contract_type"),
+             truth.get("risk"), truth.get("seed"), truth.get("base"), truth.get("similarity"),
+             round(render_seconds * 1000, 3) if render_seconds is not None else None, time.time()))
+        document_id = cursor.lastrowid
+        types = {clause["number"]: clause["type"] for clause in truth["clauses"]}
+        cursor.executemany("INSERT INTO clauses VALUES (?, ?, ?, ?, ?)",
+                           [(document_id, clause["number"], clause["type"], clause["risk"], clause["heading"])
+                            for clause in truth["clauses"]])
+        cursor.executemany("INSERT INTO risk_flags VALUES (?, ?)",
+                           [(document_id, flag) for flag in truth["risk_flags"]])
+        cursor.executemany("INSERT INTO clause_values VALUES (?, ?, ?, ?, ?)",
+                           [(document_id, types.get(value["clause"]), value["kind"], value["text"],
+                             value_amount(value["kind"], value["text"])) for value in truth["values"]])
+
+    def forget(self, filenames):
+        self.connection.executemany("DELETE FROM documents WHERE file = ?",
+                                    [(os.path.relpath(filename, self.directory),) for filename in filenames])
+
+    def merge(self, directory, files):
+        """Copy the records of `files` from the manifest in another directory, replacing any recorded here"""
+        prefix = os.path.relpath(directory, self.directory)
+        prefix = "" if prefix == "." else prefix + os.sep
+        cursor = self.connection.cursor()
+        cursor.execute("ATTACH DATABASE ? AS shard", (os.path.join(directory, CORPUS_DB),))
+        try:
+            cursor.execute("CREATE TEMP TABLE merging (file TEXT PRIMARY KEY)")
+            cursor.executemany("INSERT OR IGNORE INTO merging VALUES (?)",
+                               [(os.path.relpath(filename, self.directory),) for filename in files])
+            cursor.execute("DELETE FROM main.documents WHERE file IN (SELECT file FROM merging)")
+            # Shift the shard's ids past ours so its clause, flag and value rows keep pointing at their documents
+            offset = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM main.documents").fetchone()[0]
+            cursor.execute("CREATE TEMP TABLE merged AS SELECT id FROM shard.documents "
+                           "WHERE ? || file IN (SELECT file FROM merging)", (prefix,))
+            cursor.execute(
+                "INSERT INTO main.documents SELECT id + ?, ? || file, document, backend, format, profile, bytes, "
+                "pages, contract_type, risk, seed, base, similarity, render_ms, recorded_at FROM shard.documents "
+                "WHERE id IN (SELECT id FROM merged)", (offset, prefix))
+            for table in ("clauses", "risk_flags", "clause_values"):
+                cursor.execute(f"INSERT INTO main.{table} SELECT document_id + ?, "
+                               f"{', '.join(TABLE_COLUMNS[table])} FROM shard.{table} "
+                               "WHERE document_id IN (SELECT id FROM merged)", (offset,))
+            merged = cursor.execute("SELECT COUNT(*) FROM merged").fetchone()[0]
+            cursor.execute("DROP TABLE merging")
+            cursor.execute("DROP TABLE merged")
+            self.connection.commit()
+        finally:
+            cursor.execute("DETACH DATABASE shard")
+        return merged
+
+    def query(self, formats=(), backends=(), profile=None, contract_type=None, risk=None, min_bytes=None,
+              max_bytes=None, min_pages=None, max_pages=None, clause_types=(), risk_flags=(), values=(),
+              limit=None, sample=None, seed=0):
+        """Files matching every condition, as paths relative to the current directory"""
+        conditions, parameters = [], []
+
+        def any_of(column, options):
+            conditions.append(f"{column} IN ({', '.join('?' * len(options))})")
+            parameters.extend(options)
+
+        if formats:
+            any_of("format", formats)
+        if backends:
+            any_of("backend", backends)
+        for column, value in (("profile", profile), ("contract_type", contract_type), ("risk", risk)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+        for column, op, value in (("bytes", ">=", min_bytes), ("bytes", "<=", max_bytes),
+                                  ("pages", ">=", min_pages), ("pages", "<=", max_pages)):
+            if value is not None:
+                conditions.append(f"{column} {op} ?")
+                parameters.append(value)
+        for clause_type in clause_types:
+            conditions.append("id IN (SELECT document_id FROM clauses WHERE type = ?)")
+            parameters.append(clause_type)
+        for flag in risk_flags:
+            conditions.append("id IN (SELECT document_id FROM risk_flags WHERE flag = ?)")
+            parameters.append(flag)
+        for value in values:
+            clause = "clause_type = ? AND " if value.clause_type else ""
+            conditions.append(f"id IN (SELECT document_id FROM clause_values WHERE kind = ? AND {clause}"
+                              f"amount {value.op} ?)")
+            parameters += [value.kind, *([value.clause_type] if value.clause_type else []), value.amount]
+
+        sql = "SELECT file FROM documents"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY file"
+        if limit is not None and sample is None:
+            sql += f" LIMIT {int(limit)}"
+        files = [file for file, in self.connection.execute(sql, parameters)]
+        if sample is not None and sample < len(files):
+            files = random.Random(seed).sample(files, sample)
+        return [os.path.normpath(os.path.join(self.directory, file)) for file in files]
+
+    def commit(self):
+        self.connection.commit()
+
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def record_file(manifest, filename, document, backend, profile=None, render_seconds=None):
+    """Record a document already written to `filename`, reading its size and pages from disk"""
+    with open(filename, "rb") as f:
+        data = f.read()
+    pages = count_pages(data) if backend.format == "pdf" else None
+    manifest.record(filename, ground_truth(document), backend.name, backend.format, len(data), pages, profile,
+                    render_seconds)
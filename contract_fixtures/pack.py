@@ -0,0 +1,148 @@
+"""
+Single-file corpus packs.
+
+Tens of thousands of small fixtures in one directory make a load generator
+spend its time in open() and stat(). A pack is the whole corpus in one
+file: the documents back to back, then a JSON index of each one's name,
+offset, length and metadata, then a fixed-size footer locating the index.
+
+    PACK_MAGIC | document 0 | document 1 | ... | index JSON | footer
+
+The footer is the index's offset and length (little-endian uint64s)
+followed by PACK_MAGIC again, so a truncated write is caught on open.
+`CorpusPack` maps the file read-only and hands out `memoryview` slices of
+it, so reading a document copies nothing and pages in only what is sent.
+"""
+
+import json
+import mmap
+import os
+import random
+import struct
+
+from .pdfutil import count_pages
+
+PACK_EXTENSION = ".pack"
+PACK_MAGIC = b"CFPACK01"
+PACK_VERSION = 1
+FOOTER = struct.Struct("<QQ8s")
+
+
+class PackWriter:
+    """Append documents to a new pack; the file only appears, complete, on close"""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = []
+        self._names = set()
+        self._temp = f"{path}.tmp"
+        self._f = open(self._temp, "wb")
+        self._f.write(PACK_MAGIC)
+        self._offset = len(PACK_MAGIC)
+
+    def add(self, name, data, **meta):
+        """Append one document under a unique `name`, with JSON-serializable metadata"""
+        if name in self._names:
+            raise ValueError(f"Duplicate document '{name}' in pack {self.path}")
+        self._names.add(name)
+        self._f.write(data)
+        self.entries.append({"name": name, "offset": self._offset, "length": len(data), **meta})
+        self._offset += len(data)
+
+    def close(self):
+        index = json.dumps({"version": PACK_VERSION, "documents": self.entries}, ensure_ascii=False,
+                           separators=(",", ":")).encode("utf-8")
+        self._f.write(index)
+        self._f.write(FOOTER.pack(self._offset, len(index), PACK_MAGIC))
+        self._f.close()
+        os.replace(self._temp, self.path)
+
+    def abort(self):
+        self._f.close()
+        os.remove(self._temp)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def pack_files(path, filenames, metadata=None):
+    """Pack files under their base names, with page counts for PDFs and any `metadata[filename]`; returns bytes"""
+    metadata = metadata or {}
+    with PackWriter(path) as writer:
+        for filename in filenames:
+            with open(filename, "rb") as f:
+                data = f.read()
+            meta = dict(metadata.get(filename, {}))
+            if filename.endswith(".pdf"):
+                meta["pages"] = count_pages(data)
+            writer.add(os.path.basename(filename), data, **meta)
+    return os.path.getsize(path)
+
+
+class CorpusPack:
+    """A pack mapped read-only; documents are zero-copy memoryviews, by name or at random"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < len(PACK_MAGIC) + FOOTER.size:
+                raise ValueError(f"Not a corpus pack: {path}")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        offset, length, magic = FOOTER.unpack_from(self._mmap, size - FOOTER.size)
+        if self._mmap[:len(PACK_MAGIC)] != PACK_MAGIC or magic != PACK_MAGIC \
+                or offset + length + FOOTER.size != size:
+            self._mmap.close()
+            raise ValueError(f"Not a corpus pack, or an incomplete one: {path}")
+        index = json.loads(self._mmap[offset:offset + length])
+        self.entries = index["documents"]
+        self._names = {entry["name"]: number for number, entry in enumerate(self.entries)}
+        self._view = memoryview(self._mmap)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __getitem__(self, name):
+        return self.document(self._names[name])
+
+    def entry(self, name):
+        """Index entry (offset, length and metadata) of a document"""
+        return self.entries[self._names[name]]
+
+    def document(self, number):
+        """The `number`th document, as a memoryview into the mapped file"""
+        entry = self.entries[number]
+        return self._view[entry["offset"]:entry["offset"] + entry["length"]]
+
+    def sample(self, k=1, rng=random):
+        """`k` distinct documents drawn at random, as (name, memoryview) pairs"""
+        return [(self.entries[number]["name"], self.document(number))
+                for number in rng.sample(range(len(self.entries)), k)]
+
+    def choice(self, rng=random):
+        """One document drawn at random, as a (name, memoryview) pair"""
+        number = rng.randrange(len(self.entries))
+        return self.entries[number]["name"], self.document(number)
+
+    def close(self):
+        """Unmap the file; raises BufferError while documents handed out are still referenced"""
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
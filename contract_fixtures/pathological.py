@@ -0,0 +1,270 @@
+"""
+Pathological-structure fixtures.
+
+Real uploads have structure the bundled specs never do, and it is what
+breaks reportlab's paragraph splitting, text extraction and chunking. Each
+shape builds a contract from the ordinary block kinds, so every backend
+renders it with its usual loop, at a given scale:
+
+    long-paragraph   one unbroken paragraph of SCALE KB
+    nested-bullets   SCALE bullets nested up to six levels deep, numbered like an outline
+    huge-table       a table of SCALE rows under a header repeated on every page
+    many-sections    SCALE numbered sections
+
+A shape is measured at a ladder of scales ending at its nominal one:
+render time (the fastest of a few runs), peak traced memory, and for PDFs
+pypdf extraction time. Each shape has a budget per backend at its nominal
+scale, set at about three times the render and extraction times and twice
+the peak memory measured with the default profile (with floors of 50 ms and
+1 MB, below which the measurements are noise), so a regression shows up
+as soon as it costs that much. The growth exponent fitted across the ladder
+(1.0 is linear) flags shapes that go superlinear before they are big enough
+to blow a budget.
+"""
+
+import io
+import itertools
+import json
+import math
+import os
+import time
+import tracemalloc
+from collections import namedtuple
+from dataclasses import asdict, dataclass, field
+
+from .backends import select_backend
+from .flowcache import flowable_cache
+from .pdfutil import count_pages
+from .render import render_bytes
+from .spec import Block, Document, load_builtin
+
+PATHOLOGICAL_REPORT = "pathological-report.json"
+LADDER = (0.25, 0.5, 1.0)   # fractions of the nominal scale each shape is measured at
+SUPERLINEAR = 1.25          # growth exponents above this are reported
+MAX_DEPTH = 6
+TABLE_HEADER = ("Item", "Description", "Amount", "Due")
+
+
+# Render time, pypdf extraction time (None for non-PDF output) and peak traced memory while rendering
+Budget = namedtuple("Budget", ["render_s", "extract_s", "peak_mb"])
+
+
+@dataclass(frozen=True)
+class Shape:
+    name: str
+    unit: str           # what the scale counts
+    scale: int          # nominal scale, where the budgets apply
+    budgets: dict       # backend name -> Budget
+
+    def label(self, scale):
+        return f"{self.name}-{scale}{'KB' if self.unit == 'KB' else ''}"
+
+    def build(self, scale):
+        return BUILDERS[self.name](scale)
+
+
+# Measured at the nominal scale (render s / extract s / peak MB), e.g. reportlab:
+#     long-paragraph 0.22 / 0.12 / 1.0, nested-bullets 0.73 / 1.16 / 8.9,
+#     huge-table 0.61 / 1.24 / 3.5, many-sections 0.27 / 0.48 / 1.7
+SHAPES = {shape.name: shape for shape in [
+    Shape("long-paragraph", "KB", 50, {
+        "reportlab": Budget(0.6, 0.4, 2), "fpdf": Budget(2.5, 0.45, 2.5), "scan": Budget(8.5, 0.05, 15),
+        "docx": Budget(0.05, None, 1), "html": Budget(0.05, None, 1), "txt": Budget(0.05, None, 1),
+    }),
+    Shape("nested-bullets", "bullets", 2000, {
+        "reportlab": Budget(2.2, 3.5, 18), "fpdf": Budget(10, 1.6, 1.5), "scan": Budget(30, 0.25, 60),
+        "docx": Budget(0.05, None, 1), "html": Budget(0.05, None, 3), "txt": Budget(0.05, None, 2.5),
+    }),
+    Shape("huge-table", "rows", 2000, {
+        "reportlab": Budget(1.8, 3.7, 7), "fpdf": Budget(1.6, 2.3, 1.5), "scan": Budget(12, 0.06, 36),
+        "docx": Budget(0.05, None, 6), "html": Budget(0.05, None, 1.6), "txt": Budget(0.05, None, 1),
+    }),
+    Shape("many-sections", "sections", 500, {
+        "reportlab": Budget(0.8, 1.5, 3.5), "fpdf": Budget(2.6, 0.6, 1), "scan": Budget(10, 0.1, 18),
+        "docx": Budget(0.05, None, 1), "html": Budget(0.05, None, 1), "txt": Budget(0.05, None, 1),
+    }),
+]}
+
+
+def _source():
+    """The service agreement: pathological content is built from its clause text"""
+    return load_builtin("service-agreement")
+
+
+def _texts():
+    return [block.text for block in _source().blocks if block.kind in ("paragraph", "bullet")]
+
+
+def _document(name, scale, blocks, clauses=()):
+    source = _source()
+    meta = {"shape": name, "scale": scale, "clauses": list(clauses)}
+    return Document(id=f"pathological-{name}-{scale}", title=source.title,
+                    blocks=(Block("title", source.title), *blocks), meta=meta)
+
+
+def long_paragraph(kb):
+    """One paragraph of `kb` KB with no breaks at all"""
+    words, size = [], 0
+    for word in itertools.cycle(" ".join(_texts()).split()):
+        if size >= kb * 1024:
+            break
+        words.append(word)
+        size += len(word) + 1
+    return _document("long-paragraph", kb, [Block("paragraph", " ".join(words))])
+
+
+def nested_bullets(count):
+    """`count` bullets descending to MAX_DEPTH levels and back, numbered like an outline"""
+    texts = _texts()
+    blocks, numbers = [], []
+    for index in range(count):
+        # A triangle wave: 1, 2, ..., MAX_DEPTH, ..., 2, 1, 2, ...
+        depth = MAX_DEPTH - abs(MAX_DEPTH - 1 - index % (2 * MAX_DEPTH - 2))
+        del numbers[depth:]
+        if len(numbers) < depth:
+            numbers += [0] * (depth - len(numbers))
+        numbers[-1] += 1
+        outline = ".".join(map(str, numbers))
+        blocks.append(Block("bullet", f"{outline} {texts[index % len(texts)]}", level=depth - 1))
+    return _document("nested-bullets", count, blocks)
+
+
+def huge_table(rows):
+    """A table of `rows` rows, with amounts and dates in every row"""
+    texts = _texts()
+    body = tuple((str(row), texts[row % len(texts)][:40], f"${(row % 97 + 1) * 250:,}",
+                  f"{['January', 'April', 'July', 'October'][row % 4]} {row % 28 + 1}, 2025")
+                 for row in range(1, rows + 1))
+    return _document("huge-table", rows, [Block("table", (TABLE_HEADER, *body))])
+
+
+def many_sections(count):
+    """`count` numbered sections cycling through the service agreement's clauses"""
+    source = _source()
+    clauses = source.meta["clauses"]
+    texts = _texts()
+    blocks = []
+    for number in range(1, count + 1):
+        clause = clauses[(number - 1) % len(clauses)]
+        blocks += [Block("heading", f"{number}. {clause['heading']}"),
+                   Block("paragraph", texts[number % len(texts)]), Block("space")]
+    return _document("many-sections", count, blocks, clauses)
+
+
+BUILDERS = {
+    "long-paragraph": long_paragraph,
+    "nested-bullets": nested_bullets,
+    "huge-table": huge_table,
+    "many-sections": many_sections,
+}
+
+
+@dataclass
+class Measurement:
+    scale: int
+    bytes: int
+    pages: int
+    render_s: float
+    extract_s: float    # None for non-PDF output, or without pypdf
+    peak_mb: float
+
+
+@dataclass
+class ShapeReport:
+    shape: str
+    unit: str
+    backend: str
+    budget: dict                            # metric -> budget at the nominal scale, None without one
+    measurements: list
+    growth: dict                            # metric -> fitted exponent
+    over_budget: list = field(default_factory=list)
+    superlinear: list = field(default_factory=list)
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def _extractor():
+    """pypdf's PdfReader, or None when it isn't installed"""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        return None
+    return PdfReader
+
+
+def measure(document, backend, profile=None, repeat=3, extract=True):
+    """Measure one document; returns (Measurement, the rendered bytes)"""
+    timings = []
+    for _ in range(repeat):
+        flowable_cache.clear()
+        start = time.perf_counter()
+        data = render_bytes(document, backend, profile)
+        timings.append(time.perf_counter() - start)
+
+    flowable_cache.clear()
+    tracemalloc.start()
+    render_bytes(document, backend, profile)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    extract_s = None
+    is_pdf = select_backend(backend).format == "pdf"
+    PdfReader = _extractor() if extract and is_pdf else None
+    if PdfReader is not None:
+        start = time.perf_counter()
+        for page in PdfReader(io.BytesIO(data)).pages:
+            page.extract_text()
+        extract_s = time.perf_counter() - start
+    measurement = Measurement(document.meta["scale"], len(data), count_pages(data) if is_pdf else None,
+                              round(min(timings), 5),
+                              round(extract_s, 5) if extract_s is not None else None, round(peak / (1024 * 1024), 3))
+    return measurement, data
+
+
+def growth_exponent(scales, values):
+    """Least-squares slope of log(value) over log(scale): 1.0 is linear, 2.0 quadratic"""
+    points = [(math.log(scale), math.log(value)) for scale, value in zip(scales, values) if value and value > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    return round(sum((x - mean_x) * (y - mean_y) for x, y in points) / spread, 2) if spread else None
+
+
+def check_shape(shape, backend="reportlab", profile=None, repeat=3, extract=True, ladder=LADDER):
+    """Measure a shape across the ladder of scales against its backend's budget; returns (ShapeReport, nominal bytes)"""
+    backend = select_backend(backend).name
+    render_bytes(shape.build(max(1, int(shape.scale * ladder[0]))), backend, profile)  # Warm up imports and fonts
+    measurements = []
+    for fraction in ladder:
+        measurement, data = measure(shape.build(max(1, int(shape.scale * fraction))), backend, profile, repeat,
+                                    extract)
+        measurements.append(measurement)
+    scales = [measurement.scale for measurement in measurements]
+    growth = {metric: growth_exponent(scales, [getattr(measurement, metric) for measurement in measurements])
+              for metric in ("render_s", "extract_s", "peak_mb")}
+    budget = shape.budgets.get(backend)
+    report = ShapeReport(shape.name, shape.unit, backend, budget._asdict() if budget is not None else None,
+                         measurements, growth)
+
+    nominal = measurements[-1]
+    for metric in ("render_s", "extract_s", "peak_mb"):
+        value, limit = getattr(nominal, metric), getattr(budget, metric) if budget is not None else None
+        if value is not None and limit is not None and value > limit:
+            report.over_budget.append(f"{metric} {value:g} over its budget of {limit:g} at {nominal.scale} "
+                                      f"{shape.unit}")
+        if growth[metric] is not None and growth[metric] > SUPERLINEAR:
+            report.superlinear.append(f"{metric} grows as n^{growth[metric]:g}")
+    return report, data
+
+
+def write_report(reports, directory):
+    """Write shape reports to the directory's PATHOLOGICAL_REPORT; returns its path"""
+    path = os.path.join(directory, PATHOLOGICAL_REPORT)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"superlinear_above": SUPERLINEAR, "ladder": list(LADDER),
+                   "shapes": [report.to_dict() for report in reports]}, f, indent=2)
+        f.write("\n")
+    return path
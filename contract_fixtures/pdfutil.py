@@ -0,0 +1,90 @@
+"""
+Small helpers for inspecting and joining generated PDFs without a PDF library.
+"""
+
+import re
+
+# Page objects, but not the /Pages tree nodes
+PAGE_OBJECT = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+FONT_RESOURCE = re.compile(rb"/Font\b")
+# Enough of the file structure to join reportlab's output
+STARTXREF = re.compile(rb"startxref\s+(\d+)")
+XREF_ENTRY = re.compile(rb"(\d{10}) \d{5} ([nf])")
+TRAILER_REF = re.compile(rb"/(Root|Info) (\d+) 0 R")
+REFERENCE = re.compile(rb"(\d+) 0 R")
+PAGES_REF = re.compile(rb"/Pages (\d+) 0 R")
+KIDS = re.compile(rb"/Kids \[(.*?)\]", re.S)
+STREAM_START = re.compile(rb">>\s*stream\r?\n")
+OBJECT_BODY = re.compile(rb"\d+ 0 obj\s*(.*?)\s*endobj\s*$", re.S)
+
+
+def count_pages(data):
+    """Count page objects in an uncompressed-xref PDF such as reportlab and fpdf2 write"""
+    return len(PAGE_OBJECT.findall(data))
+
+
+def has_text_layer(data):
+    """Whether a PDF uses any font; scanned, image-only PDFs don't, so pdf-parse finds no text"""
+    return FONT_RESOURCE.search(data) is not None
+
+
+def _objects(data):
+    """{number: body} of the objects of an uncompressed-xref PDF, and its trailer"""
+    xref = int(STARTXREF.findall(data)[-1])
+    trailer_start = data.index(b"trailer", xref)
+    offsets = {number: int(match.group(1))
+               for number, match in enumerate(XREF_ENTRY.finditer(data, xref, trailer_start)) if match.group(2) == b"n"}
+    ends = sorted(offsets.values()) + [xref]
+    end_of = dict(zip(ends, ends[1:]))
+    objects = {number: OBJECT_BODY.match(data, offset, end_of[offset]).group(1) for number, offset in offsets.items()}
+    return objects, data[trailer_start:]
+
+
+def _renumber(body, numbers):
+    """An object body with its references renumbered; stream data is left alone"""
+    stream = STREAM_START.search(body)
+    head, tail = (body[:stream.start()], body[stream.start():]) if stream else (body, b"")
+    return REFERENCE.sub(lambda match: b"%d 0 R" % numbers[int(match.group(1))], head) + tail
+
+
+def concatenate_pdfs(paths, output):
+    """
+    Join uncompressed-xref PDFs such as reportlab writes into `output` (a
+    writable binary file), one at a time, so only one input is ever in
+    memory. The first input's catalog and document info are kept.
+    """
+    def write_object(number, body):
+        offsets[number] = output.tell() - base
+        output.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+
+    base = output.tell()
+    output.write(b"%PDF-1.4\n%\x93\x8c\x8b\x9e\n")
+    # 1, 2 and 3 are the merged page tree, catalog and info; every input's own objects follow
+    offsets, kids, next_number = {}, [], 4
+    root = info = None
+    for path in paths:
+        with open(path, "rb") as f:
+            objects, trailer = _objects(f.read())
+        refs = {name.decode(): int(number) for name, number in TRAILER_REF.findall(trailer)}
+        pages = int(PAGES_REF.search(objects[refs["Root"]]).group(1))
+        own = sorted(set(objects) - {refs["Root"], refs.get("Info"), pages})
+        numbers = {number: next_number + index for index, number in enumerate(own)}
+        numbers[pages] = 1
+        next_number += len(own)
+        for number in own:
+            write_object(numbers[number], _renumber(objects[number], numbers))
+        page_refs = KIDS.search(objects[pages]).group(1)
+        kids += [numbers[int(kid)] for kid in REFERENCE.findall(page_refs)]
+        if root is None:
+            root = _renumber(objects[refs["Root"]], numbers)
+            info = objects.get(refs.get("Info"), b"<< >>")
+    page_refs = b" ".join(b"%d 0 R" % kid for kid in kids)
+    write_object(1, b"<<\n/Count %d /Kids [ %s ] /Type /Pages\n>>" % (len(kids), page_refs))
+    write_object(2, root)
+    write_object(3, info)
+    xref = output.tell() - base
+    output.write(b"xref\n0 %d\n0000000000 65535 f \n" % next_number)
+    for number in range(1, next_number):
+        output.write(b"%010d 00000 n \n" % offsets[number])
+    output.write(b"trailer\n<<\n/Info 3 0 R\n/Root 2 0 R\n/Size %d\n>>\nstartxref\n%d\n%%%%EOF\n" % (next_number, xref))
+    return len(kids)
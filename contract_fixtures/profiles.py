@@ -0,0 +1,116 @@
+"""
+Output profiles: how heavy a rendered file is for the same content.
+
+    minimal     compressed streams, standard 14 fonts, no metadata
+    realistic   compressed streams, embedded TrueType subset, the document
+                info a word processor export carries
+    bloated     uncompressed streams, embedded TrueType subset, full document
+                info plus an XMP packet
+
+Without a profile the renderers keep their libraries' defaults. Both
+reportlab and fpdf2 always subset embedded TrueType fonts, so the profiles
+differ in whether a font is embedded at all, not in how much of it.
+
+With or without a profile, every renderer stamps the fixed `CREATION_DATE`
+instead of the time of the render (and reportlab derives its document ID
+from the content), so the same document always renders to the same bytes.
+"""
+
+import importlib.util
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape
+
+CREATOR = "Microsoft® Word for Microsoft 365"
+CREATION_DATE = datetime(2000, 1, 1, tzinfo=timezone.utc)  # The date reportlab's invariant mode uses
+FONT_DIRS = ["/usr/share/fonts/truetype/dejavu", "/usr/share/fonts/dejavu", "/Library/Fonts"]
+FONT_FILES = [
+    ("Vera.ttf", "VeraBd.ttf"),                    # Bitstream Vera, bundled with reportlab
+    ("DejaVuSans.ttf", "DejaVuSans-Bold.ttf"),
+]
+
+XMP_TEMPLATE = """<x:xmpmeta xmlns:x="adobe:ns:meta/">
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+<rdf:Description rdf:about="" xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:pdf="http://ns.adobe.com/pdf/1.3/" xmlns:xmp="http://ns.adobe.com/xap/1.0/">
+<dc:title><rdf:Alt><rdf:li xml:lang="x-default">{title}</rdf:li></rdf:Alt></dc:title>
+<dc:creator><rdf:Seq><rdf:li>{author}</rdf:li></rdf:Seq></dc:creator>
+<dc:description><rdf:Alt><rdf:li xml:lang="x-default">{subject}</rdf:li></rdf:Alt></dc:description>
+<pdf:Keywords>{keywords}</pdf:Keywords>
+<xmp:CreatorTool>{creator}</xmp:CreatorTool>
+</rdf:Description>
+</rdf:RDF>
+</x:xmpmeta>
+{padding}"""
+
+
+@dataclass(frozen=True)
+class Profile:
+    name: str
+    compress: bool          # compress page content (and, for DOCX, package) streams
+    embed_fonts: bool       # embed a TrueType subset instead of using the standard 14 fonts
+    metadata: str           # "none", "basic" or "full"
+
+
+PROFILES = {
+    "minimal": Profile("minimal", compress=True, embed_fonts=False, metadata="none"),
+    "realistic": Profile("realistic", compress=True, embed_fonts=True, metadata="basic"),
+    "bloated": Profile("bloated", compress=False, embed_fonts=True, metadata="full"),
+}
+
+
+def get_profile(name):
+    """The named profile, or None for the libraries' defaults"""
+    if name is None or isinstance(name, Profile):
+        return name
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown output profile '{name}'. Known profiles: {', '.join(PROFILES)}") from None
+
+
+def _font_dirs():
+    # Locate reportlab's bundled fonts without importing it
+    spec = importlib.util.find_spec("reportlab")
+    if spec is not None and spec.submodule_search_locations:
+        yield os.path.join(list(spec.submodule_search_locations)[0], "fonts")
+    yield from FONT_DIRS
+
+
+def truetype_fonts():
+    """(regular, bold) paths of a TrueType family to embed"""
+    for directory in _font_dirs():
+        for regular, bold in FONT_FILES:
+            paths = os.path.join(directory, regular), os.path.join(directory, bold)
+            if all(os.path.exists(path) for path in paths):
+                return paths
+    raise ImportError("Embedding fonts needs a TrueType font (Bitstream Vera or DejaVu Sans). "
+                      "Please install one with: pip install reportlab")
+
+
+def document_info(document, level):
+    """Document info fields for a metadata level"""
+    if level == "none":
+        return {}
+    signature = next((block.text for block in document.blocks if block.kind == "signature"), None)
+    info = {
+        "title": document.title,
+        "author": signature[0][0] if signature else "",
+        "creator": CREATOR,
+    }
+    if level == "full":
+        clause_types = [clause["type"] for clause in (document.meta or {}).get("clauses", []) if clause.get("type")]
+        info["subject"] = f"{document.title.title()} ({document.id})"
+        info["keywords"] = ", ".join(["contract", *clause_types])
+    return info
+
+
+def xmp_metadata(info):
+    """XMP metadata, padded for in-place edits the way authoring tools leave it"""
+    padding = "\n".join(" " * 99 for _ in range(40))
+    return XMP_TEMPLATE.format(padding=padding, **{key: escape(value) for key, value in info.items()})
+
+
+def xmp_packet(info):
+    """XMP metadata wrapped in its <?xpacket?> processing instructions"""
+    return f'<?xpacket begin="" id="W5M0MpCehiHzreSzNTczkc9d"?>\n{xmp_metadata(info)}\n<?xpacket end="w"?>'
@@ -0,0 +1,70 @@
+"""
+Rendering entry points for compiled contract documents.
+
+Each renderer takes a `Document` and an output, which is either a filename
+or a writable binary file object such as `io.BytesIO`. `render_bytes` and
+`render_buffer` wrap that for callers that never want to touch disk. The
+work is done by the backends registered in `contract_fixtures.backends`,
+which are imported on first use.
+"""
+
+import io
+
+from .backends import is_path, select_backend
+from .profiles import get_profile
+
+# Bump when a renderer's output changes, so cached fixtures get rebuilt
+RENDERER_VERSION = 2
+
+
+def render(document, output, backend="auto", profile=None, **options):
+    """
+    Render a document with the named backend ("auto" picks the cheapest
+    installed PDF backend) and output profile (None keeps library defaults).
+    Other options go to the backend, e.g. `scan=ScanSettings(...)` for scan.
+    """
+    return select_backend(backend).render(document, output, profile=get_profile(profile), **options)
+
+
+def render_reportlab(document, output, profile=None):
+    """Render a document to PDF with reportlab"""
+    return render(document, output, "reportlab", profile)
+
+
+def render_fpdf(document, output, profile=None):
+    """Render a document to PDF with fpdf2"""
+    return render(document, output, "fpdf", profile)
+
+
+def render_html(document, output, profile=None):
+    """Render a document to a standalone HTML page"""
+    return render(document, output, "html", profile)
+
+
+def render_docx(document, output, profile=None):
+    """Render a document to DOCX"""
+    return render(document, output, "docx", profile)
+
+
+def render_txt(document, output, profile=None):
+    """Render a document to plain text"""
+    return render(document, output, "txt", profile)
+
+
+def render_scan(document, output, profile=None, scan=None):
+    """Render a document to an image-only PDF, as if printed and scanned"""
+    return render(document, output, "scan", profile, scan=scan)
+
+
+def render_buffer(document, backend="auto", profile=None, **options):
+    """Render a document in memory and return a zero-copy memoryview of the output"""
+    buffer = io.BytesIO()
+    render(document, buffer, backend, profile, **options)
+    return buffer.getbuffer()
+
+
+def render_bytes(document, backend="auto", profile=None, **options):
+    """Render a document in memory and return the output as bytes"""
+    buffer = io.BytesIO()
+    render(document, buffer, backend, profile, **options)
+    return buffer.getvalue()
@@ -0,0 +1,280 @@
+"""
+Offline clause-family scanner.
+
+A cheap local baseline for the analyzer: which documents contain which
+clause families, from the headings and phrases the fixtures use. Every
+phrase of every family is compiled into one multi-pattern automaton and
+each document's extracted text is streamed through it once, lowercased.
+By default the automaton is an Aho-Corasick machine, which needs
+pyahocorasick (pip install pyahocorasick). The "re" engine needs nothing
+installed: the same phrases are folded into a trie and compiled as a
+single regular expression. Every phrase contains one of a handful of
+anchor words, so the regex only runs on the stretches of text around
+them, found first with `str.find`. Both take the longest phrase at the
+leftmost position and never overlap, so they count the same hits.
+
+Measured per process on synthetic contracts, which are clause-dense,
+Aho-Corasick scans 35-60 MB/s and the regex 30-35 MB/s; the regex only
+reaches about 100 MB/s where the phrases are rare. Neither is hundreds of
+MB/s on one core, so throughput comes from running more workers.
+
+A document's hit vector (phrase hits per family, zeros included) goes
+into its ground-truth sidecar as "scan", and into the directory's
+`truth.ndjson` record for it, so each document's truth and hits sit
+together; documents without ground truth get a `.scan.json` sidecar
+instead. A batch's vectors are also collected into `scan.ndjson`, and
+where ground truth exists, hits are compared with the clause types the
+generator wrote.
+"""
+
+import html
+import json
+import os
+import re
+import time
+import zipfile
+from collections import Counter, namedtuple
+from functools import lru_cache
+from operator import itemgetter
+from xml.etree import ElementTree
+
+from .truth import TRUTH_INDEX, dumps, read_sidecar, sidecar_path
+
+SCAN_SUFFIX = ".scan.json"
+SCAN_INDEX = "scan.ndjson"
+EXTENSIONS = (".pdf", ".docx", ".html", ".txt")
+ENGINES = ("aho-corasick", "re")
+DEFAULT_ENGINE = "aho-corasick"
+WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+CLAUSE_FAMILIES = {
+    "non_compete": ("non-compete", "not to compete", "non-solicitation", "shall not solicit"),
+    "liability": ("limitation of liability", "total liability", "liability under this agreement",
+                  "liability shall not exceed", "liability is limited", "liability limited", "assumes all liability"),
+    "termination_penalty": ("termination penalties", "termination penalty", "early termination fee",
+                            "terminates this agreement for any reason"),
+    "auto_renewal": ("automatically renew", "automatic renewal", "auto-renew"),
+    "liquidated_damages": ("liquidated damages",),
+    "governing_law": ("governing law", "governed by the laws of", "is governed by"),
+}
+# The ground-truth clause type each family is compared with, where the generator has one. Automatic
+# renewal turns up in term and termination clauses, and liquidated damages in penalties, so neither has.
+TRUTH_TYPES = {
+    "non_compete": "non_compete",
+    "liability": "liability",
+    "termination_penalty": "termination_penalty",
+    "governing_law": "governing_law",
+}
+
+ScanResult = namedtuple("ScanResult", ["filename", "pid", "chars", "extract_s", "scan_s", "hits", "error"])
+
+
+def scan_sidecar_path(filename):
+    return os.path.splitext(filename)[0] + SCAN_SUFFIX
+
+
+def _trie_pattern(phrases):
+    """A regex matching any of `phrases`, factored on common prefixes and preferring the longest"""
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def alternation(node):
+        branches = [re.escape(char) + alternation(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            return f"(?:{body})?"
+        return body
+
+    return alternation(trie)
+
+
+class Automaton:
+    """Every family phrase in one matcher; `count(text)` gives the hit vector of lowercased text"""
+
+    def __init__(self, families=CLAUSE_FAMILIES, engine=DEFAULT_ENGINE):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}': use one of {', '.join(ENGINES)}")
+        self.engine = engine
+        self.families = tuple(families)
+        self.family_of = {phrase: family for family, phrases in families.items() for phrase in phrases}
+        # Every phrase contains its longest word, so every match lies within reach of one of these.
+        # A word containing another is already covered by it ("non-compete" by "compete").
+        words = {max(phrase.split(), key=len) for phrase in self.family_of}
+        self.anchors = sorted(word for word in words if not any(other in word for other in words - {word}))
+        self._reach = max(map(len, self.family_of))
+        if engine == "aho-corasick":
+            try:
+                import ahocorasick
+            except ImportError:
+                raise ImportError("pyahocorasick is required for the Aho-Corasick automaton. Please install it "
+                                  "with: pip install pyahocorasick (or use the slower re engine)") from None
+            machine = ahocorasick.Automaton()
+            for phrase, family in self.family_of.items():
+                machine.add_word(phrase, family)
+            machine.make_automaton()
+            # pyahocorasick converts the whole text on every call, so it scans it in one pass instead of by window
+            self._matches = lambda text: map(itemgetter(1), machine.iter_long(text))
+        else:
+            pattern = re.compile(_trie_pattern(self.family_of))
+            self._scan = lambda text, start, end: map(self.family_of.__getitem__, pattern.findall(text, start, end))
+            self._matches = self._windowed
+
+    def windows(self, text):
+        """Disjoint [start, end] stretches of `text` around every anchor, the only places a phrase can be"""
+        spans = []
+        for anchor in self.anchors:
+            position = text.find(anchor)
+            while position != -1:
+                spans.append((max(0, position - self._reach), min(len(text), position + len(anchor) + self._reach)))
+                position = text.find(anchor, position + 1)
+        spans.sort()
+        windows = []
+        for start, end in spans:
+            if windows and start <= windows[-1][1]:
+                windows[-1][1] = max(windows[-1][1], end)
+            else:
+                windows.append([start, end])
+        return windows
+
+    def _windowed(self, text):
+        # str.find runs in C at memory speed, so the regex only ever sees text near an anchor. A match
+        # never crosses from one window into the next, so this finds exactly what a whole-text scan would.
+        for start, end in self.windows(text):
+            yield from self._scan(text, start, end)
+
+    def count(self, text):
+        hits = Counter(self._matches(text))
+        return {family: hits[family] for family in self.families}
+
+
+@lru_cache(maxsize=None)
+def automaton(engine=DEFAULT_ENGINE):
+    """This process's automaton for `engine`, compiled once"""
+    return Automaton(engine=engine)
+
+
+def docx_text(xml):
+    """Text of a DOCX document.xml: each paragraph's w:t runs joined, with its tabs and breaks"""
+    lines = []
+    for paragraph in ElementTree.fromstring(xml).iter(f"{WORD_NS}p"):
+        parts = []
+        for element in paragraph.iter():
+            if element.tag == f"{WORD_NS}t":
+                parts.append(element.text or "")
+            elif element.tag == f"{WORD_NS}tab":
+                parts.append("\t")
+            elif element.tag in (f"{WORD_NS}br", f"{WORD_NS}cr"):
+                parts.append("\n")
+        lines.append("".join(parts))
+    return "\n".join(lines)
+
+
+def extract_text(filename):
+    """Plain text of a generated PDF, DOCX, HTML or text file"""
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == ".pdf":
+        from .verify import extract_text as extract_pdf
+        return extract_pdf(filename)[0]
+    if extension == ".docx":
+        with zipfile.ZipFile(filename) as archive:
+            return docx_text(archive.read("word/document.xml"))
+    with open(filename, encoding="utf-8") as f:
+        text = f.read()
+    if extension == ".html":
+        return html.unescape(re.sub(r"<[^>]+>", " ", text))
+    return text
+
+
+def scan_file(filename, engine=DEFAULT_ENGINE):
+    """Extract and scan one document, returning its result instead of raising"""
+    chars = extract_s = scan_s = hits = error = None
+    # Compiled before timing starts, so the first document's scan time is the scan alone
+    machine = automaton(engine)
+    try:
+        start = time.perf_counter()
+        text = extract_text(filename).lower()
+        extract_s = time.perf_counter() - start
+        start = time.perf_counter()
+        hits = machine.count(text)
+        scan_s = time.perf_counter() - start
+        chars = len(text)
+    except ImportError:
+        raise
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return ScanResult(filename, os.getpid(), chars, extract_s, scan_s, hits, error)
+
+
+def scan_record(result):
+    return {"file": os.path.basename(result.filename), "chars": result.chars, "hits": result.hits}
+
+
+def write_scan_sidecar(result):
+    """Add a scanned document's hit vector to its ground-truth sidecar, or write it next to it without one;
+    returns the record"""
+    record = scan_record(result)
+    if os.path.exists(sidecar_path(result.filename)):
+        truth = read_sidecar(result.filename)
+        truth["scan"] = {"chars": record["chars"], "hits": record["hits"]}
+        path, contents = sidecar_path(result.filename), truth
+        if os.path.exists(scan_sidecar_path(result.filename)):
+            os.remove(scan_sidecar_path(result.filename))
+    else:
+        path, contents = scan_sidecar_path(result.filename), record
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(dumps(contents))
+        f.write("\n")
+    return record
+
+
+def write_scan_index(records, path):
+    """Write hit vectors, one per line, to an NDJSON index"""
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(dumps(record))
+            f.write("\n")
+    return path
+
+
+def merge_truth_index(directory, records):
+    """Add hit vectors to the records of the same files in the directory's ground-truth index;
+    returns its path, or None without one"""
+    path = os.path.join(directory, TRUTH_INDEX)
+    if not os.path.exists(path):
+        return None
+    scans = {record["file"]: {"chars": record["chars"], "hits": record["hits"]} for record in records}
+    with open(path, encoding="utf-8") as f, open(path + ".tmp", "w", encoding="utf-8") as out:
+        for line in f:
+            truth = json.loads(line)
+            if truth.get("file") in scans:
+                truth["scan"] = scans[truth["file"]]
+                line = dumps(truth) + "\n"
+            out.write(line)
+    os.replace(path + ".tmp", path)
+    return path
+
+
+def truth_types(filename):
+    """Clause types in a document's ground-truth sidecar, or None without one"""
+    if not os.path.exists(sidecar_path(filename)):
+        return None
+    return {clause["type"] for clause in read_sidecar(filename)["clauses"]}
+
+
+def collect_files(paths):
+    """Generated documents under `paths`, in name order"""
+    filenames = []
+    for path in paths:
+        if os.path.isdir(path):
+            with os.scandir(path) as entries:
+                filenames += sorted(entry.path for entry in entries
+                                    if os.path.splitext(entry.name)[1].lower() in EXTENSIONS)
+        else:
+            filenames.append(path)
+    return filenames
@@ -0,0 +1,205 @@
+"""
+Sharded corpus generation.
+
+A corpus of `count` documents is split into N shards by document index:
+shard i of N (numbered from 1) builds the contiguous slice
+`Shard(i, N).range(count)`. Every document depends only on the global
+seed and its own index, and keeps its global file name, so nodes can build
+their shards independently and the slices never overlap.
+
+Each shard writes a manifest (`shard-i-of-N.json`) next to its output,
+listing the generator settings and every document it built, with size,
+pages and SHA-256. Renders are byte-reproducible (see `profiles`), so the
+same slice built on another node has the same digests. Once the shards are
+copied into one directory, `merge_shards` checks that they were generated
+with the same settings and together cover the corpus exactly once. It then
+writes one corpus index (`CORPUS_INDEX`), and merges the shards' ground-truth,
+family and SQLite manifests when they have them.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+from collections import namedtuple
+
+from .families import FAMILY_MANIFEST
+from .manifest import CORPUS_DB, CorpusManifest
+from .pdfutil import count_pages
+from .truth import TRUTH_INDEX
+
+CORPUS_INDEX = "corpus-index.ndjson"
+SHARD_SPEC = re.compile(r"^(\d+)/(\d+)$")
+SHARD_MANIFEST = re.compile(r"^shard-(\d+)-of-(\d+)\.json$")
+
+
+class Shard(namedtuple("Shard", ["number", "count"])):
+    __slots__ = ()
+
+    @property
+    def label(self):
+        return f"shard-{self.number}-of-{self.count}"
+
+    def range(self, total):
+        """This shard's slice of document indexes 0..total-1"""
+        return range(total * (self.number - 1) // self.count, total * self.number // self.count)
+
+
+def parse_shard(text):
+    match = SHARD_SPEC.match(text.strip())
+    if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+        raise ValueError(f"Invalid shard '{text}': use i/N with i from 1 to N, e.g. 3/8")
+    return Shard(int(match.group(1)), int(match.group(2)))
+
+
+def file_digest(filename):
+    """SHA-256 of a file's contents"""
+    with open(filename, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def document_record(filename, index, directory):
+    """Manifest entry of one built document; `file` is relative to the manifest's directory"""
+    with open(filename, "rb") as f:
+        data = f.read()
+    return {
+        "file": os.path.relpath(filename, directory),
+        "index": index,
+        "bytes": len(data),
+        "pages": count_pages(data) if filename.endswith(".pdf") else None,
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+
+
+def manifest_path(directory, shard):
+    return os.path.join(directory, f"{shard.label}.json")
+
+
+def write_shard_manifest(directory, shard, settings, total, documents, failed=(), truth_index=None, families=None,
+                         corpus=None):
+    """Write a shard's manifest into `directory`; truth_index, families and corpus are paths to the shard's own"""
+    def relative(path):
+        return os.path.relpath(path, directory) if path is not None else None
+
+    manifest = {
+        "shard": shard.number,
+        "shards": shard.count,
+        "count": total,
+        "range": [shard.range(total).start, shard.range(total).stop],
+        "settings": settings,
+        "truth_index": relative(truth_index),
+        "families": relative(families),
+        "corpus": relative(corpus),
+        "failed": [relative(filename) for filename in failed],
+        "documents": documents,
+    }
+    path = manifest_path(directory, shard)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    return path
+
+
+def load_shard_manifests(directory):
+    """The shard manifests in a directory, in shard order"""
+    manifests = []
+    for path in glob.glob(os.path.join(directory, "shard-*-of-*.json")):
+        if SHARD_MANIFEST.match(os.path.basename(path)):
+            with open(path, encoding="utf-8") as f:
+                manifests.append(json.load(f))
+    return sorted(manifests, key=lambda manifest: (manifest["shard"], manifest["shards"]))
+
+
+def _check(manifests):
+    """Reasons the shards don't make up one corpus; empty when they do"""
+    first = manifests[0]
+    problems = []
+    numbers = [manifest["shard"] for manifest in manifests]
+    for number in sorted({number for number in numbers if numbers.count(number) > 1}):
+        problems.append(f"more than one manifest for shard {number}")
+    for manifest in manifests:
+        number = manifest["shard"]
+        for key in ("shards", "count"):
+            if manifest[key] != first[key]:
+                problems.append(f"shard {number} has {key} {manifest[key]}, shard {first['shard']} has {first[key]}")
+        differing = sorted(key for key in set(manifest["settings"]) | set(first["settings"])
+                           if manifest["settings"].get(key) != first["settings"].get(key))
+        if differing:
+            problems.append(f"shard {number} was generated with different {', '.join(differing)} "
+                            f"than shard {first['shard']}")
+        expected = Shard(number, first["shards"]).range(first["count"])
+        if manifest["range"] != [expected.start, expected.stop]:
+            problems.append(f"shard {number} covers {manifest['range']}, not its own slice")
+        if manifest["failed"]:
+            problems.append(f"shard {number} has {len(manifest['failed'])} failed documents "
+                            f"(e.g. {manifest['failed'][0]})")
+    missing = sorted(set(range(1, first["shards"] + 1)) - set(numbers))
+    if missing:
+        problems.append(f"missing shards {', '.join(map(str, missing))} of {first['shards']}")
+    names, duplicates = {}, []
+    for manifest in manifests:
+        for document in manifest["documents"]:
+            name = os.path.basename(document["file"])
+            if name in names:
+                duplicates.append(f"{name} (shards {names[name]} and {manifest['shard']})")
+            names[name] = manifest["shard"]
+    if duplicates:
+        problems.append(f"{len(duplicates)} documents are in more than one shard, e.g. {duplicates[0]}")
+    return problems
+
+
+def _concatenate(paths, output):
+    with open(output, "w", encoding="utf-8") as out:
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    out.write(line)
+
+
+MergeResult = namedtuple("MergeResult", ["shards", "documents", "bytes", "index", "truth_index", "families",
+                                         "corpus"])
+
+
+def merge_shards(directory):
+    """Merge the shard manifests in `directory` into one corpus index; raises ValueError if they don't fit"""
+    manifests = load_shard_manifests(directory)
+    if not manifests:
+        raise ValueError(f"No shard manifests (shard-i-of-N.json) in {directory}")
+    problems = _check(manifests)
+    if problems:
+        raise ValueError("Shards don't make up one corpus:\n" + "\n".join(f"- {problem}" for problem in problems))
+
+    index = os.path.join(directory, CORPUS_INDEX)
+    documents = total_bytes = 0
+    with open(index, "w", encoding="utf-8") as f:
+        for manifest in manifests:
+            for document in sorted(manifest["documents"], key=lambda document: (document["index"], document["file"])):
+                f.write(json.dumps(dict(document, shard=manifest["shard"]), separators=(",", ":")))
+                f.write("\n")
+                documents += 1
+                total_bytes += document["bytes"]
+
+    truth_index = families = corpus = None
+    if all(manifest["truth_index"] for manifest in manifests):
+        truth_index = os.path.join(directory, TRUTH_INDEX)
+        _concatenate([os.path.join(directory, manifest["truth_index"]) for manifest in manifests], truth_index)
+    if all(manifest["families"] for manifest in manifests):
+        merged = []
+        for manifest in manifests:
+            with open(os.path.join(directory, manifest["families"]), encoding="utf-8") as f:
+                merged += json.load(f)
+        families = os.path.join(directory, FAMILY_MANIFEST)
+        with open(families, "w", encoding="utf-8") as f:
+            json.dump(merged, f, indent=2)
+            f.write("\n")
+    # Manifests from before shards recorded their SQLite manifest have no "corpus"
+    if all(manifest.get("corpus") for manifest in manifests):
+        corpus = os.path.join(directory, CORPUS_DB)
+        with CorpusManifest(directory) as merged:
+            for manifest in manifests:
+                shard_dir = os.path.dirname(os.path.join(directory, manifest["corpus"]))
+                if os.path.abspath(shard_dir) != os.path.abspath(directory):
+                    merged.merge(shard_dir, [os.path.join(directory, document["file"])
+                                             for document in manifest["documents"]])
+    return MergeResult(len(manifests), documents, total_bytes, index, truth_index, families, corpus)
@@ -0,0 +1,172 @@
+"""
+Size-targeted stress fixtures.
+
+A target is a byte size ("9.9MB", "500KB") or a page count ("200 pages").
+Page targets are reached by padding the contract with more of its own
+clauses. Byte targets are reached by appending scanned exhibit pages (see
+`images`), the way large real-world uploads get their weight, or by padding
+clauses for plain text, which cannot carry images. Each attempt is
+rendered and measured, and the padding corrected, until the output lands
+within tolerance of the target.
+"""
+
+import json
+import math
+import os
+import re
+import time
+from dataclasses import dataclass, replace
+
+from .backends import select_backend
+from .images import SCAN_PAGE, scan_jpeg
+from .pdfutil import count_pages
+from .render import render_bytes
+from .spec import Block, Document
+from .streaming import pad_document
+
+# /api/analyze-contract rejects larger uploads, and gives up after maxDuration
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+ROUTE_MAX_DURATION_S = 60
+
+UNITS = {"b": 1, "kb": 1024, "mb": 1024 * 1024}
+TARGET_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(b|kb|mb|p|pages?)\s*$", re.IGNORECASE)
+MAX_ATTEMPTS = 8
+SIZE_MANIFEST = "size-targets.json"
+
+
+@dataclass(frozen=True)
+class Target:
+    kind: str       # "bytes" or "pages"
+    value: int
+    label: str
+
+    @property
+    def expect(self):
+        """What the analyze route should do with a fixture of this size"""
+        return "rejected" if self.kind == "bytes" and self.value > MAX_UPLOAD_BYTES else "accepted"
+
+    def tolerance(self):
+        return max(4 * 1024, self.value // 500) if self.kind == "bytes" else 0
+
+
+def parse_target(text):
+    """Parse "9.9MB", "500 KB", "200 pages" or "200p" into a Target"""
+    match = TARGET_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Invalid size target '{text}': use e.g. 9.9MB, 500KB or 200pages")
+    number, unit = float(match.group(1)), match.group(2).lower()
+    label = f"{match.group(1)}{'pages' if unit.startswith('p') else unit.upper()}"
+    if unit.startswith("p"):
+        return Target("pages", max(1, int(number)), label)
+    return Target("bytes", int(number * UNITS[unit]), label)
+
+
+@dataclass
+class SizedFixture:
+    document: Document
+    data: bytes
+    target: Target
+    backend: str
+    pages: int
+    render_seconds: float
+    attempts: int
+
+    @property
+    def bytes(self):
+        return len(self.data)
+
+    @property
+    def within_tolerance(self):
+        if self.target.kind == "pages":
+            return self.pages is not None and self.pages >= self.target.value
+        return abs(self.bytes - self.target.value) <= self.target.tolerance()
+
+    def record(self, filename):
+        """Manifest entry for this fixture"""
+        return {
+            "filename": filename,
+            "target": self.target.label,
+            "backend": self.backend,
+            "bytes": self.bytes,
+            "mb": round(self.bytes / (1024 * 1024), 3),
+            "pages": self.pages,
+            "render_s": round(self.render_seconds, 3),
+            "attempts": self.attempts,
+            "expect": self.target.expect,
+        }
+
+
+def load_manifest(directory):
+    """Size fixture records of an output directory, by filename"""
+    try:
+        with open(os.path.join(directory, SIZE_MANIFEST), encoding="utf-8") as f:
+            return {record["filename"]: record for record in json.load(f)}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(directory, records):
+    with open(os.path.join(directory, SIZE_MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(sorted(records.values(), key=lambda record: record["filename"]), f, indent=2)
+        f.write("\n")
+
+
+def with_exhibits(document, image_bytes):
+    """A copy of `document` with about `image_bytes` of scanned exhibit pages appended"""
+    width, full_height = SCAN_PAGE
+    page_bytes = len(scan_jpeg(width, full_height))
+    heights = [full_height] * int(image_bytes // page_bytes)
+    rest = round((image_bytes % page_bytes) / page_bytes * full_height)
+    if rest >= 8:
+        heights.append(rest)
+    blocks = list(document.blocks)
+    for number, height in enumerate(heights, 1):
+        blocks.append(Block("heading", f"EXHIBIT {number}: SCANNED ATTACHMENT"))
+        blocks.append(Block("image", (width, height, number)))
+    return replace(document, blocks=tuple(blocks))
+
+
+def _measure(document, backend, profile, options):
+    start = time.perf_counter()
+    data = render_bytes(document, backend.name, profile, **options)
+    seconds = time.perf_counter() - start
+    return data, seconds, count_pages(data) if backend.format == "pdf" else None
+
+
+def fit_document(document, target, backend="reportlab", profile=None, **options):
+    """Pad `document` until its rendered output meets `target`; returns a SizedFixture"""
+    backend = select_backend(backend)
+    if target.kind == "pages" and backend.format != "pdf":
+        raise ValueError(f"Page targets need a PDF backend, not {backend.name}")
+    clauses = sum(1 for block in document.blocks if block.kind == "heading")
+    use_images = target.kind == "bytes" and backend.format != "txt"
+
+    extra = 0                # extra clauses, or bytes of exhibit images
+    base_bytes = None
+    candidate = document
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        data, seconds, pages = _measure(candidate, backend, profile, options)
+        fixture = SizedFixture(candidate, data, target, backend.name, pages, seconds, attempt)
+        if fixture.within_tolerance:
+            break
+        if target.kind == "pages":
+            per_page = (clauses + extra) / max(pages, 1)
+            extra += math.ceil((target.value - pages) * per_page) + 1
+            candidate = pad_document(document, extra)
+            continue
+        missing = target.value - len(data)
+        if use_images:
+            if base_bytes is None:
+                base_bytes = len(data)
+            elif len(data) > base_bytes:
+                # Scans cost a little more embedded than as raw JPEG (e.g. ASCII85 in reportlab)
+                missing = missing * extra / (len(data) - base_bytes)
+            extra = max(0, extra + missing)
+            candidate = with_exhibits(document, extra)
+        else:
+            per_clause = len(data) / (clauses + extra)
+            extra = max(0, extra + round(missing / per_clause))
+            candidate = pad_document(document, extra)
+        if missing < 0 and extra == 0:
+            break  # The bare document is already bigger than the target
+    return fixture
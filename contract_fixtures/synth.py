@@ -0,0 +1,138 @@
+"""
+Seeded synthetic contract specs.
+
+`generate_spec(seed, index)` always returns the same spec for the same
+arguments, so a corpus can be regenerated (or extended) exactly. Parties,
+amounts, dates, terms, clause order and the mix of benign and predatory
+clauses all vary per document.
+"""
+
+import datetime
+import random
+import re
+
+from .clauses import (CITIES, COMPANIES, COMPANY_PREFIXES, COMPANY_SUFFIXES, CONTRACT_TYPES, FIRST_NAMES,
+                      LAST_NAMES, STATES, STREETS, TITLES)
+from .spec import compile_spec
+
+# Probability that a clause with a predatory variant uses it
+RISK_LEVELS = {"low": 0.0, "medium": 0.35, "high": 0.8}
+
+FIRST_DATE = datetime.date(2023, 1, 1)
+DATE_RANGE_DAYS = 4 * 365
+# Counts can be drawn as 1 ("for a period of 1 years"), so templates' plural units are made to agree
+SINGULAR = re.compile(r"(?<![\d.])1 (hour|day|week|month|year)s\b")
+
+
+def money(amount):
+    return f"${amount:,}"
+
+
+def _company(rng):
+    if rng.random() < 0.2:
+        return rng.choice(COMPANIES)
+    return f"{rng.choice(COMPANY_PREFIXES)} {rng.choice(COMPANY_SUFFIXES)}"
+
+
+def _person(rng):
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def draw_values(rng, contract_type):
+    """Draw every template value a contract of this type might use"""
+    date = FIRST_DATE + datetime.timedelta(days=rng.randrange(DATE_RANGE_DAYS))
+    installment = rng.randrange(5, 170) * 1000
+    rent = rng.randrange(8, 60) * 100
+    city, state_code, zip_code = rng.choice(CITIES)
+    party_a = _company(rng)
+    party_b = _company(rng)
+    while party_b == party_a:
+        party_b = _company(rng)
+    return {
+        "contract_type": contract_type,
+        "party_a": party_a,
+        "party_b": party_b,
+        "person_a": _person(rng),
+        "person_b": _person(rng),
+        "title_a": rng.choice(TITLES),
+        "title_b": rng.choice(TITLES),
+        "date": f"{date:%B} {date.day}, {date.year}",
+        "total": money(installment * 3),
+        "installment": money(installment),
+        "months": rng.choice([3, 6, 12, 18, 24, 36]),
+        "notice_days": rng.choice([7, 14, 30, 60, 90]),
+        "term_years": rng.choice([3, 5, 7, 10]),
+        "renewal_notice_months": rng.choice([6, 12, 18]),
+        "confidentiality_years": rng.choice([1, 2, 3, 5]),
+        "liability_cap": money(rng.randrange(1, 50) * 1000),
+        "nominal_cap": money(rng.choice([1, 10, 100])),
+        "penalty": money(rng.randrange(25, 500) * 1000),
+        "non_compete_years": rng.choice([5, 10, 15]),
+        "non_solicit_years": rng.choice([10, 15, 20]),
+        "state": rng.choice(STATES),
+        "job_title": rng.choice(["Senior Software Engineer", "Product Manager", "Data Analyst",
+                                 "Account Executive", "Operations Lead"]),
+        "salary": money(rng.randrange(45, 250) * 1000),
+        "bonus_percent": rng.choice([5, 10, 15, 20]),
+        "vacation_days": rng.choice([10, 15, 20, 25]),
+        "address": f"{rng.randrange(1, 9999)} {rng.choice(STREETS)}, {city}, {state_code} {zip_code}",
+        "rent": money(rent),
+        "late_fee": money(rng.choice([25, 50, 75, 100])),
+        "deposit": money(rent * rng.choice([1, 2]) + rent // 2),
+    }
+
+
+def _fill(texts, values):
+    return [SINGULAR.sub(r"1 \1", text.format(**values)) for text in texts]
+
+
+def generate_spec(seed, index=0, contract_type=None, risk=None):
+    """Generate the spec dict for document `index` of the corpus seeded with `seed`"""
+    rng = random.Random(f"{seed}:{index}")
+    contract_type = contract_type or rng.choice(sorted(CONTRACT_TYPES))
+    risk = risk or rng.choice(sorted(RISK_LEVELS))
+    template = CONTRACT_TYPES[contract_type]
+    values = draw_values(rng, contract_type)
+    predatory_rate = RISK_LEVELS[risk]
+
+    clauses = []
+    for slot in template["clauses"]:
+        predatory = "predatory" in slot and rng.random() < predatory_rate
+        if not predatory and "benign" not in slot:
+            continue
+        variant = slot["predatory" if predatory else "benign"]
+        clauses.append({
+            "type": slot["type"],
+            "risk": "predatory" if predatory else "benign",
+            "heading": slot["heading"],
+            "body": _fill(variant.get("body", []), values),
+            "bullets": _fill(variant.get("bullets", []), values),
+        })
+    # The opening clauses (services, payment, ...) stay put; the rest are shuffled
+    leading = template["leading"]
+    rest = clauses[leading:]
+    rng.shuffle(rest)
+    clauses = clauses[:leading] + rest
+
+    role_a, role_b = template["roles"]
+    if "{person_b}" in template["preamble"]:
+        party_b = {"name": role_b, "signatory": values["person_b"]}
+    else:
+        party_b = {"name": values["party_b"], "signatory": f"{values['person_b']}, {values['title_b']}"}
+    title = template["title"]
+    closing = template["closing"]
+
+    return {
+        "id": f"synthetic-{contract_type}-{seed}-{index:06d}",
+        "title": title,
+        "preamble": [template["preamble"].format(**values)],
+        "parties": [{"name": values["party_a"], "signatory": f"{values['person_a']}, {values['title_a']}"}, party_b],
+        "clauses": clauses,
+        "closing": closing.format(title_case=title.title()) if closing else None,
+        "meta": {"seed": seed, "index": index, "contract_type": contract_type, "risk": risk, "values": values},
+    }
+
+
+def synthesize(seed, index=0, contract_type=None, risk=None):
+    """Generate and compile a synthetic contract"""
+    return compile_spec(generate_spec(seed, index, contract_type=contract_type, risk=risk))
@@ -0,0 +1,176 @@
+"""
+Per-stage render timings.
+
+Generation time is split into stages: the first `import` of a backend and
+its library, building the document `content`, constructing reportlab
+`paragraphs`, `layout` (doc.build, or fpdf2's cell calls) and `output`
+serialization (canvas.save, pdf.output). Whatever a backend does outside
+those is its `render` stage. Stages nest, and each is
+charged only for its own time, so a document's stages add up to the time
+spent inside them.
+
+Code marks its stages with `stage(name)`, which returns one shared no-op
+context manager unless `record_stages()` is active in this process, so
+timing costs next to nothing when it is off. Records are written as NDJSON
+and summarized in the Prometheus text format; the slowest documents can be
+rendered again under cProfile.
+"""
+
+import cProfile
+import json
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+from .stats import percentile
+
+STAGES = ("import", "content", "paragraphs", "layout", "output", "render")
+TIMINGS_REPORT = "timings.ndjson"
+TIMINGS_SUMMARY = "timings.prom"
+QUANTILES = (0.5, 0.95, 0.99)
+HOTTEST = 5
+
+_OFF = nullcontext()
+_timer = None
+
+
+class StageTimer:
+    """Exclusive time per stage: entering a stage pauses the one it is nested in"""
+
+    def __init__(self):
+        self.seconds = defaultdict(float)
+        self._stack = []
+        self._mark = time.perf_counter()
+
+    def _charge(self):
+        now = time.perf_counter()
+        if self._stack:
+            self.seconds[self._stack[-1]] += now - self._mark
+        self._mark = now
+
+    @contextmanager
+    def stage(self, name):
+        self._charge()
+        self._stack.append(name)
+        try:
+            yield
+        finally:
+            self._charge()
+            self._stack.pop()
+
+
+def stage(name):
+    """Time a stage of the document being recorded; a shared no-op when nothing is"""
+    return _OFF if _timer is None else _timer.stage(name)
+
+
+@contextmanager
+def record_stages(enabled=True):
+    """Record the stages of one document in this process; yields {stage: seconds}, or None when disabled"""
+    global _timer
+    if not enabled:
+        yield None
+        return
+    _timer = StageTimer()
+    try:
+        yield _timer.seconds
+    finally:
+        _timer = None
+
+
+def timing_record(filename, backend, seconds, total):
+    """NDJSON record of one document's stage timings"""
+    return {
+        "file": os.path.basename(filename),
+        "backend": backend,
+        "total_s": round(total, 6),
+        "stages": {name: round(seconds[name], 6) for name in STAGES if name in seconds},
+    }
+
+
+def _labels(labels):
+    return ",".join(f'{key}="{value}"' for key, value in labels)
+
+
+def prometheus_summary(records):
+    """Prometheus text-format summaries of document and stage seconds, per backend"""
+    totals, stages = defaultdict(list), defaultdict(list)
+    for record in records:
+        totals[record["backend"]].append(record["total_s"])
+        for name, seconds in record["stages"].items():
+            stages[record["backend"], name].append(seconds)
+
+    lines = []
+
+    def summary(metric, help_text, series):
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} summary")
+        for labels, values in sorted(series.items()):
+            values = sorted(values)
+            for quantile in QUANTILES:
+                lines.append(f'{metric}{{{_labels(labels + (("quantile", quantile),))}}} '
+                             f'{percentile(values, quantile * 100):.6f}')
+            lines.append(f"{metric}_sum{{{_labels(labels)}}} {sum(values):.6f}")
+            lines.append(f"{metric}_count{{{_labels(labels)}}} {len(values)}")
+
+    summary("contract_fixtures_document_seconds", "Time to generate one document.",
+            {(("backend", backend),): values for backend, values in totals.items()})
+    summary("contract_fixtures_stage_seconds", "Time one document spent in a generation stage.",
+            {(("backend", backend), ("stage", name)): values for (backend, name), values in stages.items()})
+    return "\n".join(lines) + "\n"
+
+
+def write_timings(records, directory):
+    """Write timing records to the directory's NDJSON report and Prometheus summary; returns both paths"""
+    report = os.path.join(directory, TIMINGS_REPORT)
+    with open(report, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, separators=(",", ":")))
+            f.write("\n")
+    summary = os.path.join(directory, TIMINGS_SUMMARY)
+    with open(summary, "w", encoding="utf-8") as f:
+        f.write(prometheus_summary(records))
+    return report, summary
+
+
+def profile_call(path, function, *args):
+    """Run `function(*args)` under cProfile, dump the stats to `path`; returns its hottest functions"""
+    profiler = cProfile.Profile()
+    profiler.runcall(function, *args)
+    profiler.dump_stats(path)
+    profiler.create_stats()
+    hottest = sorted(profiler.stats.items(), key=lambda item: item[1][2], reverse=True)[:HOTTEST]
+    return [(f"{name} ({os.path.basename(filename)}:{line})", own)
+            for (filename, line, name), (_, _, own, _, _) in hottest]
+
+
+def report_timings(records, directory, slowest=0, rerun=None):
+    """Write and summarize timing records, then profile the `slowest` documents with `rerun(filename)`"""
+    if not records:
+        print("⚠️ No documents were rendered, so there are no timings (use --no-cache to rebuild)")
+        return
+    report, summary = write_timings(records, directory)
+    print(f"\nStage timings ({report}, {summary}):")
+    by_backend = defaultdict(list)
+    for record in records:
+        by_backend[record["backend"]].append(record)
+    for backend, backend_records in sorted(by_backend.items()):
+        total = sum(record["total_s"] for record in backend_records)
+        shares = ", ".join(f"{name} {sum(record['stages'].get(name, 0) for record in backend_records) / total:.0%}"
+                           for name in STAGES if any(name in record["stages"] for record in backend_records))
+        print(f"- {backend}: {total / len(backend_records) * 1000:.1f} ms/doc over {len(backend_records)} "
+              f"documents ({shares})")
+    if not slowest:
+        return
+    print(f"\nProfiling the {min(slowest, len(records))} slowest documents:")
+    ranked = sorted(records, key=lambda record: record["total_s"], reverse=True)[:slowest]
+    # One untimed run first, so imports and regex compiles in this process stay out of the profiles
+    rerun(os.path.join(directory, ranked[0]["file"]))
+    for record in ranked:
+        filename = os.path.join(directory, record["file"])
+        path = os.path.splitext(filename)[0] + ".prof"
+        hottest = profile_call(path, rerun, filename)
+        print(f"- {record['file']} ({record['total_s'] * 1000:.0f} ms) -> {path}")
+        for name, own in hottest:
+            print(f"    {own * 1000:8.1f} ms  {name}")
@@ -0,0 +1,203 @@
+"""
+Scheduled arrivals for load tests.
+
+Real uploads to `/api/analyze-contract` don't arrive at a fixed concurrency:
+they come in month-end review bursts and team uploads after onboarding. An
+arrival profile is a sequence of send times, in seconds from the start:
+
+    poisson:RATE                  random arrivals averaging RATE requests/s
+    ramp:RATE@SECONDS,...         Poisson arrivals stepping through each RATE for SECONDS
+    burst:SIZE@EVERY[,RATE]       SIZE requests at once every EVERY seconds, over RATE requests/s of background
+    replay:FILE                   the timestamps of a recorded log (epoch seconds or ISO 8601, one per line)
+
+Requests are sent open loop: each goes out at its time however many are
+still in flight, so a slow server builds a backlog as it would in
+production. Fixtures come from a bounded queue that a generator fills just
+in time, rendering in a worker thread; when the queue is full the generator
+waits, so only `queue_size` documents are held ahead of the schedule.
+"""
+
+import asyncio
+import datetime
+import itertools
+import random
+import time
+
+from .loadtest import LoadTestResult, TEST_ORGANIZATION_ID, post_fixture
+from .stats import percentile
+
+DEFAULT_QUEUE_SIZE = 16
+
+
+def poisson(rate, rng):
+    """Endless arrivals averaging `rate` per second, with exponential gaps"""
+    offset = 0.0
+    while True:
+        offset += rng.expovariate(rate)
+        yield offset
+
+
+def ramp(steps, rng):
+    """Poisson arrivals at each (rate, seconds) step in turn"""
+    start = 0.0
+    for rate, seconds in steps:
+        if rate > 0:
+            for offset in poisson(rate, rng):
+                if offset >= seconds:
+                    break
+                yield start + offset
+        start += seconds
+
+
+def bursts(size, every, rate, rng):
+    """`size` arrivals at once every `every` seconds, merged with Poisson background arrivals at `rate`"""
+    def burst_times():
+        for number in itertools.count():
+            yield from itertools.repeat(number * every, size)
+    background = poisson(rate, rng) if rate > 0 else iter(())
+    # Both are endless and sorted, so a merge keeps them in order
+    yield from _merge(burst_times(), background)
+
+
+def _merge(first, second):
+    a, b = next(first, None), next(second, None)
+    while a is not None or b is not None:
+        if b is None or (a is not None and a <= b):
+            yield a
+            a = next(first, None)
+        else:
+            yield b
+            b = next(second, None)
+
+
+def _timestamp(text):
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    moment = datetime.datetime.fromisoformat(text)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=datetime.timezone.utc)
+    return moment.timestamp()
+
+
+def replay(path):
+    """Arrivals at the timestamps of a recorded log, relative to its earliest one"""
+    timestamps = []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            field = line.split(",", 1)[0].strip()
+            if not field or field.startswith("#"):
+                continue
+            try:
+                timestamps.append(_timestamp(field))
+            except ValueError:
+                raise ValueError(f"{path}:{number}: '{field}' is not a timestamp") from None
+    if not timestamps:
+        raise ValueError(f"{path} has no timestamps to replay")
+    timestamps.sort()
+    return [timestamp - timestamps[0] for timestamp in timestamps]
+
+
+def _number(text, spec):
+    try:
+        value = float(text)
+    except ValueError:
+        value = -1
+    if value < 0:
+        raise ValueError(f"Invalid arrival profile '{spec}': '{text}' is not a rate or duration")
+    return value
+
+
+def parse_arrivals(spec, seed=0, speed=1.0):
+    """Send times of an arrival profile spec (see the module docstring), sped up by `speed`"""
+    kind, _, value = spec.partition(":")
+    rng = random.Random(f"arrivals:{seed}")
+    if kind == "poisson" and value:
+        rate = _number(value, spec)
+        if not rate:
+            raise ValueError(f"Invalid arrival profile '{spec}': the rate must be above 0")
+        offsets = poisson(rate, rng)
+    elif kind == "ramp" and value:
+        steps = []
+        for step in value.split(","):
+            rate, _, seconds = step.partition("@")
+            steps.append((_number(rate, spec), _number(seconds, spec)))
+        offsets = ramp(steps, rng)
+    elif kind == "burst" and value:
+        burst, _, rate = value.partition(",")
+        size, _, every = burst.partition("@")
+        if not size.isdigit() or int(size) < 1 or not every or _number(every, spec) == 0:
+            raise ValueError(f"Invalid arrival profile '{spec}': use burst:SIZE@EVERY[,RATE], e.g. burst:50@30,2")
+        offsets = bursts(int(size), _number(every, spec), _number(rate, spec) if rate else 0.0, rng)
+    elif kind == "replay" and value:
+        offsets = replay(value)
+    else:
+        raise ValueError(f"Invalid arrival profile '{spec}': use poisson:RATE, ramp:RATE@SECONDS,..., "
+                         "burst:SIZE@EVERY[,RATE] or replay:FILE")
+    return (offset / speed for offset in offsets)
+
+
+async def _produce(queue, source):
+    """Fill `queue` from the `source` iterator, one fixture at a time, waiting while it is full"""
+    loop = asyncio.get_running_loop()
+    while True:
+        fixture = await loop.run_in_executor(None, next, source, None)
+        await queue.put(fixture)
+        if fixture is None:
+            return
+
+
+async def run_scheduled(url, source, arrivals, requests=None, queue_size=DEFAULT_QUEUE_SIZE, profile=None,
+                        organization_id=TEST_ORGANIZATION_ID, user_id=None, timeout=300):
+    """POST fixtures from the `source` iterator at each of the `arrivals` send times, up to `requests` of them"""
+    import aiohttp
+
+    samples, lags = [], []
+    in_flight = peak = waits = 0
+    queue = asyncio.Queue(maxsize=queue_size)
+    producer = asyncio.create_task(_produce(queue, source))
+    pending = set()
+    connector = aiohttp.TCPConnector(limit=0)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+        async def send(fixture):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                samples.append(await post_fixture(session, url, fixture, organization_id, user_id))
+            finally:
+                in_flight -= 1
+
+        start = time.perf_counter()
+        try:
+            for offset in itertools.islice(arrivals, requests):
+                if queue.empty():
+                    waits += 1
+                fixture = await queue.get()
+                if fixture is None:
+                    break
+                delay = start + offset - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                lags.append(max(0.0, time.perf_counter() - start - offset))
+                task = asyncio.create_task(send(fixture))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            await asyncio.gather(*pending)
+        finally:
+            producer.cancel()
+        elapsed = time.perf_counter() - start
+
+    lags.sort()
+    schedule = {
+        "profile": profile,
+        "queue_size": queue_size,
+        "lag_p50_ms": round(percentile(lags, 50) * 1000, 1),
+        "lag_p95_ms": round(percentile(lags, 95) * 1000, 1),
+        "lag_max_ms": round(lags[-1] * 1000, 1) if lags else 0.0,
+        "generator_waits": waits,
+    }
+    return LoadTestResult(samples, elapsed, peak, schedule)
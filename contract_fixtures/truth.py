@@ -0,0 +1,128 @@
+"""
+Ground-truth sidecars for generated contracts.
+
+Everything the generator knows about a document (clause types, which
+clauses are risky, and every amount, date, duration and percentage it
+wrote) is recorded with character offsets into `expected_text(document)`,
+the text an extractor should get back. A sidecar is one compact JSON object
+written next to the rendered file; batch runs also collect them into one
+NDJSON index so evaluation is a lookup, not a re-read of every document.
+
+Offsets are Python string indices (code points). The only non-ASCII
+character the generators emit is "•", so they match JavaScript's UTF-16
+offsets too.
+"""
+
+import json
+import os
+import re
+
+SIDECAR_SUFFIX = ".truth.json"
+TRUTH_INDEX = "truth.ndjson"
+
+MONTHS = "January|February|March|April|May|June|July|August|September|October|November|December"
+VALUE_PATTERNS = {
+    "money": re.compile(r"\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?(?![\d,]\d)"),
+    "date": re.compile(rf"\b(?:{MONTHS}) \d{{1,2}}, \d{{4}}\b"),
+    "duration": re.compile(r"\b\d+(?:-| )(?:hour|day|week|month|year)s?\b"),
+    "percent": re.compile(r"\b\d+(?:\.\d+)?%"),
+}
+
+
+def expected_text(document):
+    """The plain text of a document, one line per text line, as the txt backend writes it"""
+    return "".join(f"{line}\n" for line in document.lines())
+
+
+def sidecar_path(filename):
+    return os.path.splitext(filename)[0] + SIDECAR_SUFFIX
+
+
+def _heading_name(text):
+    return text.split(". ", 1)[-1]
+
+
+def ground_truth(document):
+    """The ground-truth record of a compiled document"""
+    meta = document.meta or {}
+    annotations = {clause["heading"]: clause for clause in meta.get("clauses", [])}
+
+    text = expected_text(document)
+    clauses, values = [], []
+    offset = 0
+    current = None
+    for block in document.blocks:
+        start = offset
+        for line in block.lines():
+            for kind, pattern in VALUE_PATTERNS.items():
+                for match in pattern.finditer(line):
+                    values.append({
+                        "kind": kind,
+                        "text": match.group(),
+                        "start": offset + match.start(),
+                        "end": offset + match.end(),
+                        "clause": current["number"] if current else None,
+                    })
+            offset += len(line) + 1
+        if block.kind == "heading":
+            annotation = annotations.get(_heading_name(block.text), {})
+            current = {
+                "number": len(clauses) + 1,
+                "heading": block.text,
+                "type": annotation.get("type"),
+                "risk": annotation.get("risk"),
+                "start": start,
+                "end": offset - 1,
+            }
+            clauses.append(current)
+        elif block.kind == "space":
+            current = None
+        elif current is not None:
+            current["end"] = offset - 1
+    values.sort(key=lambda value: value["start"])
+
+    record = {
+        "id": document.id,
+        "title": document.title,
+        "chars": offset,
+        "clauses": clauses,
+        "values": values,
+        "risk_flags": sorted({clause["type"] for clause in clauses if clause["risk"] == "predatory"}),
+    }
+    for key in ("contract_type", "risk", "seed", "index", "base", "similarity"):
+        if key in meta:
+            record[key] = meta[key]
+    if "values" in meta:
+        # Named template values (penalty, liability_cap, ...) that made it into the text
+        record["fields"] = {name: value for name, value in meta["values"].items()
+                            if isinstance(value, str) and value in text and name != "contract_type"}
+    return record
+
+
+def dumps(record):
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+
+def write_sidecar(document, filename):
+    """Write the ground truth for `filename` next to it; returns the record"""
+    record = ground_truth(document)
+    record["file"] = os.path.basename(filename)
+    with open(sidecar_path(filename), "w", encoding="utf-8") as f:
+        f.write(dumps(record))
+        f.write("\n")
+    return record
+
+
+def read_sidecar(filename):
+    with open(sidecar_path(filename), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_index(records, directory):
+    """Write sidecar records, one per line, to the directory's NDJSON index"""
+    path = os.path.join(directory, TRUTH_INDEX)
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(dumps(record))
+            f.write("\n")
+    return path
@@ -0,0 +1,145 @@
+"""
+Round-trip text verification for generated PDFs.
+
+Each PDF is read back with pypdf, a pure-Python extractor like the ones
+upload pipelines use, and compared with the text its spec should produce
+(`truth.expected_text`). The comparison is word by word: line wrapping and
+column spacing are layout, but every character of every word has to come
+back, so a "•" bullet that renders as "-" is a mismatch.
+
+Which spec a file came from is read off its name, as the generators write
+it: "<spec>-000042.pdf" and "synthetic-000042.pdf" for batch documents,
+"test-<spec>.pdf" for the default ones. Other files (size-targeted or
+streamed fixtures) are skipped.
+
+Requires pypdf: pip install pypdf
+"""
+
+import difflib
+import os
+import re
+import time
+from collections import namedtuple
+
+from .spec import builtin_spec_path, builtin_specs, load_document
+from .synth import synthesize
+from .truth import expected_text
+
+EXTRACTOR = "pypdf"
+VERIFY_REPORT = "extraction-report.ndjson"
+MAX_DIFFS = 5
+BATCH_NAME = re.compile(r"^(?P<kind>.+)-(?P<index>\d{6})$")
+
+# A check is one PDF and where its expected text comes from: a spec file path,
+# or a (seed, index, risk) synthetic document
+Check = namedtuple("Check", ["filename", "source"])
+Verification = namedtuple("Verification", ["filename", "pid", "pages", "seconds", "error", "words", "changed",
+                                           "diffs"])
+
+
+def extract_text(filename):
+    """Text of every page of a PDF, as pypdf extracts it; returns (text, pages)"""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise ImportError("pypdf library not found. Please install it with: pip install pypdf") from None
+    reader = PdfReader(filename)
+    return "\n".join(page.extract_text() or "" for page in reader.pages), len(reader.pages)
+
+
+def word_diff(expected, extracted, limit=MAX_DIFFS):
+    """(words changed, first `limit` differences) between two word lists"""
+    if expected == extracted:
+        return 0, []
+    changed, diffs = 0, []
+    matcher = difflib.SequenceMatcher(None, expected, extracted, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        changed += max(i2 - i1, j2 - j1)
+        if len(diffs) < limit:
+            diffs.append({"word": i1, "expected": " ".join(expected[i1:i2]), "extracted": " ".join(extracted[j1:j2])})
+    return changed, diffs
+
+
+def spec_names(spec_paths=()):
+    """Spec file paths by the name generated files carry: the bundled specs plus `spec_paths`"""
+    specs = {name: builtin_spec_path(name) for name in builtin_specs()}
+    specs.update((os.path.splitext(os.path.basename(path))[0], path) for path in spec_paths)
+    return specs
+
+
+def resolve_source(filename, specs, synthetic=None):
+    """Where the expected text of a generated file comes from, or None if its name doesn't say"""
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    match = BATCH_NAME.match(stem)
+    if match and match.group("kind") == "synthetic":
+        if synthetic is None:
+            return None
+        seed, risk = synthetic
+        return seed, int(match.group("index")), risk
+    if match and match.group("kind") in specs:
+        return specs[match.group("kind")]
+    # test-service-agreement.pdf, simple-test-contract.pdf
+    return specs.get(stem.replace("test-", "", 1))
+
+
+def collect_checks(paths, spec_paths=(), synthetic=None):
+    """(checks, skipped filenames) for the PDFs under `paths`, in name order"""
+    filenames = []
+    for path in paths:
+        if os.path.isdir(path):
+            with os.scandir(path) as entries:
+                filenames += sorted(entry.path for entry in entries if entry.name.endswith(".pdf"))
+        else:
+            filenames.append(path)
+    specs = spec_names(spec_paths)
+    checks, skipped = [], []
+    for filename in filenames:
+        source = resolve_source(filename, specs, synthetic)
+        if source is None:
+            skipped.append(filename)
+        else:
+            checks.append(Check(filename, source))
+    return checks, skipped
+
+
+def expected_document(source):
+    if isinstance(source, str):
+        return load_document(source)
+    seed, index, risk = source
+    return synthesize(seed, index, risk=risk)
+
+
+def verify(check):
+    """Extract one PDF and diff it against its spec, returning the result instead of raising"""
+    pages = seconds = error = None
+    words = changed = 0
+    diffs = []
+    try:
+        expected = expected_text(expected_document(check.source)).split()
+        start = time.perf_counter()
+        text, pages = extract_text(check.filename)
+        seconds = time.perf_counter() - start
+        words = len(expected)
+        changed, diffs = word_diff(expected, text.split())
+    except ImportError:
+        raise
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return Verification(check.filename, os.getpid(), pages, seconds, error, words, changed, diffs)
+
+
+def report_record(result):
+    """NDJSON report line for one verified file"""
+    return {
+        "file": result.filename,
+        "extractor": EXTRACTOR,
+        "ok": result.error is None and result.changed == 0,
+        "error": result.error,
+        "pages": result.pages,
+        "extract_ms": round(result.seconds * 1000, 2) if result.seconds is not None else None,
+        "words": result.words,
+        "changed_words": result.changed,
+        "diffs": result.diffs,
+    }
@@ -3,75 +3,52 @@
 Create a simple, clean PDF contract for testing
 """
 
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.units import inch
+import argparse
+import time
 
-def create_simple_contract():
-    """Create a simple, clean contract PDF"""
-    doc = SimpleDocTemplate("simple-test-contract.pdf", pagesize=letter,
-                           rightMargin=72, leftMargin=72,
-                           topMargin=72, bottomMargin=18)
-    
-    styles = getSampleStyleSheet()
-    story = []
-    
-    # Title
-    title = Paragraph("SERVICE AGREEMENT", styles['Title'])
-    story.append(title)
-    story.append(Spacer(1, 12))
-    
-    # Contract content
-    content = [
-        "This Service Agreement is entered into between:",
-        "",
-        "CLIENT: ABC Company",
-        "SERVICE PROVIDER: XYZ Services",
-        "",
-        "1. SERVICES",
-        "Provider will deliver web development services including:",
-        "- Website design and development",
-        "- Monthly maintenance and updates",
-        "- Technical support",
-        "",
-        "2. PAYMENT TERMS",
-        "- Total contract value: $5,000",
-        "- Payment: 50% upfront, 50% on completion",
-        "- Late fees: 1.5% per month on overdue amounts",
-        "",
-        "3. TERM",
-        "- Contract duration: 3 months",
-        "- Either party may terminate with 30 days notice",
-        "",
-        "4. INTELLECTUAL PROPERTY",
-        "- All work product belongs to Client",
-        "- Provider retains rights to general methodologies",
-        "",
-        "5. LIABILITY",
-        "- Provider liability limited to contract value",
-        "- No warranties for third-party services",
-        "",
-        "6. CONFIDENTIALITY",
-        "Both parties agree to maintain confidentiality of proprietary information.",
-        "",
-        "By signing below, parties agree to these terms.",
-        "",
-        "CLIENT: _________________ DATE: _______",
-        "",
-        "PROVIDER: _______________ DATE: _______"
-    ]
-    
-    for line in content:
-        if line == "":
-            story.append(Spacer(1, 6))
-        else:
-            para = Paragraph(line, styles['Normal'])
-            story.append(para)
-            story.append(Spacer(1, 3))
-    
-    doc.build(story)
-    print("✓ Created simple-test-contract.pdf")
+from contract_fixtures import load_builtin, render_reportlab
+from contract_fixtures.backends import get_backend
+from contract_fixtures.cache import cached_render
+from contract_fixtures.manifest import CORPUS_DB, CorpusManifest, record_file
+from contract_fixtures.timing import TIMINGS_REPORT, record_stages, report_timings, stage, timing_record
+
+def create_simple_contract(filename="simple-test-contract.pdf"):
+    """Create a simple, clean contract PDF, skipping it if unchanged; returns True if built"""
+    with stage("content"):
+        document = load_builtin("simple-contract")
+    built = cached_render(render_reportlab, document, filename, "reportlab")
+    if built:
+        print(f"✓ Created {filename}")
+    else:
+        print(f"✓ Up to date {filename}")
+    return built
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Create a simple, clean test contract")
+    parser.add_argument("--timings", action="store_true",
+                        help=f"time the contract's stages into {TIMINGS_REPORT} and a Prometheus summary")
+    parser.add_argument("--cprofile-slowest", type=int, default=0, metavar="N",
+                        help="render the contract again under cProfile (implies --timings)")
+    parser.add_argument("--no-manifest", action="store_true",
+                        help=f"don't record the contract in {CORPUS_DB}, the SQLite manifest query-fixtures.py "
+                             "picks fixtures from")
+    args = parser.parse_args(argv)
+    args.timings = args.timings or args.cprofile_slowest > 0
+    return args
 
 if __name__ == "__main__":
-    create_simple_contract()
+    args = parse_args()
+    filename = "simple-test-contract.pdf"
+    start = time.perf_counter()
+    with record_stages(args.timings) as stages:
+        built = create_simple_contract(filename)
+    seconds = time.perf_counter() - start
+    if not args.no_manifest:
+        with CorpusManifest(".") as corpus:
+            if built or filename not in corpus:
+                record_file(corpus, filename, load_builtin("simple-contract"), get_backend("reportlab"),
+                            render_seconds=seconds if built else None)
+    if args.timings:
+        records = [timing_record(filename, "reportlab", stages, seconds)] if built else []
+        report_timings(records, ".", args.cprofile_slowest,
+                       lambda filename: render_reportlab(load_builtin("simple-contract"), filename))
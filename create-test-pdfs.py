@@ -3,231 +3,669 @@
 Script to create test PDF contracts for the contract analyzer
 """
 
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import argparse
 import os
+import sys
+import time
 
-def create_service_agreement():
+from contract_fixtures import builtin_spec_path, load_document, render
+from contract_fixtures.backends import BACKENDS, select_backend
+from contract_fixtures.cache import BuildCache, cache_key, cached_render
+from contract_fixtures.families import (FAMILY_MANIFEST, load_families, member_record, near_duplicate, save_families,
+                                        similarity_label)
+from contract_fixtures.flowcache import CacheStats, flowable_cache
+from contract_fixtures.images import SCAN_DPI, ScanSettings
+from contract_fixtures.manifest import CORPUS_DB, CorpusManifest, record_file
+from contract_fixtures.pack import PACK_EXTENSION, pack_files
+from contract_fixtures.pathological import PATHOLOGICAL_REPORT, SHAPES, check_shape, write_report
+from contract_fixtures.pdfutil import count_pages
+from contract_fixtures.profiles import PROFILES
+from contract_fixtures.render import RENDERER_VERSION
+from contract_fixtures.shards import (CORPUS_INDEX, document_record, file_digest, merge_shards, parse_shard,
+                                      write_shard_manifest)
+from contract_fixtures.sizing import fit_document, load_manifest, parse_target, save_manifest, SIZE_MANIFEST
+from contract_fixtures.streaming import CHUNK_PAGES, render_reportlab_stream
+from contract_fixtures.synth import RISK_LEVELS, synthesize
+from contract_fixtures.timing import TIMINGS_REPORT, TIMINGS_SUMMARY, record_stages, report_timings, stage, timing_record
+from contract_fixtures.truth import ground_truth, read_sidecar, sidecar_path, TRUTH_INDEX, write_index, write_sidecar
+
+SPECS = ["service-agreement", "employment-contract", "rental-agreement"]
+
+def profile_options(profile, scan=None):
+    """Render/cache options for an output profile and scan settings; empty for library defaults, so old cache keys
+    still match"""
+    options = {"profile": profile} if profile else {}
+    if scan is not None:
+        options["scan"] = scan
+    return options
+
+def create_contract(spec_path, filename, backend="reportlab", profile=None, scan=None):
+    """Create a PDF from a contract spec file"""
+    with stage("content"):
+        document = load_document(spec_path)
+    return render(document, filename, backend, **profile_options(profile, scan))
+
+def create_contract_cached(spec_path, filename, backend="reportlab", profile=None, scan=None):
+    """Create a PDF from a contract spec file unless it is already up to date; returns True if built"""
+    renderer = select_backend(backend)
+    with stage("content"):
+        document = load_document(spec_path)
+    return cached_render(renderer.render, document, filename, renderer.name, **profile_options(profile, scan))
+
+def output_stats(filename):
+    """(bytes, pages) of a generated file; pages is None for non-PDF output"""
+    with open(filename, "rb") as f:
+        data = f.read()
+    return len(data), count_pages(data) if filename.endswith(".pdf") else None
+
+def format_stats(size, pages):
+    if not pages:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / 1024:.1f} KB, {pages} pages, {size / pages / 1024:.1f} KB/page"
+
+def create_service_agreement(filename="test-service-agreement.pdf"):
     """Create a Service Agreement PDF"""
-    doc = SimpleDocTemplate("test-service-agreement.pdf", pagesize=letter)
-    styles = getSampleStyleSheet()
-    story = []
-    
-    # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=16,
-        spaceAfter=30,
-        alignment=1  # Center alignment
-    )
-    
-    story.append(Paragraph("SERVICE AGREEMENT", title_style))
-    story.append(Spacer(1, 20))
-    
-    # Content
-    content = [
-        "This Service Agreement (\"Agreement\") is entered into on March 15, 2024, between TechCorp Solutions (\"Client\") and Digital Innovations LLC (\"Provider\").",
-        "",
-        "<b>1. SERVICES</b>",
-        "Provider agrees to provide software development and consulting services including:",
-        "• Custom web application development",
-        "• Database design and implementation", 
-        "• User interface design",
-        "• Testing and quality assurance",
-        "",
-        "<b>2. PAYMENT TERMS</b>",
-        "Client agrees to pay a total of $75,000 as follows:",
-        "• $25,000 upon signing this agreement",
-        "• $25,000 upon completion of Phase 1 (design and planning)",
-        "• $25,000 upon final delivery and acceptance",
-        "",
-        "<b>3. TERM AND TERMINATION</b>",
-        "This agreement shall commence on March 15, 2024, and continue for 6 months unless terminated earlier. Either party may terminate this agreement with 14 days written notice. Upon termination, Client shall pay for all work completed to date.",
-        "",
-        "<b>4. INTELLECTUAL PROPERTY</b>",
-        "All work product, including source code, designs, and documentation, shall be owned exclusively by Provider until final payment is received, at which point ownership transfers to Client.",
-        "",
-        "<b>5. CONFIDENTIALITY</b>",
-        "Both parties agree to maintain confidentiality of proprietary information shared during the course of this agreement for a period of 3 years.",
-        "",
-        "<b>6. LIABILITY AND WARRANTIES</b>",
-        "Provider's total liability under this agreement shall not exceed $10,000. Provider makes no warranties regarding the software's performance in Client's specific environment.",
-        "",
-        "<b>7. GOVERNING LAW</b>",
-        "This agreement shall be governed by the laws of New York State. Any disputes shall be resolved through binding arbitration.",
-        "",
-        "<b>8. FORCE MAJEURE</b>",
-        "Neither party shall be liable for delays caused by circumstances beyond their reasonable control, including natural disasters, government actions, or pandemics.",
-        "",
-        "IN WITNESS WHEREOF, the parties have executed this Agreement as of the date first written above.",
-        "",
-        "TechCorp Solutions                    Digital Innovations LLC",
-        "_________________                     _________________",
-        "Sarah Johnson, CEO                    Michael Chen, President",
-        "Date: ___________                     Date: ___________"
-    ]
-    
-    for line in content:
-        if line == "":
-            story.append(Spacer(1, 12))
-        else:
-            story.append(Paragraph(line, styles['Normal']))
-            story.append(Spacer(1, 6))
-    
-    doc.build(story)
-    print("✓ Created test-service-agreement.pdf")
+    return create_contract(builtin_spec_path("service-agreement"), filename)
 
-def create_employment_contract():
+def create_employment_contract(filename="test-employment-contract.pdf"):
     """Create an Employment Contract PDF"""
-    doc = SimpleDocTemplate("test-employment-contract.pdf", pagesize=letter)
-    styles = getSampleStyleSheet()
-    story = []
-    
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=16,
-        spaceAfter=30,
-        alignment=1
-    )
-    
-    story.append(Paragraph("EMPLOYMENT AGREEMENT", title_style))
-    story.append(Spacer(1, 20))
-    
-    content = [
-        "This Employment Agreement is entered into on April 1, 2024, between Innovative Tech Corp (\"Company\") and Alex Rodriguez (\"Employee\").",
-        "",
-        "<b>1. POSITION AND DUTIES</b>",
-        "Employee is hired as Senior Software Engineer and agrees to perform duties including software development, code review, mentoring junior developers, and participating in architectural decisions.",
-        "",
-        "<b>2. COMPENSATION</b>",
-        "Company agrees to pay Employee an annual salary of $120,000, payable bi-weekly. Employee is eligible for annual performance bonuses up to 20% of base salary.",
-        "",
-        "<b>3. BENEFITS</b>",
-        "Employee is entitled to:",
-        "• Health, dental, and vision insurance (Company pays 80%)",
-        "• 401(k) with 4% company match",
-        "• 20 days paid vacation annually",
-        "• 10 days sick leave",
-        "• $2,000 annual professional development allowance",
-        "",
-        "<b>4. WORK SCHEDULE</b>",
-        "Employee's standard work schedule is Monday through Friday, 9:00 AM to 5:00 PM, with flexibility for remote work up to 3 days per week.",
-        "",
-        "<b>5. CONFIDENTIALITY AND NON-DISCLOSURE</b>",
-        "Employee agrees to maintain strict confidentiality of all proprietary information, trade secrets, and client data. This obligation continues for 2 years after termination.",
-        "",
-        "<b>6. NON-COMPETE CLAUSE</b>",
-        "For 12 months after termination, Employee agrees not to work for direct competitors within a 50-mile radius or solicit Company clients or employees.",
-        "",
-        "<b>7. TERMINATION</b>",
-        "Either party may terminate this agreement with 2 weeks notice. Company may terminate immediately for cause. Upon termination, Employee must return all company property.",
-        "",
-        "<b>8. DISPUTE RESOLUTION</b>",
-        "Any disputes shall be resolved through mediation, and if unsuccessful, binding arbitration under California state law.",
-        "",
-        "By signing below, both parties agree to the terms of this Employment Agreement.",
-        "",
-        "Innovative Tech Corp                  Employee",
-        "_________________                     _________________",
-        "Jennifer Liu, HR Director             Alex Rodriguez",
-        "Date: ___________                     Date: ___________"
-    ]
-    
-    for line in content:
-        if line == "":
-            story.append(Spacer(1, 12))
-        else:
-            story.append(Paragraph(line, styles['Normal']))
-            story.append(Spacer(1, 6))
-    
-    doc.build(story)
-    print("✓ Created test-employment-contract.pdf")
+    return create_contract(builtin_spec_path("employment-contract"), filename)
 
-def create_rental_agreement():
+def create_rental_agreement(filename="test-rental-agreement.pdf"):
     """Create a Rental Agreement PDF"""
-    doc = SimpleDocTemplate("test-rental-agreement.pdf", pagesize=letter)
-    styles = getSampleStyleSheet()
-    story = []
-    
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=16,
-        spaceAfter=30,
-        alignment=1
-    )
-    
-    story.append(Paragraph("RESIDENTIAL LEASE AGREEMENT", title_style))
-    story.append(Spacer(1, 20))
-    
-    content = [
-        "This Lease Agreement is entered into on May 1, 2024, between Property Management LLC (\"Landlord\") and Emma Thompson (\"Tenant\").",
-        "",
-        "<b>1. PROPERTY</b>",
-        "Landlord leases to Tenant the residential property located at 123 Oak Street, Apartment 2B, Springfield, IL 62701 (\"Premises\").",
-        "",
-        "<b>2. TERM</b>",
-        "The lease term is 12 months, beginning May 1, 2024, and ending April 30, 2025. Tenant has no right to renew without Landlord's written consent.",
-        "",
-        "<b>3. RENT</b>",
-        "Monthly rent is $1,800, due on the 1st of each month. Late fees of $50 apply after the 5th. Security deposit of $2,700 is required before move-in.",
-        "",
-        "<b>4. USE OF PREMISES</b>",
-        "Premises shall be used solely as a private residence for Tenant and immediate family. No pets allowed without written permission. No smoking permitted.",
-        "",
-        "<b>5. MAINTENANCE AND REPAIRS</b>",
-        "Landlord is responsible for major repairs and maintenance. Tenant is responsible for minor repairs under $100 and must maintain premises in good condition.",
-        "",
-        "<b>6. UTILITIES</b>",
-        "Tenant is responsible for electricity, gas, internet, and cable. Landlord pays for water, sewer, and trash collection.",
-        "",
-        "<b>7. ALTERATIONS</b>",
-        "No alterations or improvements may be made without Landlord's written consent. Any unauthorized changes may result in charges and lease termination.",
-        "",
-        "<b>8. ENTRY BY LANDLORD</b>",
-        "Landlord may enter premises with 24-hour notice for inspections, repairs, or showing to prospective tenants during the last 30 days of lease.",
-        "",
-        "<b>9. TERMINATION</b>",
-        "Lease may be terminated by Landlord for non-payment of rent, violation of lease terms, or illegal activities. 30-day notice required for non-renewal.",
-        "",
-        "<b>10. GOVERNING LAW</b>",
-        "This agreement is governed by Illinois state law and local ordinances.",
-        "",
-        "Property Management LLC               Tenant",
-        "_________________                     _________________",
-        "Robert Davis, Manager                 Emma Thompson",
-        "Date: ___________                     Date: ___________"
-    ]
-    
-    for line in content:
-        if line == "":
-            story.append(Spacer(1, 12))
+    return create_contract(builtin_spec_path("rental-agreement"), filename)
+
+DEFAULT_FILES = ["test-service-agreement.pdf", "test-employment-contract.pdf", "test-rental-agreement.pdf"]
+
+# A member of a near-duplicate family: the base document `family` of a batch
+# source, or its variant sharing `similarity` of the text
+FamilyMember = namedtuple("FamilyMember", ["base", "family", "similarity"])
+
+def load_source(source, index):
+    """A batch source is a spec file path, a (seed, risk) synthetic corpus or a family member"""
+    if isinstance(source, FamilyMember):
+        document = load_source(source.base, source.family)
+        if source.similarity is None:
+            return document
+        return near_duplicate(document, source.similarity, seed=source.family)[0]
+    if isinstance(source, str):
+        return load_document(source)
+    seed, risk = source
+    return synthesize(seed, index, risk=risk)
+
+def source_key(source, index, backend, profile, scan=None):
+    """Cache key of a batch source; family variants are keyed on their base, which is cheaper to build"""
+    if isinstance(source, FamilyMember):
+        return cache_key(load_source(source.base, source.family), backend, family=source.similarity,
+                         **profile_options(profile, scan))
+    return cache_key(load_source(source, index), backend, **profile_options(profile, scan))
+
+def job_key(job):
+    return source_key(job.source, job.index, job.backend, job.profile, job.scan)
+
+Job = namedtuple("Job", ["index", "source", "filename", "backend", "truth", "profile", "scan", "timings",
+                         "manifest"])
+Outcome = namedtuple("Outcome", ["index", "filename", "pid", "elapsed", "error", "record", "bytes", "pages",
+                                 "flowables", "member", "stages"])
+
+def build_document(job):
+    """Build one batch document, returning its outcome instead of raising"""
+    start = time.perf_counter()
+    flowables = flowable_cache.stats()
+    error = record = size = pages = member = None
+    with record_stages(job.timings) as stages:
+        try:
+            with stage("content"):
+                document = load_source(job.source, job.index)
+            render(document, job.filename, job.backend, **profile_options(job.profile, job.scan))
+            if job.truth:
+                record = write_sidecar(document, job.filename)
+            elif job.manifest:
+                record = ground_truth(document)
+            if isinstance(job.source, FamilyMember):
+                member = member_record(job.filename, family_name(job.filename), document, job.source.similarity)
+            size, pages = output_stats(job.filename)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+    return Outcome(job.index, job.filename, os.getpid(), time.perf_counter() - start, error, record, size, pages,
+                   flowable_cache.stats().since(flowables), member, dict(stages) if stages is not None else None)
+
+def family_name(filename):
+    """service-agreement-000003-s90.pdf belongs to family service-agreement-000003"""
+    return os.path.basename(filename).rsplit("-", 1)[0]
+
+def batch_jobs(count, output_dir, spec_paths, synthetic=None, backend="reportlab", truth=False, profile=None,
+               families=None, scan=None, timings=False, shard=None, manifest=False):
+    """A Job for each document in a batch (or in its shard's slice), or for each member of its families"""
+    extension = select_backend(backend).extension
+    jobs = []
+    for index in shard.range(count) if shard is not None else range(count):
+        if synthetic is not None:
+            source, kind = synthetic, "synthetic"
+        else:
+            source = spec_paths[index % len(spec_paths)]
+            kind = os.path.splitext(os.path.basename(source))[0]
+        name = f"{kind}-{index:06d}"
+        if families is None:
+            jobs.append(Job(index, source, os.path.join(output_dir, f"{name}{extension}"), backend, truth, profile,
+                            scan, timings, manifest))
+            continue
+        for similarity in [None, *families]:
+            label = similarity_label(similarity) if similarity is not None else "base"
+            jobs.append(Job(len(jobs), FamilyMember(source, index, similarity),
+                            os.path.join(output_dir, f"{name}-{label}{extension}"), backend, truth, profile, scan,
+                            timings, manifest))
+    return jobs
+
+def document_index(job):
+    """Index of a job's document in the whole corpus; family members share their base's"""
+    return job.source.family if isinstance(job.source, FamilyMember) else job.index
+
+def shard_settings(args, backend, spec_paths, scan):
+    """Everything that decides a batch's documents besides its shard, which shards must agree on"""
+    return {
+        "seed": args.seed if args.synthetic else None,
+        "risk": args.risk if args.synthetic else None,
+        "specs": None if args.synthetic else [[os.path.basename(path), file_digest(path)] for path in spec_paths],
+        "backend": backend.name,
+        "backend_version": backend.version(),
+        "renderer": RENDERER_VERSION,
+        "profile": args.profile,
+        "families": args.families,
+        "scan": [scan.dpi, scan.skew, scan.noise] if scan is not None else None,
+        "truth": args.truth,
+    }
+
+def pack_metadata(filenames, records, members):
+    """Pack index metadata of batch files: risk and family details from their sidecars and family records"""
+    metadata = {}
+    for filename in filenames:
+        record = records.get(filename, {})
+        member = members.get(os.path.basename(filename), {})
+        meta = {key: record[key] for key in ("contract_type", "risk", "risk_flags") if key in record}
+        meta.update((key, member[key]) for key in ("family", "similarity") if key in member)
+        metadata[filename] = meta
+    return metadata
+
+def run_batch(count, workers, output_dir, spec_paths, synthetic=None, use_cache=True, backend="reportlab",
+              truth=False, profile=None, families=None, scan=None, pack=None, timings=False, slowest=0, shard=None,
+              settings=None, manifest=True):
+    """Build `count` documents (or families) across a process pool and report failures per worker"""
+    os.makedirs(output_dir, exist_ok=True)
+    renderer = select_backend(backend)
+    backend = renderer.name
+    jobs = batch_jobs(count, output_dir, spec_paths, synthetic, backend, truth, profile, families, scan, timings,
+                      shard, manifest)
+    all_jobs = jobs
+    filenames = [job.filename for job in jobs]
+    records = {}
+    members = load_families(output_dir) if families is not None else {}
+    manifest = CorpusManifest(output_dir) if manifest else None
+
+    cache = BuildCache(output_dir) if use_cache else None
+    keys = {}
+    if cache is not None:
+        # Keying a document means building it, so the workers compute the keys too
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            keys = dict(zip(filenames, pool.map(job_key, jobs, chunksize=max(1, len(jobs) // (workers * 16)))))
+        evicted = cache.evict_stale(keys, "batch")
+        for filename in evicted:
+            if os.path.exists(sidecar_path(filename)):
+                os.remove(sidecar_path(filename))
+        if manifest is not None:
+            manifest.forget(evicted)
+        sizes = load_manifest(output_dir)
+        if any(os.path.basename(filename) in sizes for filename in evicted):
+            for filename in evicted:
+                sizes.pop(os.path.basename(filename), None)
+            save_manifest(output_dir, sizes)
+        fresh = {filename for filename in filenames if cache.is_fresh(filename, keys[filename])
+                 and (not truth or os.path.exists(sidecar_path(filename)))
+                 and (manifest is None or filename in manifest)
+                 and (families is None or os.path.basename(filename) in members)}
+        if truth:
+            records = {filename: read_sidecar(filename) for filename in fresh}
+        jobs = [job for job in jobs if job.filename not in fresh]
+        print(f"Cache: {len(filenames) - len(jobs)} unchanged, {len(jobs)} to build, {len(evicted)} stale evicted")
+    total_jobs = len(jobs)
+
+    failures = defaultdict(list)
+    stage_records = []
+    built_bytes = built_pages = 0
+    flowables = CacheStats(0, 0)
+    start = time.perf_counter()
+    # Small chunks keep results flowing back in order without starving idle workers
+    chunksize = max(1, total_jobs // (workers * 16))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() yields in submission order, so progress lines stay ordered
+            for done, outcome in enumerate(pool.map(build_document, jobs, chunksize=chunksize), 1):
+                filename = outcome.filename
+                if outcome.error:
+                    failures[outcome.pid].append((filename, outcome.error))
+                    if cache is not None:
+                        cache.forget(filename)
+                    if manifest is not None:
+                        manifest.forget([filename])
+                    print(f"[{done}/{total_jobs}] ❌ {filename}: {outcome.error}")
+                else:
+                    if cache is not None:
+                        cache.record(filename, keys[filename], "batch")
+                    if outcome.record is not None:
+                        records[filename] = outcome.record
+                    if outcome.member is not None:
+                        members[os.path.basename(filename)] = outcome.member
+                    if manifest is not None:
+                        manifest.record(filename, outcome.record, backend, renderer.format, outcome.bytes,
+                                        outcome.pages, profile, outcome.elapsed)
+                    built_bytes += outcome.bytes
+                    built_pages += outcome.pages or 0
+                    flowables = CacheStats(flowables.hits + outcome.flowables.hits,
+                                           flowables.misses + outcome.flowables.misses)
+                    if outcome.stages is not None:
+                        stage_records.append(timing_record(filename, backend, outcome.stages, outcome.elapsed))
+                    print(f"[{done}/{total_jobs}] ✓ {filename} ({outcome.elapsed * 1000:.0f} ms)")
+    finally:
+        if cache is not None:
+            cache.save()
+        if manifest is not None:
+            manifest.close()
+        if truth:
+            write_index([records[filename] for filename in filenames if filename in records], output_dir)
+        if families is not None:
+            save_families(output_dir, [members[name] for name in map(os.path.basename, filenames) if name in members])
+
+    total = time.perf_counter() - start
+    failed = sum(len(errors) for errors in failures.values())
+    failed_files = {filename for errors in failures.values() for filename, _ in errors}
+    if shard is not None:
+        # The manifest sits beside the shard's directory, where the shards are merged
+        manifest_dir = os.path.dirname(output_dir) or "."
+        documents = [document_record(job.filename, document_index(job), manifest_dir) for job in all_jobs
+                     if job.filename not in failed_files]
+        path = write_shard_manifest(manifest_dir, shard, settings, count, documents, sorted(failed_files),
+                                    os.path.join(output_dir, TRUTH_INDEX) if truth else None,
+                                    os.path.join(output_dir, FAMILY_MANIFEST) if families is not None else None,
+                                    os.path.join(output_dir, CORPUS_DB) if manifest is not None else None)
+        print(f"✓ Wrote {path} ({len(documents)} documents)")
+    if pack is not None:
+        packed = [filename for filename in filenames if filename not in failed_files]
+        size = pack_files(pack, packed, pack_metadata(packed, records, members))
+        print(f"✓ Packed {len(packed)} documents into {pack} ({size / (1024 * 1024):.1f} MB)")
+
+    print(f"\nBuilt {total_jobs - failed}/{total_jobs} documents in {total:.1f}s "
+          f"({total_jobs / total if total else 0:.1f} docs/s, {workers} workers)")
+    if built_bytes:
+        print(f"Output: {format_stats(built_bytes, built_pages)} ({profile or 'default'} profile)")
+    if flowables.hits or flowables.misses:
+        print(f"Flowable cache: {flowables.hit_rate:.1%} hit rate ({flowables.hits} reused, "
+              f"{flowables.misses} parsed, up to {flowable_cache.maxsize} per worker)")
+    if timings:
+        # Profiled again in this process, without the timing hooks
+        jobs_by_file = {os.path.basename(job.filename): job._replace(timings=False) for job in jobs}
+        report_timings(stage_records, output_dir, slowest,
+                       lambda filename: build_document(jobs_by_file[os.path.basename(filename)]))
+    if failures:
+        print("\nFailures by worker:")
+        for pid, errors in sorted(failures.items()):
+            print(f"- worker {pid}: {len(errors)} failed")
+            for filename, error in errors[:5]:
+                print(f"    {filename}: {error}")
+            if len(errors) > 5:
+                print(f"    ... and {len(errors) - 5} more")
+    return failed
+
+def run_stream(pages, output_dir, spec_paths, use_cache=True):
+    """Render one very long contract per spec in bounded memory, a chunk of pages at a time"""
+    os.makedirs(output_dir, exist_ok=True)
+    cache = BuildCache(output_dir) if use_cache else None
+    for spec_path in spec_paths:
+        kind = os.path.splitext(os.path.basename(spec_path))[0]
+        filename = os.path.join(output_dir, f"{kind}-{pages}p.pdf")
+        document = load_document(spec_path)
+        key = cache_key(document, "reportlab", stream_pages=pages, chunk_pages=CHUNK_PAGES)
+        if cache is not None and cache.is_fresh(filename, key):
+            print(f"✓ Up to date {filename}")
+            continue
+        result = render_reportlab_stream(document, filename, pages)
+        if cache is not None:
+            cache.record(filename, key, "stream")
+            cache.save()
+        print(f"✓ Created {filename}: {result.pages} pages, {result.bytes / (1024 * 1024):.2f} MB "
+              f"in {result.seconds:.1f}s ({result.pages_per_second:.1f} pages/s, "
+              f"peak RSS {result.peak_rss_mb:.0f} MB)")
+
+def run_targets(targets, output_dir, spec_paths, backend, use_cache=True, truth=False, profile=None, scan=None,
+                manifest=True):
+    """Render one contract per spec and size target, recording actual size and render time"""
+    os.makedirs(output_dir, exist_ok=True)
+    cache = BuildCache(output_dir) if use_cache else None
+    records = load_manifest(output_dir)
+    corpus = CorpusManifest(output_dir) if manifest else None
+    for spec_path in spec_paths:
+        kind = os.path.splitext(os.path.basename(spec_path))[0]
+        document = load_document(spec_path)
+        for target in targets:
+            filename = os.path.join(output_dir, f"{kind}-{target.label}{backend.extension}")
+            name = os.path.basename(filename)
+            key = cache_key(document, backend.name, target=target.label, **profile_options(profile, scan))
+            if (cache is not None and cache.is_fresh(filename, key) and name in records
+                    and (not truth or os.path.exists(sidecar_path(filename)))
+                    and (corpus is None or filename in corpus)):
+                print(f"✓ Up to date {filename}")
+                continue
+            fixture = fit_document(document, target, backend.name, **profile_options(profile, scan))
+            with open(filename, "wb") as f:
+                f.write(fixture.data)
+            if truth:
+                write_sidecar(fixture.document, filename)
+            records[name] = fixture.record(name)
+            save_manifest(output_dir, records)
+            if corpus is not None:
+                corpus.record(filename, ground_truth(fixture.document), backend.name, backend.format, fixture.bytes,
+                              fixture.pages, profile, fixture.render_seconds)
+                corpus.commit()
+            if cache is not None:
+                cache.record(filename, key, "targets")
+                cache.save()
+            pages = f", {fixture.pages} pages" if fixture.pages is not None else ""
+            print(f"✓ Created {filename}: {fixture.bytes / (1024 * 1024):.2f} MB{pages} "
+                  f"in {fixture.render_seconds:.1f}s (route should have it {target.expect})")
+            if not fixture.within_tolerance:
+                print(f"⚠️ {filename} missed its {target.label} target after {fixture.attempts} attempts")
+    if corpus is not None:
+        corpus.close()
+
+def run_pathological(shapes, output_dir, backend, profile=None, truth=False, manifest=True, repeat=3):
+    """Render each pathological shape up to its nominal scale against its budget; returns the number over budget"""
+    os.makedirs(output_dir, exist_ok=True)
+    corpus = CorpusManifest(output_dir) if manifest else None
+    reports = []
+    for shape in shapes:
+        report, data = check_shape(shape, backend.name, profile, repeat)
+        reports.append(report)
+        nominal = report.measurements[-1]
+        filename = os.path.join(output_dir, f"{shape.label(shape.scale)}{backend.extension}")
+        with open(filename, "wb") as f:
+            f.write(data)
+        document = shape.build(shape.scale)
+        if truth:
+            write_sidecar(document, filename)
+        if corpus is not None:
+            corpus.record(filename, ground_truth(document), backend.name, backend.format, nominal.bytes,
+                          nominal.pages, profile, nominal.render_s)
+            corpus.commit()
+
+        print(f"\n{shape.name} ({shape.unit}):")
+        for measurement in report.measurements:
+            extract = (f", extract {measurement.extract_s * 1000:.0f} ms" if measurement.extract_s is not None
+                       else "")
+            print(f"  {measurement.scale:>6}: render {measurement.render_s * 1000:.0f} ms{extract}, "
+                  f"peak {measurement.peak_mb:.1f} MB, {format_stats(measurement.bytes, measurement.pages)}")
+        print("  growth: " + ", ".join(f"{metric} n^{exponent:g}" for metric, exponent in report.growth.items()
+                                       if exponent is not None))
+        for problem in report.over_budget:
+            print(f"  ❌ {problem}")
+        for problem in report.superlinear:
+            print(f"  ⚠️ Superlinear: {problem}")
+        if not report.over_budget and not report.superlinear:
+            print(f"  ✓ {filename} within budget, linear")
         else:
-            story.append(Paragraph(line, styles['Normal']))
-            story.append(Spacer(1, 6))
-    
-    doc.build(story)
-    print("✓ Created test-rental-agreement.pdf")
+            print(f"  ✓ Wrote {filename}")
+    if corpus is not None:
+        corpus.close()
+
+    if backend.format == "pdf" and all(report.measurements[-1].extract_s is None for report in reports):
+        print("\n⚠️ pypdf not installed, so extraction wasn't measured. Please install it with: pip install pypdf")
+    print(f"\n✓ Wrote {write_report(reports, output_dir)}")
+    superlinear = [report.shape for report in reports if report.superlinear]
+    if superlinear:
+        print(f"⚠️ Superlinear shapes: {', '.join(superlinear)}")
+    return sum(1 for report in reports if report.over_budget)
+
+def size_target(text):
+    try:
+        return parse_target(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+def similarity_value(text):
+    try:
+        value = float(text)
+    except ValueError:
+        value = None
+    if value is None or not 0 < value <= 1:
+        raise argparse.ArgumentTypeError(f"Invalid similarity '{text}': use a fraction such as 0.99, 0.9 or 0.5")
+    return value
+
+def skew_degrees(text):
+    try:
+        value = float(text)
+    except ValueError:
+        value = None
+    if value is None or not 0 <= value <= 45:
+        raise argparse.ArgumentTypeError(f"Invalid skew '{text}': use degrees between 0 and 45, e.g. 1.5")
+    return value
+
+def noise_fraction(text):
+    try:
+        value = float(text)
+    except ValueError:
+        value = None
+    if value is None or not 0 <= value <= 1:
+        raise argparse.ArgumentTypeError(f"Invalid noise '{text}': use a fraction of speckled pixels, e.g. 0.02")
+    return value
+
+def shard_spec(text):
+    try:
+        return parse_shard(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Create test PDF contracts for the contract analyzer")
+    parser.add_argument("--count", type=int,
+                        help="batch mode: number of documents to build (cycles through the specs)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="batch mode: worker processes (default: CPU count)")
+    parser.add_argument("--output-dir", default="test-corpus",
+                        help="batch/streaming/size/pathological mode: directory for generated PDFs "
+                             "(default: test-corpus)")
+    parser.add_argument("--stream-pages", type=int, metavar="PAGES",
+                        help="streaming mode: render one contract per spec padded to at least PAGES pages")
+    parser.add_argument("--target", action="append", dest="targets", type=size_target, metavar="SIZE",
+                        help="size mode: render each spec at this byte size or page count, e.g. 9.9MB, "
+                             f"11MB or 200pages (repeatable; results go to {SIZE_MANIFEST})")
+    parser.add_argument("--spec", action="append", dest="specs", metavar="FILE",
+                        help="batch/streaming/size mode: JSON/YAML contract spec to render (repeatable; "
+                             "default: the built-in service, employment and rental specs)")
+    parser.add_argument("--synthetic", action="store_true",
+                        help="batch mode: generate unique contracts from the clause library instead of specs")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="synthetic mode: corpus seed; the same seed always yields the same documents")
+    parser.add_argument("--risk", choices=sorted(RISK_LEVELS),
+                        help="synthetic mode: risk level for every document (default: varies per document)")
+    parser.add_argument("--backend", default="reportlab", choices=["auto", *BACKENDS],
+                        help="renderer for default, batch, size and pathological mode (default: reportlab; auto picks "
+                             "the fastest installed PDF backend); streaming mode always uses reportlab")
+    parser.add_argument("--profile", choices=list(PROFILES),
+                        help="output profile for default, batch, size and pathological mode: minimal, realistic or "
+                             "bloated compression, fonts and metadata (default: the renderer library's defaults)")
+    parser.add_argument("--scan-dpi", type=int, default=SCAN_DPI,
+                        help=f"scan backend: resolution pages are rasterized at (default: {SCAN_DPI})")
+    parser.add_argument("--scan-skew", type=skew_degrees, default=0.0, metavar="DEGREES",
+                        help="scan backend: rotate each page by a seeded angle up to this many degrees (default: 0)")
+    parser.add_argument("--scan-noise", type=noise_fraction, default=0.0, metavar="FRACTION",
+                        help="scan backend: speckle this fraction of each page's pixels (default: 0)")
+    parser.add_argument("--pathological", action="store_true",
+                        help="pathological mode: render adversarial structures (an unbroken 50KB paragraph, "
+                             "thousands of nested bullets, a huge table, hundreds of sections) at growing scales, "
+                             f"checking each against its time and memory budget and reporting superlinear growth "
+                             f"in {PATHOLOGICAL_REPORT}")
+    parser.add_argument("--shape", action="append", dest="shapes", choices=list(SHAPES),
+                        help="pathological mode: shape to render (repeatable; default: all)")
+    parser.add_argument("--family", action="append", dest="families", type=similarity_value, metavar="SIMILARITY",
+                        help="batch mode: make each document the base of a near-duplicate family, with a variant "
+                             "sharing this fraction of its text (repeatable, e.g. 0.99, 0.9 and 0.5; "
+                             f"measured similarities go to {FAMILY_MANIFEST})")
+    parser.add_argument("--shard", type=shard_spec, metavar="I/N",
+                        help="batch mode: build only shard I of N (from 1) of the --count documents, into "
+                             "OUTPUT_DIR/shard-I-of-N/ with a shard-I-of-N.json manifest; every node given the same "
+                             "settings builds a disjoint, reproducible slice")
+    parser.add_argument("--merge-shards", action="store_true",
+                        help=f"check the shard manifests in --output-dir and merge them into one {CORPUS_INDEX} "
+                             f"(plus the shards' truth, family and {CORPUS_DB} manifests)")
+    parser.add_argument("--pack", metavar="FILE",
+                        help=f"batch mode: also pack the documents into one indexed {PACK_EXTENSION} file, which "
+                             "load-test-analyze.py --fixtures reads without opening each document")
+    parser.add_argument("--truth", action="store_true",
+                        help="also write a ground-truth .truth.json sidecar per document (clause types, "
+                             f"values and offsets); batch mode collects them into {TRUTH_INDEX}")
+    parser.add_argument("--timings", action="store_true",
+                        help="default/batch mode: time each document's stages (content, paragraphs, layout, output) "
+                             f"into {TIMINGS_REPORT} and a Prometheus summary, {TIMINGS_SUMMARY}; cached documents "
+                             "aren't rebuilt, so aren't timed")
+    parser.add_argument("--cprofile-slowest", type=int, default=0, metavar="N",
+                        help="default/batch mode: render the N slowest documents again under cProfile, writing "
+                             "a .prof per document (implies --timings)")
+    parser.add_argument("--no-manifest", action="store_true",
+                        help=f"don't record the documents in the output directory's {CORPUS_DB}, the SQLite "
+                             "manifest query-fixtures.py picks fixtures from (streaming mode never does)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="rebuild every document, ignoring and not updating the build cache")
+    args = parser.parse_args(argv)
+    if args.count is not None and args.count < 1:
+        parser.error("--count must be at least 1")
+    if args.families and args.count is None:
+        parser.error("--family needs --count")
+    if args.pack is not None and args.count is None:
+        parser.error("--pack needs --count")
+    if args.shard is not None and args.count is None:
+        parser.error("--shard needs --count")
+    if args.cprofile_slowest < 0:
+        parser.error("--cprofile-slowest must be at least 0")
+    args.timings = args.timings or args.cprofile_slowest > 0
+    if args.timings and (args.targets or args.stream_pages is not None or args.pathological):
+        parser.error("--timings and --cprofile-slowest work in default and batch mode only")
+    if args.shapes and not args.pathological:
+        parser.error("--shape needs --pathological")
+    if args.stream_pages is not None and args.stream_pages < 1:
+        parser.error("--stream-pages must be at least 1")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.scan_dpi < 1:
+        parser.error("--scan-dpi must be at least 1")
+    scan_options = (args.scan_dpi, args.scan_skew, args.scan_noise) != (SCAN_DPI, 0.0, 0.0)
+    if scan_options and args.backend != "scan":
+        parser.error("--scan-dpi, --scan-skew and --scan-noise need --backend scan")
+    return args
 
 if __name__ == "__main__":
-    print("Creating test PDF contracts...")
-    
+    args = parse_args()
+
+    if args.merge_shards:
+        try:
+            merged = merge_shards(args.output_dir)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print(f"✓ Merged {merged.shards} shards into {merged.index}: {merged.documents} documents, "
+              f"{merged.bytes / (1024 * 1024):.1f} MB")
+        for path in (merged.truth_index, merged.families, merged.corpus):
+            if path is not None:
+                print(f"✓ Merged {path}")
+        sys.exit(0)
+
+    spec_paths = args.specs or [builtin_spec_path(name) for name in SPECS]
+
     try:
-        create_service_agreement()
-        create_employment_contract()
-        create_rental_agreement()
+        backend = select_backend("reportlab" if args.stream_pages is not None else args.backend)
+    except ImportError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    scan = ScanSettings(args.scan_dpi, args.scan_skew, args.scan_noise) if backend.name == "scan" else None
+
+    if args.stream_pages is not None:
+        print(f"Streaming {args.stream_pages}-page test PDF contracts into {args.output_dir}/...")
+        run_stream(args.stream_pages, args.output_dir, spec_paths, use_cache=not args.no_cache)
+        sys.exit(0)
+
+    if args.targets:
+        print(f"Creating size-targeted test contracts in {args.output_dir}/...")
+        run_targets(args.targets, args.output_dir, spec_paths, backend, use_cache=not args.no_cache,
+                    truth=args.truth, profile=args.profile, scan=scan, manifest=not args.no_manifest)
+        sys.exit(0)
+
+    if args.pathological:
+        print(f"Creating pathological test contracts in {args.output_dir}/...")
+        over_budget = run_pathological([SHAPES[name] for name in args.shapes or SHAPES], args.output_dir, backend,
+                                       args.profile, truth=args.truth, manifest=not args.no_manifest)
+        sys.exit(1 if over_budget else 0)
+
+    if args.count is not None:
+        output_dir, building = args.output_dir, args.count
+        if args.shard is not None:
+            output_dir = os.path.join(args.output_dir, args.shard.label)
+            indexes = args.shard.range(args.count)
+            building = len(indexes)
+            print(f"Shard {args.shard.number} of {args.shard.count}: documents {indexes.start} to "
+                  f"{indexes.stop - 1} of {args.count}")
+        if args.families:
+            print(f"Creating {building} near-duplicate contract families in {output_dir}/...")
+        else:
+            print(f"Creating {building} test PDF contracts in {output_dir}/...")
+        synthetic = (args.seed, args.risk) if args.synthetic else None
+        settings = shard_settings(args, backend, spec_paths, scan) if args.shard is not None else None
+        failed = run_batch(args.count, args.workers, output_dir, spec_paths, synthetic,
+                           use_cache=not args.no_cache, backend=backend.name, truth=args.truth,
+                           profile=args.profile, families=args.families, scan=scan, pack=args.pack,
+                           timings=args.timings, slowest=args.cprofile_slowest, shard=args.shard,
+                           settings=settings, manifest=not args.no_manifest)
+        sys.exit(1 if failed else 0)
+
+    print("Creating test PDF contracts...")
+
+    created = []
+    stage_records = []
+    corpus = CorpusManifest(".") if not args.no_manifest else None
+    files = [os.path.splitext(filename)[0] + backend.extension for filename in DEFAULT_FILES]
+    for name, filename in zip(SPECS, files):
+        try:
+            start = time.perf_counter()
+            with record_stages(args.timings) as stages:
+                if args.no_cache:
+                    create_contract(builtin_spec_path(name), filename, backend.name, args.profile, scan)
+                    built = True
+                else:
+                    built = create_contract_cached(builtin_spec_path(name), filename, backend.name, args.profile,
+                                                   scan)
+            seconds = time.perf_counter() - start
+            if built and stages is not None:
+                stage_records.append(timing_record(filename, backend.name, stages, seconds))
+            if corpus is not None and (built or filename not in corpus):
+                record_file(corpus, filename, load_document(builtin_spec_path(name)), backend, args.profile,
+                            seconds if built else None)
+            if args.truth:
+                write_sidecar(load_document(builtin_spec_path(name)), filename)
+            created.append(filename)
+            print(f"✓ Created {filename}" if built else f"✓ Up to date {filename}",
+                  f"({format_stats(*output_stats(filename))})")
+        except Exception as e:
+            print(f"❌ Error creating {filename}: {e}")
+    if corpus is not None:
+        corpus.close()
+
+    if args.timings:
+        specs = dict(zip(files, SPECS))
+        report_timings(stage_records, ".", args.cprofile_slowest,
+                       lambda filename: create_contract(builtin_spec_path(specs[os.path.basename(filename)]),
+                                                        filename, backend.name, args.profile, scan))
+
+    if len(created) == len(files):
         print("\n🎉 All test PDF contracts created successfully!")
-        print("\nFiles created:")
-        print("- test-service-agreement.pdf")
-        print("- test-employment-contract.pdf") 
-        print("- test-rental-agreement.pdf")
-        print("\nYou can now upload these PDFs to test the contract analyzer.")
-    except ImportError:
-        print("❌ Error: reportlab library not found.")
-        print("Please install it with: pip install reportlab")
-    except Exception as e:
-        print(f"❌ Error creating PDFs: {e}")
+    print("\nFiles created:")
+    for filename in created:
+        print(f"- {filename}")
+    print("\nYou can now upload these PDFs to test the contract analyzer.")
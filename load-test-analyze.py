@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Load-test /api/analyze-contract with generated contract fixtures
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import itertools
+import sys
+
+from contract_fixtures.backends import BACKENDS
+from contract_fixtures.loadtest import (TEST_ORGANIZATION_ID, load_fixtures, print_report, run_load_test,
+                                        summarize, synthetic_fixtures, synthetic_stream, write_report)
+from contract_fixtures.traffic import DEFAULT_QUEUE_SIZE, parse_arrivals, run_scheduled
+
+DEFAULT_URL = "http://localhost:3000/api/analyze-contract"
+DEFAULT_REQUESTS = 100
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test /api/analyze-contract with generated contract fixtures")
+    parser.add_argument("--url", default=DEFAULT_URL, help=f"endpoint to test (default: {DEFAULT_URL})")
+    parser.add_argument("--fixtures", action="append", default=[], metavar="PATH",
+                        help="fixture file, directory, corpus .pack, or @FILE listing fixture paths one per line, "
+                             "e.g. from query-fixtures.py, to send (repeatable)")
+    parser.add_argument("--synthetic", type=int, default=0, metavar="N",
+                        help="also render N synthetic contracts in memory and send those")
+    parser.add_argument("--seed", type=int, default=0, help="seed for --synthetic (default: 0)")
+    parser.add_argument("--backend", action="append", dest="backends", choices=["auto", *BACKENDS],
+                        help="renderer for --synthetic (repeatable, to send the same contracts in each format; "
+                             "default: auto, the fastest installed PDF backend)")
+    parser.add_argument("--requests", type=int,
+                        help=f"total requests to send (default: {DEFAULT_REQUESTS}, or the whole ramp or replay)")
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="requests in flight (default: 8; not limited with --arrivals)")
+    parser.add_argument("--arrivals", metavar="PROFILE",
+                        help="send open loop on an arrival profile instead of at a fixed concurrency: poisson:RATE, "
+                             "ramp:RATE@SECONDS,..., burst:SIZE@EVERY[,RATE] or replay:FILE (a log of timestamps)")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="arrivals: play the profile this many times faster (default: 1)")
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE,
+                        help="arrivals: fixtures generated ahead of the schedule; --synthetic contracts are "
+                             f"rendered just in time to keep it full (default: {DEFAULT_QUEUE_SIZE})")
+    parser.add_argument("--organization-id", default=TEST_ORGANIZATION_ID,
+                        help="organizationId form field (default: the setup-test-data organization)")
+    parser.add_argument("--user-id", help="userId form field (optional)")
+    parser.add_argument("--report", metavar="FILE", help="also write the summary as JSON to FILE")
+    parser.add_argument("--standin", action="store_true",
+                        help="start the bundled stand-in server and test that instead of --url")
+    parser.add_argument("--standin-extract-ms-per-mb", type=float, default=150.0,
+                        help="stand-in: simulated text extraction cost (default: 150 ms/MB)")
+    parser.add_argument("--standin-analysis-ms", type=float, default=200.0,
+                        help="stand-in: simulated analysis latency (default: 200 ms)")
+    parser.add_argument("--standin-ocr-ms-per-page", type=float, default=0.0,
+                        help="stand-in: simulated OCR cost for scanned PDFs (default: 0, reject them like the route)")
+    args = parser.parse_args(argv)
+    if not args.fixtures and not args.synthetic:
+        parser.error("give --fixtures and/or --synthetic")
+    if (args.requests is not None and args.requests < 1) or args.concurrency < 1 or args.queue_size < 1:
+        parser.error("--requests, --concurrency and --queue-size must be at least 1")
+    if args.speed <= 0:
+        parser.error("--speed must be above 0")
+    if args.arrivals is not None:
+        try:
+            args.arrival_times = parse_arrivals(args.arrivals, args.seed, args.speed)
+        except (ValueError, OSError) as e:
+            parser.error(str(e))
+    return args
+
+async def run_arrivals(args, url):
+    """Send on the arrival profile, rendering --synthetic contracts just in time"""
+    fixtures = load_fixtures(args.fixtures)
+    sources = [itertools.cycle(fixtures)] if fixtures else []
+    if args.synthetic:
+        sources.append(synthetic_stream(args.synthetic, args.seed, args.backends or ["auto"]))
+    if not sources:
+        print("❌ No fixtures found")
+        return None
+    source = itertools.chain.from_iterable(zip(*sources))
+    requests = args.requests
+    if requests is None and not args.arrivals.startswith(("ramp:", "replay:")):
+        requests = DEFAULT_REQUESTS
+    print(f"Sending {requests or 'all'} requests to {url} on {args.arrivals}"
+          + (f" at {args.speed:g}x speed" if args.speed != 1 else "") + "...")
+    return await run_scheduled(url, source, args.arrival_times, requests, args.queue_size, args.arrivals,
+                               organization_id=args.organization_id, user_id=args.user_id)
+
+async def main(args):
+    fixtures = []
+    if args.arrivals is None:
+        fixtures = load_fixtures(args.fixtures)
+        for backend in (args.backends or ["auto"]) if args.synthetic else []:
+            print(f"Rendering {args.synthetic} synthetic contracts with {backend}...")
+            fixtures += synthetic_fixtures(args.synthetic, args.seed, backend)
+        if not fixtures:
+            print("❌ No fixtures found")
+            return 1
+
+    url = args.url
+    runner = None
+    if args.standin:
+        from contract_fixtures.standin import start_standin
+        runner, base_url = await start_standin(extract_ms_per_mb=args.standin_extract_ms_per_mb,
+                                               analysis_ms=args.standin_analysis_ms,
+                                               ocr_ms_per_page=args.standin_ocr_ms_per_page)
+        url = f"{base_url}/api/analyze-contract"
+        print(f"Started stand-in server at {base_url}")
+
+    try:
+        if args.arrivals is not None:
+            result = await run_arrivals(args, url)
+            if result is None:
+                return 1
+        else:
+            requests = args.requests or DEFAULT_REQUESTS
+            print(f"Sending {requests} requests ({len(fixtures)} fixtures) to {url} "
+                  f"with concurrency {args.concurrency}...")
+            result = await run_load_test(url, fixtures, requests, args.concurrency,
+                                         organization_id=args.organization_id, user_id=args.user_id)
+    finally:
+        if runner is not None:
+            await runner.cleanup()
+
+    summary = summarize(result)
+    print_report(summary)
+    if args.report:
+        write_report(summary, args.report)
+        print(f"\n✓ Wrote {args.report}")
+    return 0
+
+if __name__ == "__main__":
+    args = parse_args()
+    if importlib.util.find_spec("aiohttp") is None:
+        print("❌ Error: aiohttp library not found.")
+        print("Please install it with: pip install aiohttp")
+        sys.exit(1)
+    try:
+        sys.exit(asyncio.run(main(args)))
+    except ImportError as e:
+        # A renderer library missing for --synthetic, say; its message says what to install
+        print(f"❌ Error: {e}")
+        sys.exit(1)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Pick generated contract fixtures from a corpus's SQLite manifest
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from contract_fixtures.backends import BACKENDS
+from contract_fixtures.manifest import CORPUS_DB, CorpusManifest, ValueFilter
+from contract_fixtures.sizing import parse_target
+from contract_fixtures.synth import RISK_LEVELS
+
+FORMATS = sorted({backend.format for backend in BACKENDS.values()})
+
+def byte_size(text):
+    try:
+        target = parse_target(text)
+    except ValueError:
+        target = None
+    if target is None or target.kind != "bytes":
+        raise argparse.ArgumentTypeError(f"Invalid size '{text}': use e.g. 50KB, 2.5MB or 900B")
+    return target.value
+
+def value_filter(text):
+    try:
+        return ValueFilter.parse(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=f"List the fixtures in a corpus's {CORPUS_DB} that match every "
+                                                 "condition, one path per line")
+    parser.add_argument("directory", nargs="?", default="test-corpus",
+                        help=f"directory holding {CORPUS_DB} (default: test-corpus)")
+    parser.add_argument("--format", action="append", dest="formats", choices=FORMATS,
+                        help="output format (repeatable: any of them)")
+    parser.add_argument("--backend", action="append", dest="backends", choices=list(BACKENDS),
+                        help="renderer backend (repeatable: any of them)")
+    parser.add_argument("--profile", help="output profile the documents were rendered with")
+    parser.add_argument("--contract-type", help="synthetic contract type, e.g. employment")
+    parser.add_argument("--risk", choices=sorted(RISK_LEVELS), help="synthetic risk level")
+    parser.add_argument("--min-size", type=byte_size, metavar="SIZE", help="at least this many bytes, e.g. 500KB")
+    parser.add_argument("--max-size", type=byte_size, metavar="SIZE", help="at most this many bytes, e.g. 50KB")
+    parser.add_argument("--min-pages", type=int, metavar="N", help="at least N pages (PDFs only)")
+    parser.add_argument("--max-pages", type=int, metavar="N", help="at most N pages (PDFs only)")
+    parser.add_argument("--clause", action="append", dest="clause_types", default=[], metavar="TYPE",
+                        help="has a clause of this type, e.g. non_compete (repeatable: all of them)")
+    parser.add_argument("--risk-flag", action="append", dest="risk_flags", default=[], metavar="TYPE",
+                        help="has a high-risk clause of this type (repeatable: all of them)")
+    parser.add_argument("--value", action="append", dest="values", type=value_filter, default=[], metavar="EXPR",
+                        help="has an amount, duration or percentage matching [CLAUSE_TYPE.]KIND OP AMOUNT, e.g. "
+                             "'non_compete.duration>5years' or 'liability.money<10' (repeatable: all of them)")
+    parser.add_argument("--sample", type=int, metavar="N", help="a seeded random sample of N of the matches")
+    parser.add_argument("--seed", type=int, default=0, help="seed for --sample (default: 0)")
+    parser.add_argument("--limit", type=int, metavar="N", help="the first N matches, by file name")
+    parser.add_argument("--count", action="store_true", help="print how many documents match instead of their paths")
+    parser.add_argument("--output", metavar="FILE",
+                        help="write the paths to FILE, for load-test-analyze.py --fixtures @FILE")
+    args = parser.parse_args(argv)
+    for name in ("sample", "limit", "min_pages", "max_pages"):
+        if getattr(args, name) is not None and getattr(args, name) < 0:
+            parser.error(f"--{name.replace('_', '-')} must be at least 0")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not os.path.exists(os.path.join(args.directory, CORPUS_DB)):
+        print(f"❌ No {CORPUS_DB} in {args.directory}; generate fixtures there first", file=sys.stderr)
+        return 1
+    start = time.perf_counter()
+    with CorpusManifest(args.directory) as manifest:
+        files = manifest.query(args.formats or (), args.backends or (), args.profile, args.contract_type, args.risk,
+                               args.min_size, args.max_size, args.min_pages, args.max_pages, args.clause_types,
+                               args.risk_flags, args.values, args.limit, args.sample, args.seed)
+    elapsed = time.perf_counter() - start
+    if args.count:
+        print(len(files))
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.writelines(f"{filename}\n" for filename in files)
+        print(f"✓ Wrote {len(files)} paths to {args.output}; send them with: "
+              f"python3 load-test-analyze.py --fixtures @{args.output}", file=sys.stderr)
+    else:
+        for filename in files:
+            print(filename)
+    print(f"{len(files)} documents matched in {elapsed * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
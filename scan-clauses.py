@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Flag which generated contracts contain which clause families, locally and before any analysis
+"""
+
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import argparse
+import os
+import sys
+import time
+
+from contract_fixtures.scanner import (CLAUSE_FAMILIES, DEFAULT_ENGINE, ENGINES, SCAN_INDEX, SCAN_SUFFIX, TRUTH_TYPES,
+                                       automaton, collect_files, merge_truth_index, scan_file, scan_record,
+                                       truth_types, write_scan_index, write_scan_sidecar)
+from contract_fixtures.truth import SIDECAR_SUFFIX, TRUTH_INDEX
+
+PROGRESS_EVERY = 1000
+
+def run_scan(filenames, workers, index, sidecars=True, engine=DEFAULT_ENGINE):
+    """Scan every document across a process pool, writing sidecars and the NDJSON indexes; returns failures"""
+    total = len(filenames)
+    records = []
+    by_directory = defaultdict(list)
+    failures = defaultdict(list)
+    chars = extract_s = scan_s = 0
+    documents = Counter()
+    # (true positives, false positives, false negatives) per family, against ground-truth sidecars
+    agreement = defaultdict(lambda: [0, 0, 0])
+    start = time.perf_counter()
+    chunksize = max(1, total // (workers * 16))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for done, result in enumerate(pool.map(partial(scan_file, engine=engine), filenames, chunksize=chunksize), 1):
+            if result.error:
+                failures[result.pid].append((result.filename, result.error))
+                print(f"[{done}/{total}] ❌ {result.filename}: {result.error}")
+                continue
+            records.append(write_scan_sidecar(result) if sidecars else scan_record(result))
+            by_directory[os.path.dirname(result.filename)].append(records[-1])
+            chars += result.chars
+            extract_s += result.extract_s
+            scan_s += result.scan_s
+            documents.update(family for family, hits in result.hits.items() if hits)
+            types = truth_types(result.filename)
+            if types is not None:
+                for family, clause_type in TRUTH_TYPES.items():
+                    found, expected = result.hits[family] > 0, clause_type in types
+                    if found or expected:
+                        agreement[family][0 if found and expected else 1 if found else 2] += 1
+            if done % PROGRESS_EVERY == 0:
+                print(f"[{done}/{total}] ✓ {chars / (1024 * 1024):.1f} MB of text scanned")
+
+    elapsed = time.perf_counter() - start
+    failed = sum(len(errors) for errors in failures.values())
+    merged = []
+    if records:
+        write_scan_index(records, index)
+        if sidecars:
+            merged = [merge_truth_index(directory, scanned) for directory, scanned in by_directory.items()]
+    megabytes = chars / (1024 * 1024)
+    print(f"\nScanned {total - failed}/{total} documents in {elapsed:.1f}s "
+          f"({total / elapsed if elapsed else 0:.1f} docs/s, {workers} workers, {engine} automaton)")
+    if records:
+        print(f"Text: {megabytes:.1f} MB; automaton {megabytes / scan_s if scan_s else 0:.0f} MB/s, "
+              f"extraction {megabytes / extract_s if extract_s else 0:.1f} MB/s per worker")
+        print("\nDocuments per clause family:")
+        for family in CLAUSE_FAMILIES:
+            line = f"- {family}: {documents[family]}"
+            if family in agreement:
+                true, false, missed = agreement[family]
+                precision = true / (true + false) if true + false else 1.0
+                recall = true / (true + missed) if true + missed else 1.0
+                line += f" (vs ground truth: precision {precision:.0%}, recall {recall:.0%})"
+            print(line)
+        print(f"\n✓ Wrote {index}" + (f", hit vectors into each {SIDECAR_SUFFIX} sidecar and a {SCAN_SUFFIX} "
+                                        "sidecar per document without one" if sidecars else ""))
+        for path in filter(None, merged):
+            print(f"✓ Added hit vectors to {path}")
+    if failures:
+        print("\nFailures by worker:")
+        for pid, errors in sorted(failures.items()):
+            print(f"- worker {pid}: {len(errors)} failed")
+            for filename, error in errors[:5]:
+                print(f"    {filename}: {error}")
+            if len(errors) > 5:
+                print(f"    ... and {len(errors) - 5} more")
+    return failed
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scan generated contracts for clause families (non-compete, "
+                                                 "liability, termination penalties, automatic renewal, liquidated "
+                                                 "damages, governing law)")
+    parser.add_argument("paths", nargs="*", default=["test-corpus"], metavar="PATH",
+                        help="PDF, DOCX, HTML or text file, or directory of them, to scan (default: test-corpus)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--index", metavar="FILE",
+                        help=f"NDJSON hit vectors to write (default: {SCAN_INDEX} in the first directory scanned)")
+    parser.add_argument("--engine", choices=ENGINES, default=DEFAULT_ENGINE,
+                        help="automaton engine (default: aho-corasick, which needs pip install pyahocorasick; re "
+                             "needs nothing installed, but is slower on clause-dense text)")
+    parser.add_argument("--no-sidecars", action="store_true",
+                        help=f"don't add hit vectors to the {SIDECAR_SUFFIX} sidecars and {TRUTH_INDEX}, or write "
+                             f"a {SCAN_SUFFIX} sidecar next to documents without ground truth")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.index is None:
+        directory = next((path for path in args.paths if os.path.isdir(path)), ".")
+        args.index = os.path.join(directory, SCAN_INDEX)
+    return args
+
+if __name__ == "__main__":
+    args = parse_args()
+    filenames = collect_files(args.paths)
+    if not filenames:
+        print("❌ No generated documents found")
+        sys.exit(1)
+
+    try:
+        # Compile here first, so a missing pyahocorasick fails before any worker starts
+        automaton(args.engine)
+        print(f"Scanning {len(filenames)} documents...")
+        failed = run_scan(filenames, args.workers, args.index, sidecars=not args.no_sidecars, engine=args.engine)
+    except ImportError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,68 @@
+import os
+
+from contract_fixtures.bench import MAX_REPEAT, best_of, calibrate, compare, load_results, run_case
+
+BASELINE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bench-baseline.json")
+
+
+def result(case="service-agreement/small/reportlab", wall=0.1, calibrated=None, peak=10.0, size=50000):
+    return {"case": case, "wall_min_s": wall, "wall_calibrated": calibrated, "peak_mb": peak, "bytes": size}
+
+
+def suite(*results):
+    return {"meta": {}, "results": list(results)}
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    regressions = compare(suite(result(wall=0.2, peak=20.0, size=60000)), suite(result()))
+    assert [(case, metric) for case, metric, _, _ in regressions] == [
+        ("service-agreement/small/reportlab", "wall_min_s"),
+        ("service-agreement/small/reportlab", "peak_mb"),
+        ("service-agreement/small/reportlab", "bytes"),
+    ]
+
+
+def test_compare_ignores_changes_under_the_noise_floor():
+    # +50% on a 4 ms case is 2 ms, under the 5 ms floor; +0.2 MB is under the 0.25 MB floor
+    assert compare(suite(result(wall=0.006, peak=0.6)), suite(result(wall=0.004, peak=0.4))) == []
+    assert compare(suite(result(wall=0.012)), suite(result(wall=0.004)))
+
+
+def test_compare_scales_wall_time_by_calibration():
+    # Twice the wall time at the same calibrated cost is a machine running at half speed, not a regression...
+    assert compare(suite(result(wall=0.2, calibrated=10.0)), suite(result(wall=0.1, calibrated=10.0))) == []
+    # ...but a higher calibrated cost is one, even at the same wall time
+    regressions = compare(suite(result(wall=0.1, calibrated=20.0)), suite(result(wall=0.1, calibrated=10.0)))
+    assert regressions == [("service-agreement/small/reportlab", "wall_min_s", 0.1, 0.2)]
+
+
+def test_compare_skips_new_cases():
+    assert compare(suite(result(case="new/case/fpdf", wall=9.0)), suite(result())) == []
+
+
+def test_best_of_keeps_the_fastest_calibrated_run():
+    passes = [suite(result(calibrated=12.0), result(case="b", calibrated=5.0)),
+              suite(result(calibrated=11.0), result(case="b", calibrated=6.0))]
+    best = best_of(passes)
+    assert [entry["wall_calibrated"] for entry in best["results"]] == [11.0, 5.0]
+
+
+def test_calibrate():
+    assert 0 < calibrate() < 1
+
+
+def test_run_case_adapts_its_repeat():
+    case = run_case("service-agreement", "small", "txt", repeat=2)
+    assert case["case"] == "service-agreement/small/txt"
+    # A sub-millisecond render is repeated until it has been timed for MIN_TIMED_S, or MAX_REPEAT times
+    assert 2 <= case["runs"] <= MAX_REPEAT
+    assert case["wall_calibrated"] > 0
+    assert compare(suite(case), suite(case)) == []
+
+
+def test_committed_baseline_is_loadable():
+    baseline = load_results(BASELINE)
+    assert baseline["results"]
+    for entry in baseline["results"]:
+        assert {"case", "wall_min_s", "wall_calibrated", "peak_mb", "bytes"} <= set(entry)
+    assert compare(baseline, baseline) == []
@@ -0,0 +1,67 @@
+import os
+
+from contract_fixtures.cache import BuildCache, cache_key, cached_render, document_digest
+from contract_fixtures.images import ScanSettings
+from contract_fixtures.render import render
+from contract_fixtures.spec import Block, Document
+from contract_fixtures.synth import synthesize
+
+DOCUMENT = Document("pinned", "Pinned", (Block("title", "Pinned"), Block("paragraph", "Pay $1,500 within 30 days.")))
+
+
+def test_document_digest_is_pinned():
+    # Hashed from the document's content alone, so it is the same in every process and on every machine
+    assert document_digest(DOCUMENT) == "c603ba645aba5279c166df6790728aae2b763fe0ec6e30387a6e3c0542c310ff"
+
+
+def test_document_digest_ignores_meta():
+    assert document_digest(Document(DOCUMENT.id, DOCUMENT.title, DOCUMENT.blocks, meta={"seed": 1})) \
+        == document_digest(DOCUMENT)
+
+
+def test_cache_key_is_pinned():
+    # txt is built in, so its version never changes; this only moves when RENDERER_VERSION is bumped
+    assert cache_key(DOCUMENT, "txt") == "d9f7d6fe0017586f93139bb2363250ab9ec6c42e575686585aafceba98f015e0"
+
+
+def test_cache_key_is_stable():
+    assert cache_key(synthesize(0, 1), "txt", profile=None) == cache_key(synthesize(0, 1), "txt", profile=None)
+    assert len(cache_key(DOCUMENT, "txt")) == 64
+
+
+def test_cache_key_changes_with_every_input():
+    keys = {
+        cache_key(DOCUMENT, "txt"),
+        cache_key(synthesize(0, 1), "txt"),
+        cache_key(DOCUMENT, "html"),
+        cache_key(DOCUMENT, "txt", profile="minimal"),
+        cache_key(DOCUMENT, "txt", stream_pages=200, chunk_pages=100),
+        cache_key(DOCUMENT, "scan", scan=ScanSettings()),
+        cache_key(DOCUMENT, "scan", scan=ScanSettings(skew=1.5)),
+    }
+    assert len(keys) == 7
+
+
+def test_cached_render_skips_fresh_outputs(tmp_path):
+    filename = str(tmp_path / "pinned.txt")
+
+    def render_txt(document, output):
+        render(document, output, "txt")
+
+    assert cached_render(render_txt, DOCUMENT, filename, "txt") is True
+    assert cached_render(render_txt, DOCUMENT, filename, "txt") is False
+    os.remove(filename)
+    assert cached_render(render_txt, DOCUMENT, filename, "txt") is True
+
+
+def test_evict_stale_only_removes_its_own_mode(tmp_path):
+    cache = BuildCache(str(tmp_path))
+    for name, mode in (("a.txt", "batch"), ("b.txt", "batch"), ("c.txt", "stream")):
+        (tmp_path / name).write_text(name)
+        cache.record(str(tmp_path / name), name, mode)
+    cache.save()
+
+    cache = BuildCache(str(tmp_path))
+    assert cache.evict_stale([str(tmp_path / "a.txt")], "batch") == [str(tmp_path / "b.txt")]
+    assert sorted(os.listdir(tmp_path)) == [".fixture-cache.json", "a.txt", "c.txt"]
+    assert cache.is_fresh(str(tmp_path / "c.txt"), "c.txt")
@@ -0,0 +1,30 @@
+import pytest
+
+from contract_fixtures.families import (TOLERANCE, load_families, member_record, near_duplicate, save_families,
+                                        similarity, similarity_label)
+from contract_fixtures.synth import synthesize
+
+
+def test_similarity_label():
+    assert similarity_label(0.99) == "s99"
+    assert similarity_label(0.995) == "s99.5"
+    assert similarity_label(1.0) == "s100"
+
+
+@pytest.mark.parametrize("target", [0.99, 0.9, 0.5])
+def test_near_duplicate_hits_its_target(target):
+    base = synthesize(6, 0)
+    variant, actual = near_duplicate(base, target, seed=1)
+    assert abs(actual - target) <= TOLERANCE
+    assert similarity(base, variant) == actual
+    assert variant.id == f"{base.id}-{similarity_label(target)}"
+    assert variant.meta["base"] == base.id
+    assert near_duplicate(base, target, seed=1)[0] == variant
+
+
+def test_families_round_trip(tmp_path):
+    base = synthesize(6, 0)
+    variant, _ = near_duplicate(base, 0.9)
+    members = [member_record("base.txt", base.id, base), member_record("variant.txt", base.id, variant, 0.9)]
+    save_families(str(tmp_path), members)
+    assert load_families(str(tmp_path)) == {member["file"]: member for member in members}
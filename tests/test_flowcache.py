@@ -0,0 +1,33 @@
+from contract_fixtures.flowcache import CacheStats, FlowableCache
+
+
+def test_builds_once_per_key():
+    cache = FlowableCache()
+    built = []
+    for key in ("a", "b", "a", "a"):
+        cache.get(key, lambda: built.append(key) or key.upper())
+    assert built == ["a", "b"]
+    assert cache.stats() == CacheStats(hits=2, misses=2)
+    assert cache.stats().hit_rate == 0.5
+
+
+def test_evicts_least_recently_used():
+    cache = FlowableCache(maxsize=2)
+    cache.get("a", object)
+    cache.get("b", object)
+    cache.get("a", object)
+    cache.get("c", object)
+    assert len(cache) == 2
+    before = cache.stats()
+    cache.get("a", object)
+    cache.get("b", object)
+    assert cache.stats().since(before) == CacheStats(hits=1, misses=1)
+
+
+def test_clear():
+    cache = FlowableCache()
+    cache.get("a", object)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats() == CacheStats(0, 0)
+    assert cache.stats().hit_rate == 0.0
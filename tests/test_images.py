@@ -0,0 +1,16 @@
+import pytest
+
+from contract_fixtures.images import fit_size, scan_jpeg
+
+
+def test_fit_size():
+    assert fit_size(100, 50, 400, 400) == (400, 200)
+    assert fit_size(100, 400, 400, 400) == (100, 400)
+
+
+def test_scan_jpeg_is_seeded():
+    pytest.importorskip("PIL")
+    first = scan_jpeg(64, 48, seed=1)
+    assert first.startswith(b"\xff\xd8")
+    assert scan_jpeg(64, 48, seed=1) == first
+    assert scan_jpeg(64, 48, seed=2) != first
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from contract_fixtures.loadtest import (Fixture, LoadTestResult, Sample, load_fixtures, run_load_test, size_bucket,
+                                        summarize, synthetic_stream)
+from contract_fixtures.pack import pack_files
+from contract_fixtures.standin import start_standin
+from contract_fixtures.traffic import parse_arrivals, run_scheduled
+
+
+def test_size_bucket():
+    assert size_bucket(0) == "<100KB"
+    assert size_bucket(100 * 1024) == "<100KB"
+    assert size_bucket(100 * 1024 + 1) == "100KB-1MB"
+    assert size_bucket(50 * 1024 * 1024) == ">10MB"
+
+
+def test_summarize():
+    samples = [Sample("pdf", "<100KB", 200, latency) for latency in (0.1, 0.2, 0.3, 0.4)]
+    samples.append(Sample("txt", "1-5MB", 500, 1.0, error="boom"))
+    summary = summarize(LoadTestResult(samples, elapsed=2.0, concurrency=4))
+    assert summary["throughput_rps"] == 2.5
+    assert summary["statuses"] == {"200": 4, "500": 1}
+    assert summary["overall"] == {"requests": 5, "errors": 1, "p50_ms": 300.0, "p95_ms": 1000.0, "p99_ms": 1000.0}
+    assert summary["by_type"]["pdf"]["p95_ms"] == 400.0
+    assert list(summary["by_size"]) == ["<100KB", "1-5MB"]
+
+
+def test_load_fixtures(tmp_path):
+    for name in ("a.txt", "b.pdf", "notes.md"):
+        (tmp_path / name).write_bytes(name.encode())
+    pack_files(str(tmp_path / "corpus.pack"), [str(tmp_path / "a.txt")])
+    (tmp_path / "list.txt").write_text(f"# chosen\n{tmp_path / 'b.pdf'}\n")
+
+    fixtures = load_fixtures([str(tmp_path / "corpus.pack"), f"@{tmp_path / 'list.txt'}"])
+    assert [(fixture.name, bytes(fixture.data)) for fixture in fixtures] == [("a.txt", b"a.txt"), ("b.pdf", b"b.pdf")]
+    assert [fixture.name for fixture in load_fixtures([str(tmp_path)])] == ["a.txt", "b.pdf", "list.txt"]
+
+
+def test_fixture_kinds():
+    assert Fixture("a.DOCX", b"").content_type.endswith("wordprocessingml.document")
+    assert Fixture("a.bin", b"").content_type == "application/octet-stream"
+    assert Fixture("a.pdf", b"/Font /F1").kind == "pdf"
+    assert Fixture("a.pdf", b"/Image").kind == "pdf-scan"
+
+
+def against_standin(run):
+    """Run `run(url)` against a fresh zero-latency stand-in"""
+    async def main():
+        runner, base_url = await start_standin(extract_ms_per_mb=0, analysis_ms=0)
+        try:
+            return await run(f"{base_url}/api/analyze-contract")
+        finally:
+            await runner.cleanup()
+    return asyncio.run(main())
+
+
+def test_run_load_test():
+    pytest.importorskip("aiohttp")
+    fixtures = [Fixture("a.txt", b"contract text " * 20), Fixture("b.png", b"\x89PNG")]
+    result = against_standin(lambda url: run_load_test(url, fixtures, requests=9, concurrency=3))
+    assert result.concurrency == 3
+    assert sorted(sample.status for sample in result.samples) == [200] * 5 + [400] * 4
+
+
+def test_run_scheduled():
+    pytest.importorskip("aiohttp")
+    source = synthetic_stream(3, backends=("txt",))
+    result = against_standin(lambda url: run_scheduled(url, source, parse_arrivals("burst:4@0.2"), requests=8,
+                                                       queue_size=4, profile="burst:4@0.2"))
+    assert [sample.status for sample in result.samples] == [200] * 8
+    assert result.elapsed >= 0.2
+    assert summarize(result)["schedule"]["profile"] == "burst:4@0.2"
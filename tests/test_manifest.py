@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from contract_fixtures.backends import get_backend
+from contract_fixtures.manifest import CORPUS_DB, CorpusManifest, ValueFilter, record_file, value_amount
+from contract_fixtures.render import render
+from contract_fixtures.synth import synthesize
+from contract_fixtures.truth import ground_truth
+
+
+def test_value_amount():
+    assert value_amount("money", "$1,250,000.50") == 1250000.5
+    assert value_amount("percent", "12.5%") == 12.5
+    assert value_amount("duration", "2 years") == 730
+    assert value_amount("duration", "6-month") == 180
+    assert value_amount("duration", "48 hours") == 2
+    assert value_amount("date", "January 5, 2024") is None
+
+
+def test_value_filter_parse():
+    assert ValueFilter.parse("non_compete.duration>5years") == ValueFilter("non_compete", "duration", ">", 1825)
+    assert ValueFilter.parse("money <= 10") == ValueFilter(None, "money", "<=", 10)
+    assert ValueFilter.parse("percent>=1.5") == ValueFilter(None, "percent", ">=", 1.5)
+    for text in ("duration>forever", "date>2024", "money", "liability.money~5", "Money>5"):
+        with pytest.raises(ValueError, match="Invalid value filter"):
+            ValueFilter.parse(text)
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Twelve synthetic txt documents recorded in a manifest; yields (manifest, {filename: truth})"""
+    truths = {}
+    with CorpusManifest(str(tmp_path)) as manifest:
+        for index in range(12):
+            document = synthesize(9, index)
+            filename = str(tmp_path / f"synthetic-{index:06d}.txt")
+            render(document, filename, "txt")
+            record_file(manifest, filename, document, get_backend("txt"))
+            truths[os.path.normpath(filename)] = ground_truth(document)
+        manifest.commit()
+        yield manifest, truths
+
+
+def test_query(corpus, tmp_path):
+    manifest, truths = corpus
+    assert os.path.exists(tmp_path / CORPUS_DB)
+    assert len(manifest.files()) == 12
+    assert sorted(manifest.query()) == sorted(truths)
+    assert manifest.query(formats=("pdf",)) == []
+    assert manifest.query(limit=3) == sorted(truths)[:3]
+
+    leases = [filename for filename, truth in truths.items() if truth["contract_type"] == "lease"]
+    assert manifest.query(contract_type="lease") == sorted(leases)
+    flagged = [filename for filename, truth in truths.items() if "non_compete" in truth["risk_flags"]]
+    assert manifest.query(risk_flags=("non_compete",)) == sorted(flagged)
+
+    big = [filename for filename, truth in truths.items()
+           if any(value["kind"] == "money" and value_amount("money", value["text"]) > 100000
+                  for value in truth["values"])]
+    assert manifest.query(values=(ValueFilter.parse("money>100000"),)) == sorted(big)
+
+
+def test_sample_is_seeded(corpus):
+    manifest, _ = corpus
+    assert manifest.query(sample=4, seed=1) == manifest.query(sample=4, seed=1)
+    assert len(set(manifest.query(sample=4, seed=1))) == 4
+
+
+def test_merge_and_forget(corpus, tmp_path):
+    manifest, truths = corpus
+    shard_dir = tmp_path / "shard-1-of-1"
+    shard_dir.mkdir()
+    with CorpusManifest(str(shard_dir)) as shard:
+        filename = str(shard_dir / "synthetic-000100.txt")
+        render(synthesize(9, 100), filename, "txt")
+        record_file(shard, filename, synthesize(9, 100), get_backend("txt"))
+    assert manifest.merge(str(shard_dir), [filename]) == 1
+    assert os.path.join("shard-1-of-1", "synthetic-000100.txt") in manifest.files()
+    assert filename in manifest
+
+    manifest.forget([filename, *truths])
+    assert manifest.files() == set()
@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from contract_fixtures.pack import CorpusPack, PackWriter, pack_files
+
+
+def test_round_trip(tmp_path):
+    files = []
+    for index, data in enumerate([b"first", b"", b"third document"]):
+        files.append(tmp_path / f"doc-{index}.txt")
+        files[-1].write_bytes(data)
+    path = str(tmp_path / "corpus.pack")
+    assert pack_files(path, [str(f) for f in files], {str(files[0]): {"kind": "txt"}}) > 0
+
+    with CorpusPack(path) as pack:
+        assert len(pack) == 3
+        assert list(pack) == ["doc-0.txt", "doc-1.txt", "doc-2.txt"]
+        assert "doc-1.txt" in pack and "doc-9.txt" not in pack
+        assert bytes(pack["doc-2.txt"]) == b"third document"
+        assert bytes(pack["doc-1.txt"]) == b""
+        assert pack.entry("doc-0.txt")["kind"] == "txt"
+        names = [name for name, _ in pack.sample(3, random.Random(0))]
+        assert sorted(names) == list(pack)
+        name, view = pack.choice(random.Random(0))
+        assert bytes(view) == (tmp_path / name).read_bytes()
+        del view
+
+
+def test_duplicate_names_abort_the_pack(tmp_path):
+    path = tmp_path / "corpus.pack"
+    with pytest.raises(ValueError, match="Duplicate document 'a'"):
+        with PackWriter(str(path)) as writer:
+            writer.add("a", b"1")
+            writer.add("a", b"2")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not.pack"
+    for data in (b"", b"CFPACK01" + b"\0" * 40, b"x" * 100):
+        path.write_bytes(data)
+        with pytest.raises(ValueError, match="Not a corpus pack"):
+            CorpusPack(str(path))
@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+from contract_fixtures.pathological import (BUILDERS, MAX_DEPTH, SHAPES, check_shape, growth_exponent,
+                                            write_report)
+
+
+def test_growth_exponent():
+    assert growth_exponent([1, 2, 4], [3, 6, 12]) == 1.0
+    assert growth_exponent([1, 2, 4], [1, 4, 16]) == 2.0
+    assert growth_exponent([1, 2, 4], [5, 5, 5]) == 0.0
+    assert growth_exponent([1, 2], [0, 4]) is None
+    assert growth_exponent([3, 3], [1, 2]) is None
+
+
+@pytest.mark.parametrize("name", sorted(BUILDERS))
+def test_shapes_scale(name):
+    small, large = SHAPES[name].build(4), SHAPES[name].build(40)
+    assert small.id == f"pathological-{name}-4"
+    assert len("\n".join(large.lines())) > len("\n".join(small.lines()))
+
+
+def test_nested_bullets_stay_within_depth():
+    levels = [block.level for block in BUILDERS["nested-bullets"](50).blocks if block.kind == "bullet"]
+    assert max(levels) == MAX_DEPTH - 1
+    assert all(abs(later - earlier) == 1 for earlier, later in zip(levels, levels[1:]))
+
+
+def test_check_shape(tmp_path):
+    report, data = check_shape(SHAPES["many-sections"], backend="txt", repeat=1, ladder=(0.02, 0.04))
+    assert [measurement.scale for measurement in report.measurements] == [10, 20]
+    assert data.startswith(b"SERVICE AGREEMENT")
+    with open(write_report([report], str(tmp_path)), encoding="utf-8") as f:
+        assert json.load(f)["shapes"][0]["shape"] == "many-sections"
@@ -0,0 +1,39 @@
+import io
+
+import pytest
+
+from contract_fixtures.pdfutil import concatenate_pdfs, count_pages, has_text_layer
+from contract_fixtures.render import render, render_bytes
+from contract_fixtures.spec import load_builtin
+from contract_fixtures.streaming import pad_document
+
+pytest.importorskip("reportlab")
+
+
+def test_count_pages_and_text_layer():
+    data = render_bytes(load_builtin("service-agreement"), "reportlab")
+    assert count_pages(data) == 2
+    assert has_text_layer(data)
+    assert not has_text_layer(b"%PDF-1.4\n1 0 obj\n<< /Type /Page >>\nendobj\n")
+
+
+def test_concatenate_pdfs(tmp_path):
+    pypdf = pytest.importorskip("pypdf")
+    paths = []
+    for name in ("service-agreement", "simple-contract", "rental-agreement"):
+        paths.append(str(tmp_path / f"{name}.pdf"))
+        render(pad_document(load_builtin(name), 3), paths[-1], "reportlab")
+    pages = [count_pages((tmp_path / path).read_bytes()) for path in paths]
+
+    output = io.BytesIO()
+    output.write(b"leading bytes the offsets must not count")
+    start = output.tell()
+    assert concatenate_pdfs(paths, output) == sum(pages)
+
+    data = output.getvalue()[start:]
+    assert count_pages(data) == sum(pages)
+    reader = pypdf.PdfReader(io.BytesIO(data), strict=True)
+    assert len(reader.pages) == sum(pages)
+    assert reader.metadata.title == load_builtin("service-agreement").title
+    for path, first_page in zip(paths, (0, pages[0], pages[0] + pages[1])):
+        assert reader.pages[first_page].extract_text() == pypdf.PdfReader(path).pages[0].extract_text()
@@ -0,0 +1,19 @@
+import pytest
+
+from contract_fixtures.profiles import PROFILES, document_info, get_profile, xmp_packet
+from contract_fixtures.synth import synthesize
+
+
+def test_get_profile():
+    assert get_profile(None) is None
+    assert get_profile("minimal") is PROFILES["minimal"]
+    assert get_profile(PROFILES["bloated"]) is PROFILES["bloated"]
+    with pytest.raises(ValueError, match="Unknown output profile 'tiny'"):
+        get_profile("tiny")
+
+
+def test_document_info_levels():
+    document = synthesize(0, 0)
+    assert document_info(document, "none") != document_info(document, "full")
+    assert document_info(document, "basic") == document_info(document, "basic")
+    assert xmp_packet(document_info(document, "full")).startswith("<?xpacket")
@@ -0,0 +1,48 @@
+import io
+import zipfile
+
+import pytest
+
+from contract_fixtures.backends import BACKENDS, available_backends, get_backend, select_backend
+from contract_fixtures.render import render, render_buffer, render_bytes
+from contract_fixtures.spec import load_builtin
+from contract_fixtures.truth import expected_text
+
+DOCUMENT = load_builtin("service-agreement")
+
+
+def test_registry():
+    assert get_backend("txt").extension == ".txt"
+    with pytest.raises(ValueError, match="Unknown renderer backend 'latex'"):
+        get_backend("latex")
+    costs = [backend.cost for backend in available_backends()]
+    assert costs == sorted(costs)
+    assert all(backend.format == "html" for backend in available_backends("html"))
+    assert select_backend("auto", format="txt") is BACKENDS["txt"]
+
+
+def test_txt_is_the_expected_text():
+    assert render_bytes(DOCUMENT, "txt") == expected_text(DOCUMENT).encode("utf-8")
+    assert bytes(render_buffer(DOCUMENT, "txt")) == render_bytes(DOCUMENT, "txt")
+
+
+def test_html_and_docx():
+    assert b"SERVICE AGREEMENT" in render_bytes(DOCUMENT, "html")
+    with zipfile.ZipFile(io.BytesIO(render_bytes(DOCUMENT, "docx"))) as archive:
+        assert "word/document.xml" in archive.namelist()
+
+
+def test_render_to_a_path(tmp_path):
+    filename = str(tmp_path / "contract.txt")
+    assert render(DOCUMENT, filename, "txt") == filename
+    assert (tmp_path / "contract.txt").read_bytes() == render_bytes(DOCUMENT, "txt")
+
+
+@pytest.mark.parametrize("backend", ["reportlab", "fpdf"])
+@pytest.mark.parametrize("profile", [None, "minimal", "bloated"])
+def test_pdf_renders_are_byte_reproducible(backend, profile):
+    if not get_backend(backend).is_available():
+        pytest.skip(f"{get_backend(backend).package} is not installed")
+    first = render_bytes(DOCUMENT, backend, profile)
+    assert first.startswith(b"%PDF")
+    assert render_bytes(DOCUMENT, backend, profile) == first
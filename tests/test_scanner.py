@@ -0,0 +1,107 @@
+import json
+import os
+import zipfile
+
+import pytest
+
+from contract_fixtures.render import render
+from contract_fixtures.scanner import (Automaton, CLAUSE_FAMILIES, TRUTH_TYPES, docx_text, extract_text,
+                                       merge_truth_index, scan_file, truth_types, write_scan_sidecar)
+from contract_fixtures.synth import synthesize
+from contract_fixtures.truth import TRUTH_INDEX, read_sidecar, write_index, write_sidecar
+
+TEXT = ("this agreement is governed by the laws of delaware. governing law: delaware. "
+        "the non-compete and non-solicitation terms survive; total liability shall not exceed fees. "
+        "liquidated damages apply. this lease will automatically renew.")
+HITS = {"non_compete": 2, "liability": 1, "termination_penalty": 0, "auto_renewal": 1, "liquidated_damages": 1,
+        "governing_law": 2}
+
+
+def test_regex_engine_counts():
+    assert Automaton(engine="re").count(TEXT) == HITS
+    assert Automaton(engine="re").count("") == dict.fromkeys(CLAUSE_FAMILIES, 0)
+
+
+def test_engines_agree():
+    pytest.importorskip("ahocorasick")
+    regex, machine = Automaton(engine="re"), Automaton(engine="aho-corasick")
+    assert machine.count(TEXT) == HITS
+    for index in range(20):
+        text = "\n".join(synthesize(4, index).lines()).lower()
+        assert machine.count(text) == regex.count(text)
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError, match="Unknown engine 'grep'"):
+        Automaton(engine="grep")
+
+
+def test_windows_cover_every_phrase():
+    machine = Automaton(engine="re")
+    windows = machine.windows(TEXT)
+    assert all(earlier[1] < later[0] for earlier, later in zip(windows, windows[1:]))
+    for phrases in CLAUSE_FAMILIES.values():
+        for phrase in phrases:
+            position = TEXT.find(phrase)
+            if position != -1:
+                assert any(start <= position and position + len(phrase) <= end for start, end in windows)
+
+
+def test_docx_text_keeps_runs_apart():
+    xml = ('<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+           '<w:p><w:r><w:t>Governing</w:t></w:r><w:r><w:t xml:space="preserve"> Law</w:t></w:r></w:p>'
+           '<w:p><w:r><w:t>Fee:</w:t><w:tab/><w:t>$500</w:t><w:br/><w:t>&amp; costs</w:t></w:r></w:p>'
+           '</w:body></w:document>')
+    assert docx_text(xml) == "Governing Law\nFee:\t$500\n& costs"
+
+
+@pytest.mark.parametrize("backend", ["txt", "html", "docx"])
+def test_extract_text_finds_the_same_hits(tmp_path, backend):
+    document = synthesize(4, 0)
+    filename = str(tmp_path / f"contract.{backend}")
+    render(document, filename, backend)
+    if backend == "docx":
+        with zipfile.ZipFile(filename) as archive:
+            assert "word/document.xml" in archive.namelist()
+    machine = Automaton(engine="re")
+    assert machine.count(extract_text(filename).lower()) == machine.count("\n".join(document.lines()).lower())
+
+
+def test_scan_results_join_the_ground_truth(tmp_path):
+    directory = str(tmp_path)
+    filenames = [os.path.join(directory, f"synthetic-{index:06d}.txt") for index in range(3)]
+    records = []
+    for index, filename in enumerate(filenames[:2]):
+        document = synthesize(4, index)
+        render(document, filename, "txt")
+        records.append(write_sidecar(document, filename))
+    write_index(records, directory)
+    render(synthesize(4, 2), filenames[2], "txt")
+
+    results = [scan_file(filename, engine="re") for filename in filenames]
+    assert all(result.error is None for result in results)
+    scanned = [write_scan_sidecar(result) for result in results]
+    assert merge_truth_index(directory, scanned) == os.path.join(directory, TRUTH_INDEX)
+
+    assert read_sidecar(filenames[0])["scan"]["hits"] == results[0].hits
+    assert os.path.exists(os.path.join(directory, "synthetic-000002.scan.json"))
+    assert not os.path.exists(os.path.join(directory, "synthetic-000000.scan.json"))
+    with open(os.path.join(directory, TRUTH_INDEX), encoding="utf-8") as f:
+        assert [json.loads(line)["scan"]["hits"] for line in f] == [result.hits for result in results[:2]]
+    assert merge_truth_index(str(tmp_path / "elsewhere"), scanned) is None
+
+
+def test_hits_agree_with_ground_truth(tmp_path):
+    for index in range(10):
+        document = synthesize(4, index, risk="high")
+        filename = str(tmp_path / f"synthetic-{index:06d}.txt")
+        render(document, filename, "txt")
+        write_sidecar(document, filename)
+        hits, types = scan_file(filename, engine="re").hits, truth_types(filename)
+        for family, clause_type in TRUTH_TYPES.items():
+            assert (hits[family] > 0) == (clause_type in types), (filename, family)
+
+
+def test_scan_file_reports_errors(tmp_path):
+    result = scan_file(str(tmp_path / "missing.txt"), engine="re")
+    assert result.error.startswith("FileNotFoundError")
@@ -0,0 +1,96 @@
+import json
+import os
+
+import pytest
+
+from contract_fixtures.render import render
+from contract_fixtures.shards import (CORPUS_INDEX, Shard, document_record, file_digest, merge_shards, parse_shard,
+                                      write_shard_manifest)
+from contract_fixtures.synth import synthesize
+from contract_fixtures.truth import TRUTH_INDEX, write_index, write_sidecar
+
+SETTINGS = {"seed": 5, "backend": "txt"}
+COUNT = 7
+
+
+def build_shard(directory, shard, settings=SETTINGS, count=COUNT):
+    """Build one shard's slice into directory/shard-i-of-N/ with its manifest beside it, as create-test-pdfs.py does"""
+    output_dir = os.path.join(directory, shard.label)
+    os.makedirs(output_dir)
+    documents, records = [], []
+    for index in shard.range(count):
+        filename = os.path.join(output_dir, f"synthetic-{index:06d}.txt")
+        document = synthesize(settings["seed"], index)
+        render(document, filename, settings["backend"])
+        records.append(write_sidecar(document, filename))
+        documents.append(document_record(filename, index, directory))
+    truth_index = write_index(records, output_dir)
+    return write_shard_manifest(directory, shard, settings, count, documents, truth_index=truth_index)
+
+
+def read_ndjson(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def manifest_documents(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["documents"]
+
+
+def test_shards_cover_every_index_once():
+    for count in (0, 1, 7, 100):
+        for shards in (1, 3, 8):
+            indexes = [index for number in range(1, shards + 1) for index in Shard(number, shards).range(count)]
+            assert indexes == list(range(count))
+
+
+def test_parse_shard():
+    assert parse_shard(" 3/8 ") == Shard(3, 8)
+    assert Shard(3, 8).label == "shard-3-of-8"
+    for text in ("0/8", "9/8", "3", "3/", "a/b", "-1/2"):
+        with pytest.raises(ValueError, match="Invalid shard"):
+            parse_shard(text)
+
+
+def test_merge_shards(tmp_path):
+    directory = str(tmp_path)
+    for number in (1, 2, 3):
+        build_shard(directory, Shard(number, 3))
+    merged = merge_shards(directory)
+
+    assert (merged.shards, merged.documents) == (3, COUNT)
+    assert merged.index == os.path.join(directory, CORPUS_INDEX)
+    index = read_ndjson(merged.index)
+    assert [record["index"] for record in index] == list(range(COUNT))
+    assert [record["shard"] for record in index] == [1, 1, 2, 2, 3, 3, 3]
+    for record in index:
+        assert record["sha256"] == file_digest(os.path.join(directory, record["file"]))
+    assert merged.bytes == sum(record["bytes"] for record in index)
+    assert [record["file"] for record in read_ndjson(merged.truth_index)] == [
+        f"synthetic-{index:06d}.txt" for index in range(COUNT)]
+    assert merged.truth_index == os.path.join(directory, TRUTH_INDEX)
+
+
+def test_shard_digests_are_reproducible(tmp_path):
+    # Another node building the same slice gets the same files, byte for byte
+    for node in ("a", "b"):
+        build_shard(str(tmp_path / node), Shard(2, 3))
+    digests = [[document["sha256"] for document in manifest_documents(tmp_path / node / "shard-2-of-3.json")]
+               for node in ("a", "b")]
+    assert digests[0] == digests[1]
+
+
+def test_merge_rejects_shards_that_dont_fit(tmp_path):
+    directory = str(tmp_path)
+    build_shard(directory, Shard(1, 3))
+    build_shard(directory, Shard(2, 3), settings=dict(SETTINGS, seed=6))
+    with pytest.raises(ValueError) as error:
+        merge_shards(directory)
+    assert "shard 2 was generated with different seed than shard 1" in str(error.value)
+    assert "missing shards 3 of 3" in str(error.value)
+
+
+def test_merge_needs_manifests(tmp_path):
+    with pytest.raises(ValueError, match="No shard manifests"):
+        merge_shards(str(tmp_path))
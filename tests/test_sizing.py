@@ -0,0 +1,37 @@
+import pytest
+
+from contract_fixtures.sizing import MAX_UPLOAD_BYTES, Target, fit_document, parse_target
+from contract_fixtures.spec import load_builtin
+
+
+def test_parse_target():
+    assert parse_target("9.9MB") == Target("bytes", int(9.9 * 1024 * 1024), "9.9MB")
+    assert parse_target(" 500 kb ") == Target("bytes", 500 * 1024, "500KB")
+    assert parse_target("200pages") == Target("pages", 200, "200pages")
+    assert parse_target("3p") == Target("pages", 3, "3pages")
+    for text in ("", "10", "10GB", "-5MB", "lots"):
+        with pytest.raises(ValueError, match="Invalid size target"):
+            parse_target(text)
+
+
+def test_expect():
+    assert parse_target("10MB").expect == "accepted"
+    assert Target("bytes", MAX_UPLOAD_BYTES + 1, "big").expect == "rejected"
+    assert parse_target("500pages").expect == "accepted"
+
+
+def test_fit_txt_to_bytes():
+    fixture = fit_document(load_builtin("service-agreement"), parse_target("40KB"), backend="txt")
+    assert fixture.within_tolerance
+    assert fixture.record("big.txt")["expect"] == "accepted"
+
+
+def test_fit_pdf_to_pages():
+    pytest.importorskip("reportlab")
+    fixture = fit_document(load_builtin("simple-contract"), parse_target("4pages"), backend="reportlab")
+    assert fixture.pages >= 4 and fixture.within_tolerance
+
+
+def test_page_targets_need_a_pdf_backend():
+    with pytest.raises(ValueError, match="Page targets need a PDF backend"):
+        fit_document(load_builtin("simple-contract"), parse_target("4pages"), backend="txt")
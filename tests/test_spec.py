@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from contract_fixtures.spec import Block, builtin_specs, compile_spec, load_builtin, load_document
+
+SPEC = {
+    "title": "NDA",
+    "preamble": ["Between the parties."],
+    "clauses": [{"heading": "Secrecy", "body": ["Keep it secret."], "bullets": ["No copies."],
+                 "type": "confidentiality"}],
+    "parties": [{"name": "Acme", "signatory": "A. Smith"}, {"name": "Beta"}],
+}
+
+
+def test_builtin_specs_compile():
+    assert builtin_specs() == ["employment-contract", "problematic-contract", "rental-agreement",
+                               "service-agreement", "simple-contract"]
+    for name in builtin_specs():
+        document = load_builtin(name)
+        assert document.id == name
+        assert document.blocks[0] == Block("title", document.title)
+
+
+def test_compile_spec():
+    document = compile_spec(SPEC, spec_id="nda")
+    assert [block.kind for block in document.blocks] == ["title", "paragraph", "space", "heading", "paragraph",
+                                                        "bullet", "space", "signature"]
+    assert document.blocks[3].text == "1. Secrecy"
+    assert document.meta["clauses"] == [{"heading": "Secrecy", "type": "confidentiality", "risk": None}]
+    lines = list(document.lines())
+    assert lines[:6] == ["NDA", "Between the parties.", "", "1. Secrecy", "Keep it secret.", "• No copies."]
+    assert lines[-1] == "Date: ___________" + " " * 20 + "Date: ___________"
+
+
+def test_compile_spec_requires_title_and_clauses():
+    with pytest.raises(ValueError, match="nda: 'title' must be a str"):
+        compile_spec(dict(SPEC, title=None), spec_id="nda")
+    with pytest.raises(ValueError, match="nda clause 1: 'heading' must be a str"):
+        compile_spec(dict(SPEC, clauses=[{"body": []}]), spec_id="nda")
+
+
+def test_table_and_bullet_lines():
+    assert Block("bullet", "Deep", level=2).lines() == ["        • Deep"]
+    table = Block("table", (("Item", "Amount"), ("Rent", "$1,200")))
+    assert table.lines() == ["Item   Amount", "Rent   $1,200"]
+    assert table.column_shares() == [0.4, 0.6]
+
+
+def test_load_document(tmp_path):
+    path = tmp_path / "nda.json"
+    path.write_text(json.dumps(SPEC))
+    assert load_document(str(path)) == compile_spec(SPEC, spec_id="nda")
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from contract_fixtures.loadtest import Fixture, post_fixture
+from contract_fixtures.render import render_bytes
+from contract_fixtures.spec import load_builtin
+from contract_fixtures.standin import start_standin
+
+aiohttp = pytest.importorskip("aiohttp")
+
+
+def post_all(fixtures, **options):
+    """POST each fixture to a fresh stand-in; returns their Samples"""
+    async def run():
+        runner, base_url = await start_standin(extract_ms_per_mb=0, analysis_ms=0, **options)
+        try:
+            async with aiohttp.ClientSession() as session:
+                return [await post_fixture(session, f"{base_url}/api/analyze-contract", fixture)
+                        for fixture in fixtures]
+        finally:
+            await runner.cleanup()
+    return asyncio.run(run())
+
+
+def test_accepts_supported_uploads():
+    text = render_bytes(load_builtin("simple-contract"), "txt")
+    samples = post_all([Fixture("contract.txt", text), Fixture("contract.docx", b"PK\x03\x04")])
+    assert [sample.status for sample in samples] == [200, 200]
+    assert samples[0].kind == "txt" and samples[0].error is None
+
+
+def test_rejects_what_the_route_rejects():
+    samples = post_all([Fixture("contract.png", b"\x89PNG"), Fixture("big.txt", b"x" * (10 * 1024 * 1024 + 1))])
+    assert [sample.status for sample in samples] == [400, 400]
+    assert "Invalid file type" in samples[0].error
+    assert "File too large" in samples[1].error
+
+
+def test_scanned_pdfs_need_ocr():
+    scan = Fixture("scan.pdf", b"%PDF-1.4\n1 0 obj\n<< /Type /Page >>\nendobj\n")
+    assert scan.kind == "pdf-scan"
+    assert post_all([scan])[0].status == 400
+    assert post_all([scan], ocr_ms_per_page=1)[0].status == 200
@@ -0,0 +1,14 @@
+from contract_fixtures.stats import percentile
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99.5) == 100
+    assert percentile(values, 0) == 1
+    assert percentile([0.2, 0.4, 0.9], 50) == 0.4
+
+
+def test_percentile_of_nothing():
+    assert percentile([], 95) == 0.0
@@ -0,0 +1,58 @@
+import io
+
+import pytest
+
+from contract_fixtures.spec import load_builtin
+from contract_fixtures.streaming import FlowableStream, extended_blocks, pad_document, render_reportlab_stream
+
+
+def test_flowable_stream_behaves_like_the_front_of_a_list():
+    stream = FlowableStream(iter(range(10)), lookahead=3)
+    assert len(stream) == 3
+    assert stream[0] == 0
+    assert stream[0:2] == [0, 1]
+    del stream[0]
+    stream[0:0] = ["a", "b"]
+    stream.insert(0, "c")
+    assert stream[0:4] == ["c", "a", "b", 1]
+    del stream[0:3]
+    drained = []
+    while not stream.exhausted:
+        drained.append(stream[0])
+        del stream[0]
+    assert drained == list(range(1, 10))
+
+
+def test_paused_stream_looks_empty():
+    stream = FlowableStream(iter(range(3)))
+    stream.paused = lambda: True
+    assert len(stream) == 0
+    assert not stream.exhausted
+
+
+def test_extended_blocks_repeat_clauses_renumbered():
+    document = load_builtin("simple-contract")
+    headings = sum(1 for block in document.blocks if block.kind == "heading")
+    blocks = list(extended_blocks(document, iter([True] * 200 + [False]).__next__))
+    numbers = [int(block.text.split(".", 1)[0]) for block in blocks if block.kind == "heading"]
+    assert numbers == list(range(1, len(numbers) + 1))
+    assert len(numbers) > headings
+
+
+def test_pad_document():
+    document = load_builtin("simple-contract")
+    headings = sum(1 for block in document.blocks if block.kind == "heading")
+    padded = pad_document(document, 5)
+    assert sum(1 for block in padded.blocks if block.kind == "heading") == headings + 5
+
+
+def test_render_in_chunks():
+    pytest.importorskip("reportlab")
+    pypdf = pytest.importorskip("pypdf")
+    output = io.BytesIO()
+    result = render_reportlab_stream(load_builtin("service-agreement"), output, pages=7, chunk_pages=3)
+    assert result.pages >= 7
+    assert result.bytes == len(output.getvalue())
+    reader = pypdf.PdfReader(io.BytesIO(output.getvalue()), strict=True)
+    assert len(reader.pages) == result.pages
+    assert reader.metadata.title == load_builtin("service-agreement").title
@@ -0,0 +1,41 @@
+import re
+
+import pytest
+
+from contract_fixtures.clauses import CONTRACT_TYPES
+from contract_fixtures.synth import RISK_LEVELS, generate_spec, synthesize
+from contract_fixtures.truth import expected_text
+
+
+def test_specs_are_reproducible():
+    assert generate_spec(11, 42) == generate_spec(11, 42)
+    assert generate_spec(11, 42) != generate_spec(11, 43)
+    assert generate_spec(11, 42) != generate_spec(12, 42)
+
+
+def test_spec_id_and_meta():
+    spec = generate_spec(11, 42, contract_type="lease", risk="high")
+    assert spec["id"] == "synthetic-lease-11-000042"
+    assert spec["meta"]["contract_type"] == "lease"
+    assert spec["meta"]["risk"] == "high"
+
+
+@pytest.mark.parametrize("contract_type", sorted(CONTRACT_TYPES))
+def test_templates_fill(contract_type):
+    text = expected_text(synthesize(0, 0, contract_type=contract_type))
+    assert "{" not in text and "}" not in text
+
+
+def test_low_risk_has_no_predatory_clauses():
+    for index in range(20):
+        assert all(clause["risk"] == "benign" for clause in generate_spec(1, index, risk="low")["clauses"])
+
+
+def test_counts_of_one_take_singular_units():
+    plural = re.compile(r"(?<![\d.])1 (?:hour|day|week|month|year)s\b")
+    ones = 0
+    for index in range(300):
+        text = expected_text(synthesize(2, index, risk=sorted(RISK_LEVELS)[index % 3]))
+        assert not plural.search(text)
+        ones += len(re.findall(r"(?<![\d.])1 (?:hour|day|week|month|year)\b", text))
+    assert ones
@@ -0,0 +1,58 @@
+import io
+import json
+import time
+
+from contract_fixtures.backends import get_backend
+from contract_fixtures.synth import synthesize
+from contract_fixtures.timing import (StageTimer, TIMINGS_REPORT, prometheus_summary, record_stages, stage,
+                                      timing_record, write_timings)
+
+
+def test_stages_are_exclusive():
+    timer = StageTimer()
+    with timer.stage("layout"):
+        time.sleep(0.02)
+        with timer.stage("output"):
+            time.sleep(0.05)
+    assert 0.02 <= timer.seconds["layout"] < 0.05
+    assert timer.seconds["output"] >= 0.05
+
+
+def test_stage_is_a_no_op_when_not_recording():
+    assert stage("layout") is stage("output")
+    with record_stages(enabled=False) as seconds:
+        assert seconds is None
+        assert stage("layout") is stage("output")
+
+
+def test_backend_render_records_import_and_render():
+    with record_stages() as seconds:
+        get_backend("txt").render(synthesize(0, 0), io.BytesIO())
+    assert {"import", "render"} <= set(seconds)
+
+
+def test_timing_record_keeps_stage_order():
+    record = timing_record("out/a.pdf", "reportlab", {"output": 0.25, "import": 0.5}, 1.0)
+    assert record == {"file": "a.pdf", "backend": "reportlab", "total_s": 1.0,
+                      "stages": {"import": 0.5, "output": 0.25}}
+    assert list(record["stages"]) == ["import", "output"]
+
+
+def test_prometheus_summary():
+    records = [timing_record(f"{index}.pdf", "fpdf", {"layout": index / 10}, index / 5) for index in range(1, 5)]
+    text = prometheus_summary(records)
+    assert "# TYPE contract_fixtures_document_seconds summary" in text
+    assert 'contract_fixtures_document_seconds{backend="fpdf",quantile="0.5"} 0.400000' in text
+    assert 'contract_fixtures_stage_seconds{backend="fpdf",stage="layout",quantile="0.99"} 0.400000' in text
+    assert 'contract_fixtures_stage_seconds_sum{backend="fpdf",stage="layout"} 1.000000' in text
+    assert 'contract_fixtures_document_seconds_count{backend="fpdf"} 4' in text
+
+
+def test_write_timings(tmp_path):
+    records = [timing_record("a.pdf", "fpdf", {"layout": 0.1}, 0.2)]
+    report, summary = write_timings(records, str(tmp_path))
+    assert report == str(tmp_path / TIMINGS_REPORT)
+    with open(report, encoding="utf-8") as f:
+        assert [json.loads(line) for line in f] == records
+    with open(summary, encoding="utf-8") as f:
+        assert f.read() == prometheus_summary(records)
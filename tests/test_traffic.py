@@ -0,0 +1,79 @@
+import itertools
+import random
+
+import pytest
+
+from contract_fixtures.traffic import bursts, parse_arrivals, poisson, ramp, replay
+
+
+def first(arrivals, count):
+    return list(itertools.islice(arrivals, count))
+
+
+@pytest.mark.parametrize("spec", [
+    "burst:0@10,1",     # used to pass, and then never yielded an arrival
+    "burst:5@0",
+    "burst:5",
+    "burst:5@",
+    "burst:x@10",
+    "burst:-5@10",
+    "burst:5@-10",
+    "burst:5@10,-1",
+    "poisson:0",
+    "poisson:-2",
+    "poisson:fast",
+    "ramp:5",
+    "ramp:5@x",
+    "burst:",
+    "bursty:5@10",
+    "",
+])
+def test_parse_arrivals_rejects(spec):
+    with pytest.raises(ValueError, match="Invalid arrival profile"):
+        parse_arrivals(spec)
+
+
+def test_bursts_arrive_together():
+    assert first(parse_arrivals("burst:3@10"), 7) == [0, 0, 0, 10, 10, 10, 20]
+
+
+def test_bursts_merge_with_background_in_order():
+    arrivals = first(bursts(2, 5.0, 4.0, random.Random(0)), 200)
+    assert arrivals == sorted(arrivals)
+    assert sum(1 for offset in arrivals if offset % 5 == 0) >= 2 * int(arrivals[-1] // 5)
+
+
+def test_poisson_rate():
+    arrivals = first(poisson(20.0, random.Random(1)), 4000)
+    assert arrivals == sorted(arrivals)
+    assert 18 < len(arrivals) / arrivals[-1] < 22
+
+
+def test_ramp_steps():
+    arrivals = list(ramp([(10.0, 2.0), (0, 3.0), (10.0, 1.0)], random.Random(2)))
+    assert arrivals == sorted(arrivals)
+    assert not any(2.0 <= offset < 5.0 for offset in arrivals)
+    assert arrivals[-1] < 6.0
+
+
+def test_parse_arrivals_is_seeded_and_sped_up():
+    assert first(parse_arrivals("poisson:5", seed=3), 20) == first(parse_arrivals("poisson:5", seed=3), 20)
+    assert first(parse_arrivals("poisson:5", seed=3), 20) != first(parse_arrivals("poisson:5", seed=4), 20)
+    assert first(parse_arrivals("burst:2@10", speed=2.0), 4) == [0, 0, 5, 5]
+
+
+def test_replay(tmp_path):
+    log = tmp_path / "uploads.log"
+    log.write_text("# recorded uploads\n1700000010.5,a.pdf\n2023-11-14T22:13:20Z\n\n1700000001\n")
+    assert replay(str(log)) == [0.0, 1.0, 10.5]
+    assert list(parse_arrivals(f"replay:{log}", speed=0.5)) == [0.0, 2.0, 21.0]
+
+
+def test_replay_rejects_bad_lines(tmp_path):
+    log = tmp_path / "uploads.log"
+    log.write_text("1700000000\nyesterday\n")
+    with pytest.raises(ValueError, match="uploads.log:2: 'yesterday' is not a timestamp"):
+        replay(str(log))
+    log.write_text("# nothing\n")
+    with pytest.raises(ValueError, match="no timestamps"):
+        replay(str(log))
@@ -0,0 +1,65 @@
+import json
+
+from contract_fixtures.spec import compile_spec
+from contract_fixtures.synth import synthesize
+from contract_fixtures.truth import (TRUTH_INDEX, VALUE_PATTERNS, expected_text, ground_truth, read_sidecar,
+                                     sidecar_path, write_index, write_sidecar)
+
+SPEC = {
+    "id": "pinned",
+    "title": "T",
+    "preamble": ["Dated January 5, 2024."],
+    "clauses": [
+        {"heading": "Fees", "type": "payment", "risk": "predatory", "body": ["Pay $1,500 within 30 days."]},
+        {"heading": "Law", "type": "governing_law", "risk": "benign", "body": ["Delaware law, 1.5% interest."]},
+    ],
+}
+
+
+def test_offsets_are_pinned():
+    truth = ground_truth(compile_spec(SPEC))
+    assert truth["chars"] == 99
+    assert [(clause["heading"], clause["start"], clause["end"]) for clause in truth["clauses"]] == [
+        ("1. Fees", 26, 60), ("2. Law", 62, 97)]
+    assert [(value["kind"], value["text"], value["start"], value["end"], value["clause"])
+            for value in truth["values"]] == [
+        ("date", "January 5, 2024", 8, 23, None),
+        ("money", "$1,500", 38, 44, 1),
+        ("duration", "30 days", 52, 59, 1),
+        ("percent", "1.5%", 83, 87, 2),
+    ]
+    assert truth["risk_flags"] == ["payment"]
+
+
+def test_offsets_index_the_expected_text():
+    for index in range(20):
+        document = synthesize(3, index)
+        text = expected_text(document)
+        truth = ground_truth(document)
+        assert truth["chars"] == len(text)
+        for value in truth["values"]:
+            assert text[value["start"]:value["end"]] == value["text"]
+            assert VALUE_PATTERNS[value["kind"]].fullmatch(value["text"])
+        for clause in truth["clauses"]:
+            assert text[clause["start"]:].startswith(clause["heading"])
+            assert text[clause["end"]] == "\n"
+
+
+def test_fields_are_values_in_the_text():
+    document = synthesize(3, 0)
+    text = expected_text(document)
+    fields = ground_truth(document)["fields"]
+    assert fields and all(value in text for value in fields.values())
+
+
+def test_sidecar_and_index_round_trip(tmp_path):
+    filename = str(tmp_path / "pinned.pdf")
+    record = write_sidecar(compile_spec(SPEC), filename)
+    assert sidecar_path(filename) == str(tmp_path / "pinned.truth.json")
+    assert read_sidecar(filename) == record
+    assert record["file"] == "pinned.pdf"
+
+    path = write_index([record, record], str(tmp_path))
+    assert path == str(tmp_path / TRUTH_INDEX)
+    with open(path, encoding="utf-8") as f:
+        assert [json.loads(line) for line in f] == [record, record]
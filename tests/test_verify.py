@@ -0,0 +1,57 @@
+import pytest
+
+from contract_fixtures.render import render
+from contract_fixtures.spec import builtin_spec_path, load_builtin
+from contract_fixtures.synth import synthesize
+from contract_fixtures.verify import Check, collect_checks, report_record, resolve_source, spec_names, verify, word_diff
+
+
+def test_word_diff():
+    assert word_diff(["a", "b"], ["a", "b"]) == (0, [])
+    changed, diffs = word_diff("pay • within 30 days".split(), "pay - within 30 day".split())
+    assert changed == 2
+    assert diffs == [{"word": 1, "expected": "•", "extracted": "-"},
+                     {"word": 4, "expected": "days", "extracted": "day"}]
+    assert len(word_diff(list("abcdefgh"), list("ABCDEFGH"), limit=1)[1]) == 1
+
+
+def test_resolve_source():
+    specs = spec_names()
+    assert resolve_source("out/service-agreement-000042.pdf", specs) == builtin_spec_path("service-agreement")
+    assert resolve_source("test-service-agreement.pdf", specs) == builtin_spec_path("service-agreement")
+    assert resolve_source("synthetic-000042.pdf", specs, synthetic=(7, "high")) == (7, 42, "high")
+    assert resolve_source("synthetic-000042.pdf", specs) is None
+    assert resolve_source("contract-9.9MB.pdf", specs) is None
+
+
+@pytest.mark.parametrize("backend", ["reportlab", "fpdf"])
+def test_embedded_fonts_round_trip(tmp_path, backend):
+    pytest.importorskip("pypdf")
+    pytest.importorskip(backend)
+    render(load_builtin("service-agreement"), str(tmp_path / "service-agreement-000000.pdf"), backend, "realistic")
+    render(synthesize(7, 3, risk="high"), str(tmp_path / "synthetic-000003.pdf"), backend, "realistic")
+    (tmp_path / "sized-9.9MB.pdf").write_bytes(b"%PDF-1.4\n")
+
+    checks, skipped = collect_checks([str(tmp_path)], synthetic=(7, "high"))
+    assert skipped == [str(tmp_path / "sized-9.9MB.pdf")]
+    assert len(checks) == 2
+    for check in checks:
+        record = report_record(verify(check))
+        assert record["ok"], record
+
+
+@pytest.mark.parametrize("backend", ["reportlab", "fpdf"])
+def test_standard_fonts_lose_only_bullets(tmp_path, backend):
+    pytest.importorskip("pypdf")
+    pytest.importorskip(backend)
+    filename = str(tmp_path / "service-agreement-000000.pdf")
+    render(load_builtin("service-agreement"), filename, backend)
+    result = verify(Check(filename, builtin_spec_path("service-agreement")))
+    assert result.changed
+    assert {diff["expected"] for diff in result.diffs} == {"•"}
+
+
+def test_verify_reports_errors(tmp_path):
+    result = verify(Check(str(tmp_path / "missing.pdf"), builtin_spec_path("simple-contract")))
+    assert result.error
+    assert not report_record(result)["ok"]
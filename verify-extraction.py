@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Check that generated PDFs extract back to the text of the specs they were rendered from
+"""
+
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import json
+import os
+import sys
+import time
+
+from contract_fixtures.stats import percentile
+from contract_fixtures.synth import RISK_LEVELS
+from contract_fixtures.verify import EXTRACTOR, VERIFY_REPORT, collect_checks, report_record, verify
+
+def run_verification(checks, workers, report):
+    """Extract and diff every check across a process pool, streaming results to the NDJSON report"""
+    total = len(checks)
+    timings = []
+    mismatched, differences = [], Counter()
+    failures = defaultdict(list)
+    start = time.perf_counter()
+    chunksize = max(1, total // (workers * 16))
+    with open(report, "w", encoding="utf-8") as out, ProcessPoolExecutor(max_workers=workers) as pool:
+        for done, result in enumerate(pool.map(verify, checks, chunksize=chunksize), 1):
+            out.write(json.dumps(report_record(result), ensure_ascii=False))
+            out.write("\n")
+            if result.error:
+                failures[result.pid].append((result.filename, result.error))
+                print(f"[{done}/{total}] ❌ {result.filename}: {result.error}")
+                continue
+            timings.append((result.seconds, result.filename))
+            if result.changed:
+                mismatched.append(result)
+                differences.update({(diff["expected"], diff["extracted"]) for diff in result.diffs})
+                print(f"[{done}/{total}] ⚠️ {result.filename}: {result.changed}/{result.words} words differ "
+                      f"({result.seconds * 1000:.0f} ms)")
+            else:
+                print(f"[{done}/{total}] ✓ {result.filename} ({result.seconds * 1000:.0f} ms)")
+
+    elapsed = time.perf_counter() - start
+    failed = sum(len(errors) for errors in failures.values())
+    print(f"\nVerified {total - failed}/{total} PDFs with {EXTRACTOR} in {elapsed:.1f}s "
+          f"({total / elapsed if elapsed else 0:.1f} docs/s, {workers} workers)")
+    if timings:
+        timings.sort()
+        seconds = [timing for timing, _ in timings]
+        print(f"Extraction: p50 {percentile(seconds, 50) * 1000:.1f} ms, p95 {percentile(seconds, 95) * 1000:.1f} ms, "
+              f"max {seconds[-1] * 1000:.1f} ms ({timings[-1][1]})")
+    print(f"✓ {len(timings) - len(mismatched)} match their spec text")
+    if mismatched:
+        print(f"❌ {len(mismatched)} differ from their spec text. Most common differences (expected -> extracted):")
+        for (expected, extracted), count in differences.most_common(10):
+            print(f"- {expected!r} -> {extracted!r}: {count} documents")
+    if failures:
+        print("\nFailures by worker:")
+        for pid, errors in sorted(failures.items()):
+            print(f"- worker {pid}: {len(errors)} failed")
+            for filename, error in errors[:5]:
+                print(f"    {filename}: {error}")
+            if len(errors) > 5:
+                print(f"    ... and {len(errors) - 5} more")
+    print(f"\n✓ Wrote {report}")
+    return len(mismatched) + failed
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Verify that generated PDFs extract back to their spec text")
+    parser.add_argument("paths", nargs="*", default=["."], metavar="PATH",
+                        help="PDF file or directory of PDFs to verify (default: the current directory)")
+    parser.add_argument("--spec", action="append", dest="specs", default=[], metavar="FILE",
+                        help="JSON/YAML spec the batch was generated from, besides the built-in ones (repeatable)")
+    parser.add_argument("--synthetic", action="store_true",
+                        help="verify synthetic-NNNNNN.pdf documents (needs the batch's --seed and --risk)")
+    parser.add_argument("--seed", type=int, default=0, help="synthetic mode: corpus seed (default: 0)")
+    parser.add_argument("--risk", choices=sorted(RISK_LEVELS), help="synthetic mode: risk level the batch used")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--report", default=VERIFY_REPORT,
+                        help=f"per-document NDJSON report to write (default: {VERIFY_REPORT})")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
+if __name__ == "__main__":
+    args = parse_args()
+    synthetic = (args.seed, args.risk) if args.synthetic else None
+    checks, skipped = collect_checks(args.paths, args.specs, synthetic)
+    if skipped:
+        print(f"⚠️ Skipping {len(skipped)} PDFs whose names don't match a spec (e.g. {skipped[0]})")
+    if not checks:
+        print("❌ No generated PDFs found")
+        sys.exit(1)
+
+    print(f"Verifying {len(checks)} PDFs...")
+    try:
+        problems = run_verification(checks, args.workers, args.report)
+    except ImportError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    sys.exit(1 if problems else 0)